@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Dict
 
 
 class Settings(BaseSettings):
@@ -16,12 +16,127 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./maintainers_dashboard.db"
 
+    # Async engine pool (aiosqlite by default, asyncpg for PostgreSQL)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Opt-in SQLite performance profile (WAL, pragmas, single-writer queue)
+    SQLITE_PERFORMANCE_PROFILE: bool = False
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64000  # negative: KiB, i.e. ~64 MB
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    DB_WRITER_MAX_BATCH: int = 200
+    DB_WRITER_MAX_DELAY_MS: int = 5
+
     # GitHub API (for future integration)
     GITHUB_TOKEN: str = ""
+    GITHUB_API_URL: str = "https://api.github.com"  # point at benchmarks/fake_github.py for load tests
+
+    # Record GitHub traffic to a JSON Lines file, or replay one offline
+    GITHUB_RECORD_PATH: str = ""
+    GITHUB_REPLAY_PATH: str = ""
+
+    # GitHub HTTP connection pool (shared client owned by the app lifespan)
+    GITHUB_HTTP2: bool = True
+    GITHUB_MAX_CONNECTIONS: int = 100
+    GITHUB_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GITHUB_KEEPALIVE_EXPIRY: float = 30.0
+    GITHUB_CONNECT_TIMEOUT: float = 5.0
+    GITHUB_READ_TIMEOUT: float = 30.0
+    GITHUB_WRITE_TIMEOUT: float = 10.0
+    GITHUB_POOL_TIMEOUT: float = 10.0
+
+    # GitHub conditional requests (ETag / Last-Modified response store)
+    GITHUB_CONDITIONAL_CACHE: bool = True
+    GITHUB_CONDITIONAL_CACHE_TTL: int = 86400
+
+    # GitHub request scheduling (concurrency cap, pacing, retries)
+    GITHUB_MAX_CONCURRENCY: int = 10
+    GITHUB_REQUESTS_PER_SECOND: float = 10.0
+    GITHUB_BURST: int = 20
+    GITHUB_MAX_RETRIES: int = 4
+    GITHUB_BACKOFF_BASE: float = 0.5
+    GITHUB_BACKOFF_MAX: float = 30.0
+    GITHUB_RATE_LIMIT_DEADLINE: float = 30.0
 
     # Redis (for caching, if needed)
     REDIS_URL: str = "redis://localhost:6379"
 
+    # Cache backend: "memory" (per process) or "redis" (shared by workers)
+    CACHE_BACKEND: str = "memory"
+    CACHE_KEY_PREFIX: str = "mdash:"
+    CACHE_COMPRESS_MIN_BYTES: int = 1024
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # In-memory cache bounds
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # In-process L1 in front of a shared backend (0 entries disables it)
+    CACHE_L1_MAX_ENTRIES: int = 1024
+    CACHE_L1_MAX_BYTES: int = 32 * 1024 * 1024
+    CACHE_L1_TTL: int = 5
+
+    # get_or_set: stale-while-revalidate window and stampede protection
+    CACHE_STALE_TTL: int = 300
+    CACHE_REFRESH_LOCK_TTL: int = 30
+    CACHE_EARLY_REFRESH_BETA: float = 1.0
+
+    # Analysis result caching (seconds, per module)
+    ANALYSIS_CACHE_DEFAULT_TTL: int = 3600
+    ANALYSIS_CACHE_TTLS: Dict[str, int] = {
+        "invisible_labor_scoring": 6 * 3600,
+        "sentiment_analysis": 3600,
+        "burnout_risk_detection": 6 * 3600,
+    }
+
+    # Shareable profiles
+    PROFILE_CACHE_TTL: int = 300
+
+    # Sentiment backend: "lexicon" (built in) or "transformer" (needs transformers + torch);
+    # the model loads in the background while the lexicon serves requests
+    SENTIMENT_BACKEND: str = "lexicon"
+    SENTIMENT_MODEL: str = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+    SENTIMENT_MODEL_MAX_BATCH_SIZE: int = 32
+    SENTIMENT_MODEL_MAX_WAIT_MS: int = 10
+    SENTIMENT_MODEL_MAX_QUEUE: int = 2048  # texts waiting; beyond this the lexicon serves
+
+    # Sentiment batch analysis
+    SENTIMENT_BATCH_MAX_CONCURRENCY: int = 8  # repositories analyzed at once
+    SENTIMENT_BATCH_MAX_REPOSITORIES: int = 500
+
+    # Sentiment trends
+    SENTIMENT_TRENDS_MAX_DAYS: int = 730
+    SENTIMENT_TRENDS_MAX_POINTS: int = 5000  # longer series are downsampled
+    SENTIMENT_TRENDS_INLINE_EVENTS: int = 5000  # new events scored per request; the rest in the background
+
+    # Burnout batch assessment
+    BURNOUT_BATCH_MAX_USERS: int = 500  # users listed or discovered per request
+    BURNOUT_MAX_DAYS: int = 730  # longest assessment window
+
+    # Burnout history (one risk point per user and day)
+    BURNOUT_HISTORY_WINDOW_DAYS: int = 30  # trailing window of each point
+    BURNOUT_HISTORY_RETENTION_DAYS: int = 730
+    BURNOUT_HISTORY_SNAPSHOT_ENABLED: bool = True  # record every active author's point once a day
+
+    # Process pool for CPU-bound work, off by default; every app process starts its own
+    # (0: cores / WEB_CONCURRENCY workers / twice the workers pending)
+    EXECUTOR_ENABLED: bool = False
+    EXECUTOR_WORKERS: int = 0
+    WEB_CONCURRENCY: int = 1  # uvicorn / gunicorn worker processes sharing the cores
+    EXECUTOR_MAX_PENDING: int = 0
+    EXECUTOR_CHUNK_SIZE: int = 5000
+
+    # Incremental GitHub sync of tracked repositories
+    SYNC_ENABLED: bool = False
+    SYNC_INTERVAL_SECONDS: int = 900
+    SYNC_MAX_CONCURRENCY: int = 4
+    SYNC_OVERLAP_SECONDS: int = 300  # re-read this much before the cursor (clock skew, late writes)
+    SYNC_INITIAL_LOOKBACK_DAYS: int = 90  # first sync window; 0 for full history
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,349 @@
+"""
+Vectorized activity-pattern features for burnout risk scoring.
+
+Every feature is computed in bulk from NumPy arrays of event timestamps
+(epoch seconds, UTC) tagged with a user index, so a year of activity with
+100k events takes milliseconds, and a whole organization's maintainers
+are featurized in the same pass as one: hour-of-week histograms for
+off-hours work, gap and run-length analysis for breaks, a users x days
+count matrix for workload, and percentiles of first-response latency.
+
+feature_matrix() and extract_features() take and return plain arrays /
+dicts so they can run in a worker process (see app.shared.executor).
+"""
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from app.shared.event_store import EventType
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Event types as small integers in the `kinds` array
+EVENT_CODES: Dict[str, int] = {event_type.value: code for code, event_type in enumerate(EventType)}
+COMMIT_CODE = EVENT_CODES[EventType.COMMIT.value]
+
+# Local hours counted as late night (22:00 - 05:59)
+LATE_NIGHT_HOURS = np.array([22, 23, 0, 1, 2, 3, 4, 5])
+
+# Responses faster than this count as immediate
+FAST_RESPONSE_SECONDS = HOUR
+
+# Compound sentiment at or below which a text is negative / hostile
+NEGATIVE_SENTIMENT = -0.05
+CONFLICT_SENTIMENT = -0.5
+
+# Share of the window compared against the whole for activity changes
+RECENT_FRACTION = 0.25
+
+# Fewer events than this are not enough to estimate a time zone
+MIN_EVENTS_FOR_OFFSET = 50
+
+# Columns of feature_matrix(), in order
+FEATURE_NAMES: Tuple[str, ...] = (
+    "events",
+    "commits",
+    "window_days",
+    "utc_offset",
+    "late_night_ratio",
+    "weekend_ratio",
+    "late_night_commit_ratio",
+    "weekend_commit_ratio",
+    "peak_hour",
+    "active_days",
+    "active_day_ratio",
+    "longest_break_days",
+    "days_since_last_event",
+    "longest_streak_days",
+    "events_per_week",
+    "events_per_active_day",
+    "peak_week_events",
+    "workload_trend",
+    "recent_activity_ratio",
+    "responses",
+    "response_p50_hours",
+    "response_p90_hours",
+    "fast_response_ratio",
+    "texts",
+    "sentiment_mean",
+    "negative_ratio",
+    "conflict_ratio",
+    "conflict_trend",
+)
+
+
+def _ratios(part: np.ndarray, whole: np.ndarray) -> np.ndarray:
+    """Element-wise part / whole, 0 where whole is 0."""
+    part = np.asarray(part, dtype=np.float64)
+    whole = np.broadcast_to(np.asarray(whole, dtype=np.float64), part.shape)
+    return np.divide(part, whole, out=np.zeros_like(part), where=whole != 0)
+
+
+def _check_lengths(names: str, *arrays: np.ndarray) -> None:
+    """Raise ValueError unless parallel arrays have the same length."""
+    lengths = [len(array) for array in arrays]
+    if len(set(lengths)) > 1:
+        raise ValueError(f"{names} must have the same length, got {lengths}")
+
+
+def _by_user(users: np.ndarray, user_count: int, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    return np.bincount(users, weights=weights, minlength=user_count)
+
+
+def estimate_utc_offsets(
+    users: np.ndarray, timestamps: np.ndarray, user_count: int, default: int = 0
+) -> np.ndarray:
+    """
+    Guess each user's UTC offset in hours from when they are active.
+
+    GitHub reports UTC; the quietest 6-hour block of a user's day is
+    assumed to be 01:00 - 07:00 local time. Opt-in only: a habitual night
+    worker is shifted until their nights look like evenings, hiding the
+    off-hours signal. Users with too few events keep `default`.
+    """
+    counts = np.bincount(users * 24 + (timestamps // HOUR) % 24, minlength=user_count * 24).reshape(user_count, 24)
+    blocks = sum(np.roll(counts, -shift, axis=1) for shift in range(6))
+    quietest = blocks.argmin(axis=1)
+    offsets = (1 - quietest + 12) % 24 - 12
+    return np.where(counts.sum(axis=1) >= MIN_EVENTS_FOR_OFFSET, offsets, default)
+
+
+def _off_hours(users: np.ndarray, local: np.ndarray, user_count: int) -> Tuple[np.ndarray, ...]:
+    """Late-night and weekend shares and peak hour per user (hour-of-week histograms)."""
+    days = local // DAY
+    # 1970-01-01 was a Thursday; Monday is weekday 0
+    hour_of_week = ((days + 3) % 7) * 24 + (local // HOUR) % 24
+    histogram = np.bincount(users * 168 + hour_of_week, minlength=user_count * 168).reshape(user_count, 7, 24)
+    total = histogram.sum(axis=(1, 2))
+    return (
+        _ratios(histogram[:, :, LATE_NIGHT_HOURS].sum(axis=(1, 2)), total),
+        _ratios(histogram[:, 5:].sum(axis=(1, 2)), total),
+        histogram.sum(axis=1).argmax(axis=1),
+    )
+
+
+def _percentiles(users: np.ndarray, values: np.ndarray, user_count: int, quantiles: Sequence[float]) -> np.ndarray:
+    """Per-user percentiles (linear interpolation, like np.percentile); 0 for users without values."""
+    order = np.lexsort((values, users))
+    values = values[order]
+    counts = _by_user(users, user_count).astype(np.int64)
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    result = np.zeros((user_count, len(quantiles)))
+    for column, quantile in enumerate(quantiles):
+        position = quantile * (counts[present] - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        low = values[starts[present] + lower]
+        high = values[starts[present] + upper]
+        result[present, column] = low + (high - low) * (position - lower)
+    return result
+
+
+def feature_matrix(
+    users: np.ndarray,
+    timestamps: np.ndarray,
+    kinds: np.ndarray,
+    user_count: int,
+    window_start: int,
+    window_end: int,
+    latency_users: Optional[np.ndarray] = None,
+    response_latencies: Optional[np.ndarray] = None,
+    sentiment_users: Optional[np.ndarray] = None,
+    sentiment_scores: Optional[np.ndarray] = None,
+    sentiment_timestamps: Optional[np.ndarray] = None,
+    utc_offset: int = 0,
+    estimate_offsets: bool = False,
+) -> np.ndarray:
+    """
+    Compute burnout features for many users at once.
+
+    Args:
+        users: Index (0 .. user_count - 1) of the user of each event
+        timestamps: Event times, epoch seconds (int64)
+        kinds: EVENT_CODES of each event
+        user_count: Number of users (rows of the result)
+        window_start: Window start, epoch seconds
+        window_end: Window end, epoch seconds
+        latency_users: User index of each response latency
+        response_latencies: Seconds from an item being opened by someone
+            else to the user's first comment or review on it
+        sentiment_users: User index of each scored text
+        sentiment_scores: Compound scores of the users' texts
+        sentiment_timestamps: When each scored text was written
+        utc_offset: UTC offset in hours of every user
+        estimate_offsets: Estimate each user's offset from their activity
+            instead (see estimate_utc_offsets); `utc_offset` is kept for
+            users with too few events
+
+    Returns:
+        Matrix of shape (user_count, len(FEATURE_NAMES))
+
+    Raises:
+        ValueError: If the per-event, per-latency or per-text arrays differ in length
+    """
+    users = np.asarray(users, dtype=np.int64)
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    kinds = np.asarray(kinds)
+    _check_lengths("users, timestamps and kinds", users, timestamps, kinds)
+    if len(users) > 1:
+        # Events must be grouped by user and in time order within a user
+        user_steps = np.diff(users)
+        if (user_steps < 0).any() or ((user_steps == 0) & (np.diff(timestamps) < 0)).any():
+            order = np.lexsort((timestamps, users))
+            users, timestamps, kinds = users[order], timestamps[order], kinds[order]
+    window_days = max(1, -(-(window_end - window_start) // DAY))
+    counts = _by_user(users, user_count)
+    commit = kinds == COMMIT_CODE
+    features: Dict[str, np.ndarray] = {
+        "events": counts,
+        "commits": _by_user(users[commit], user_count),
+        "window_days": np.full(user_count, window_days),
+    }
+
+    if estimate_offsets:
+        offsets = estimate_utc_offsets(users, timestamps, user_count, utc_offset)
+    else:
+        offsets = np.full(user_count, utc_offset, dtype=np.int64)
+    features["utc_offset"] = offsets
+
+    # Off-hours work, for all activity and for commits alone
+    local = timestamps + offsets[users] * HOUR
+    late_night, weekend, peak_hour = _off_hours(users, local, user_count)
+    late_night_commits, weekend_commits, _ = _off_hours(users[commit], local[commit], user_count)
+    features.update(
+        late_night_ratio=late_night,
+        weekend_ratio=weekend,
+        late_night_commit_ratio=late_night_commits,
+        weekend_commit_ratio=weekend_commits,
+        peak_hour=peak_hour,
+    )
+
+    # Daily counts over the window (local days), one row per user
+    first_day = (window_start + offsets * HOUR) // DAY
+    day_index = np.clip(local // DAY - first_day[users], 0, window_days - 1)
+    daily = np.bincount(users * window_days + day_index, minlength=user_count * window_days).reshape(
+        user_count, window_days
+    )
+    active = daily > 0
+    active_days = active.sum(axis=1)
+    features["active_days"] = active_days
+    features["active_day_ratio"] = active_days / window_days
+
+    # Breaks: longest gap between events, time since the last one, and the
+    # longest run of consecutive active days
+    present = counts > 0
+    same_user = users[1:] == users[:-1]
+    longest_gap = np.zeros(user_count, dtype=np.int64)  # same dtype as the gaps keeps ufunc.at fast
+    np.maximum.at(longest_gap, users[1:][same_user], np.diff(timestamps)[same_user])
+    last = timestamps[(np.cumsum(counts) - 1)[present]]
+    features["longest_break_days"] = np.where(present, longest_gap / DAY, window_days)
+    days_since_last = np.full(user_count, float(window_days))
+    days_since_last[present] = np.maximum(0.0, (window_end - last) / DAY)
+    features["days_since_last_event"] = days_since_last
+    edges = np.diff(np.pad(active.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    run_users, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    longest_streak = np.zeros(user_count, dtype=np.int64)
+    np.maximum.at(longest_streak, run_users, run_ends - run_starts)
+    features["longest_streak_days"] = longest_streak
+
+    # Workload: weekly volume, rolling 7-day peak, trend and recent change
+    mean_daily = counts / window_days
+    features["events_per_week"] = mean_daily * 7
+    features["events_per_active_day"] = _ratios(counts, active_days)
+    if window_days >= 7:
+        cumulative = np.pad(np.cumsum(daily, axis=1), ((0, 0), (1, 0)))
+        features["peak_week_events"] = (cumulative[:, 7:] - cumulative[:, :-7]).max(axis=1)
+        # Least-squares slope of daily counts, as a change over the window relative to the mean
+        days = np.arange(window_days, dtype=np.float64)
+        centered = days - days.mean()
+        slopes = (daily - mean_daily[:, None]) @ centered / (centered @ centered)
+        features["workload_trend"] = _ratios(slopes * window_days, mean_daily)
+    else:
+        features["peak_week_events"] = counts
+        features["workload_trend"] = np.zeros(user_count)
+    recent_days = max(1, int(window_days * RECENT_FRACTION))
+    features["recent_activity_ratio"] = _ratios(daily[:, -recent_days:].mean(axis=1), mean_daily)
+
+    # Response pressure
+    latencies = np.asarray(response_latencies if response_latencies is not None else [], dtype=np.float64)
+    latency_users = np.asarray(latency_users if latency_users is not None else [], dtype=np.int64)
+    _check_lengths("latency_users and response_latencies", latency_users, latencies)
+    answered = latencies >= 0
+    latencies, latency_users = latencies[answered], latency_users[answered]
+    responses = _by_user(latency_users, user_count)
+    percentiles = _percentiles(latency_users, latencies, user_count, (0.5, 0.9)) / HOUR
+    features.update(
+        responses=responses,
+        response_p50_hours=percentiles[:, 0],
+        response_p90_hours=percentiles[:, 1],
+        fast_response_ratio=_ratios(
+            _by_user(latency_users[latencies <= FAST_RESPONSE_SECONDS], user_count), responses
+        ),
+    )
+
+    # Tone of the users' own texts, and whether hostility is increasing
+    scores = np.asarray(sentiment_scores if sentiment_scores is not None else [], dtype=np.float64)
+    sentiment_users = np.asarray(sentiment_users if sentiment_users is not None else [], dtype=np.int64)
+    written = np.asarray(sentiment_timestamps if sentiment_timestamps is not None else [], dtype=np.int64)
+    _check_lengths("sentiment_users, sentiment_scores and sentiment_timestamps", sentiment_users, scores, written)
+    texts = _by_user(sentiment_users, user_count)
+    conflict = scores <= CONFLICT_SENTIMENT
+    later = written >= window_start + (window_end - window_start) // 2
+    later_texts = _by_user(sentiment_users[later], user_count)
+    earlier_texts = texts - later_texts
+    later_conflict = _ratios(_by_user(sentiment_users[later & conflict], user_count), later_texts)
+    earlier_conflict = _ratios(_by_user(sentiment_users[~later & conflict], user_count), earlier_texts)
+    features.update(
+        texts=texts,
+        sentiment_mean=_ratios(_by_user(sentiment_users, user_count, scores), texts),
+        negative_ratio=_ratios(_by_user(sentiment_users[scores <= NEGATIVE_SENTIMENT], user_count), texts),
+        conflict_ratio=_ratios(_by_user(sentiment_users[conflict], user_count), texts),
+        conflict_trend=np.where(
+            (later_texts > 0) & (earlier_texts > 0), later_conflict - earlier_conflict, 0.0
+        ),
+    )
+
+    return np.column_stack([np.asarray(features[name], dtype=np.float64) for name in FEATURE_NAMES])
+
+
+def extract_features(
+    timestamps: np.ndarray,
+    kinds: np.ndarray,
+    window_start: int,
+    window_end: int,
+    response_latencies: Optional[np.ndarray] = None,
+    sentiment_scores: Optional[np.ndarray] = None,
+    sentiment_timestamps: Optional[np.ndarray] = None,
+    utc_offset: int = 0,
+    estimate_offsets: bool = False,
+) -> Dict[str, float]:
+    """
+    Compute burnout features for one user (a one-row feature_matrix()).
+
+    Returns:
+        Flat dict of features (counts, ratios, days, hours)
+    """
+    latencies = response_latencies if response_latencies is not None else []
+    scores = sentiment_scores if sentiment_scores is not None else []
+    matrix = feature_matrix(
+        np.zeros(len(timestamps), dtype=np.int64),
+        timestamps,
+        kinds,
+        1,
+        window_start,
+        window_end,
+        np.zeros(len(latencies), dtype=np.int64),
+        latencies,
+        np.zeros(len(scores), dtype=np.int64),
+        scores,
+        sentiment_timestamps,
+        utc_offset,
+        estimate_offsets,
+    )
+    return dict(zip(FEATURE_NAMES, matrix[0].tolist()))
+
+
+def event_codes(event_types: Sequence[str]) -> np.ndarray:
+    """Map event type strings to EVENT_CODES (unknown types become -1)."""
+    return np.fromiter((EVENT_CODES.get(event_type, -1) for event_type in event_types), dtype=np.int8)
@@ -0,0 +1,135 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from sqlalchemy import delete, select
+from app.core.config import settings
+from app.shared.database import AsyncSessionLocal, dialect_insert, get_async_engine
+from app.shared.db_writer import db_writer
+from .models import BurnoutHistoryPoint
+
+# Bucket resolutions of history series
+RESOLUTIONS = ("day", "week", "month")
+
+# Longest window (days) served at each resolution by resolution="auto"
+AUTO_RESOLUTION_MAX_DAYS: Dict[str, int] = {"day": 90, "week": 365}
+
+
+def auto_resolution(days: int) -> str:
+    """Coarsest resolution needed to keep a window of `days` readable."""
+    for resolution, max_days in AUTO_RESOLUTION_MAX_DAYS.items():
+        if days <= max_days:
+            return resolution
+    return "month"
+
+
+def bucket_of(day: date, resolution: str) -> date:
+    """Start of the day / week (Monday) / month containing a day."""
+    if resolution == "week":
+        return day - timedelta(days=day.weekday())
+    if resolution == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start: date, resolution: str) -> date:
+    """Start of the bucket after the one starting at `start`."""
+    if resolution == "week":
+        return start + timedelta(days=7)
+    if resolution == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def downsample(
+    points: Sequence[Tuple[date, float, str]], resolution: str
+) -> List[Tuple[date, float, float, int]]:
+    """Merge daily points (oldest first) into buckets: [(bucket start, mean, max, days)]."""
+    buckets = []
+    for start, group in groupby(points, key=lambda point: bucket_of(point[0], resolution)):
+        scores = [score for _, score, _ in group]
+        buckets.append((start, sum(scores) / len(scores), max(scores), len(scores)))
+    return buckets
+
+
+def _upsert_statement():
+    """Build a dialect-specific upsert keeping the latest point of a day (run with executemany)."""
+    statement = dialect_insert(BurnoutHistoryPoint)
+    if get_async_engine().dialect.name == "mysql":
+        return statement.on_duplicate_key_update(
+            risk_score=statement.inserted.risk_score,
+            risk_level=statement.inserted.risk_level,
+            updated_at=datetime.utcnow(),
+        )
+    return statement.on_conflict_do_update(
+        index_elements=["username", "day"],
+        set_={
+            "risk_score": statement.excluded.risk_score,
+            "risk_level": statement.excluded.risk_level,
+            "updated_at": datetime.utcnow(),
+        },
+    )
+
+
+class BurnoutHistoryStore:
+    """
+    Daily burnout risk points per user.
+
+    record() upserts one point per (username, day) and, once a day,
+    deletes points older than the retention period; read() returns a
+    user's points of a date range through the (username, day) index.
+
+    Usage:
+    await history_store.record([("octocat", date.today(), 42.0, "moderate")])
+    points = await history_store.read("octocat", since, until)
+    """
+
+    def __init__(self, retention_days: int = settings.BURNOUT_HISTORY_RETENTION_DAYS):
+        self.retention_days = retention_days
+        self._purged_on: Optional[date] = None
+
+    async def record(self, points: Sequence[Tuple[str, date, float, str]]) -> None:
+        """Store (username, day, risk score, risk level) points, replacing earlier ones of the same day."""
+        rows = [
+            {"username": username, "day": day, "risk_score": score, "risk_level": level}
+            for username, day, score, level in points
+        ]
+
+        async def write(db):
+            await db.execute(_upsert_statement(), rows)
+
+        if rows:
+            await db_writer.submit(write)
+        if self._purged_on != datetime.utcnow().date():
+            await self.purge_expired()
+
+    async def purge_expired(self) -> int:
+        """Delete points older than the retention period."""
+        today = datetime.utcnow().date()
+        cutoff = today - timedelta(days=self.retention_days)
+
+        async def purge(db):
+            result = await db.execute(delete(BurnoutHistoryPoint).where(BurnoutHistoryPoint.day < cutoff))
+            return result.rowcount
+
+        removed = await db_writer.submit(purge)
+        self._purged_on = today
+        return removed
+
+    async def read(self, username: str, since: date, until: date) -> List[Tuple[date, float, str]]:
+        """A user's points from `since` to `until` (inclusive): [(day, risk score, risk level)], oldest first."""
+        statement = (
+            select(BurnoutHistoryPoint.day, BurnoutHistoryPoint.risk_score, BurnoutHistoryPoint.risk_level)
+            .where(
+                BurnoutHistoryPoint.username == username,
+                BurnoutHistoryPoint.day >= since,
+                BurnoutHistoryPoint.day <= until,
+            )
+            .order_by(BurnoutHistoryPoint.day)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(statement)
+            return [tuple(row) for row in result.all()]
+
+
+# Singleton instance
+history_store = BurnoutHistoryStore()
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, UniqueConstraint
+from datetime import datetime
+from app.shared.database import Base
+
+
+class BurnoutHistoryPoint(Base):
+    """
+    A user's burnout risk on one day.
+
+    One row per (username, day), holding the latest assessment of the
+    trailing BURNOUT_HISTORY_WINDOW_DAYS window made that day, so history
+    queries read stored points instead of re-assessing past days. Rows
+    older than BURNOUT_HISTORY_RETENTION_DAYS are deleted (see history.py).
+    """
+    __tablename__ = "burnout_history"
+
+    id = Column(Integer, primary_key=True, index=True)
+    username = Column(String, nullable=False)
+    day = Column(Date, nullable=False)  # UTC
+    risk_score = Column(Float, nullable=False)  # 0 to 100
+    risk_level = Column(String, nullable=False)  # RiskLevel value
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("username", "day", name="uq_burnout_history_username_day"),
+    )
@@ -1,6 +1,15 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from .schemas import BurnoutRiskRequest, BurnoutRiskResponse, BurnoutAlert
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+from typing import List, Optional
+from .schemas import (
+    BatchFormat,
+    BurnoutAlert,
+    BurnoutBatchRequest,
+    BurnoutBatchResponse,
+    BurnoutHistoryResponse,
+    BurnoutRiskRequest,
+    BurnoutRiskResponse,
+)
 from .service import BurnoutRiskDetectionService
 
 router = APIRouter()
@@ -18,6 +27,38 @@ async def assess_burnout_risk(request: BurnoutRiskRequest):
     try:
         result = await service.assess_risk(request)
         return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/assess-batch")
+async def assess_burnout_risk_batch(request: BurnoutBatchRequest, format: BatchFormat = BatchFormat.NDJSON):
+    """
+    Assess burnout risk for many maintainers at once.
+
+    Takes a list of usernames, a repository or an organization (every
+    author active there is assessed) and featurizes all users in one pass
+    over the shared activity. Results are returned highest risk first once
+    the whole batch is scored (ranking needs every user), one
+    BurnoutRiskResponse per line (NDJSON), or as one document with
+    `format=json`.
+    """
+    try:
+        results = await service.assess_batch(request)
+        if format == BatchFormat.JSON:
+            return BurnoutBatchResponse(
+                repository=request.repository,
+                organization=request.organization,
+                time_period_days=request.time_period_days or 30,
+                total=len(results),
+                results=results,
+            )
+        body = "".join(result.model_dump_json() + "\n" for result in results)
+        return Response(body, media_type="application/x-ndjson")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -30,18 +71,32 @@ async def get_burnout_alerts(username: str) -> List[BurnoutAlert]:
     try:
         alerts = await service.get_alerts(username)
         return alerts
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/history/{username}")
-async def get_burnout_history(username: str, days: int = 90):
+@router.get("/history/{username}", response_model=BurnoutHistoryResponse)
+async def get_burnout_history(
+    username: str,
+    days: int = 90,
+    resolution: str = "auto",
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+):
     """
     Get historical burnout risk scores.
+
+    One point per day, or weekly / monthly means for long windows
+    (`resolution`, chosen from `days` by default). Pages hold `limit`
+    points; pass `next_cursor` as `cursor` for the next one.
     """
     try:
-        history = await service.get_history(username, days)
+        history = await service.get_history(username, days, resolution, cursor, limit)
         return history
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -54,5 +109,7 @@ async def subscribe_to_alerts(username: str, email: str):
     try:
         result = await service.subscribe_alerts(username, email)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from enum import Enum
 from datetime import datetime
+from app.core.config import settings
 
 
 class RiskLevel(str, Enum):
@@ -23,15 +24,17 @@ class BurnoutIndicator(str, Enum):
 class BurnoutRiskRequest(BaseModel):
     username: str
     repository: Optional[str] = None
-    time_period_days: Optional[int] = 30
+    time_period_days: int = Field(30, ge=1, le=settings.BURNOUT_MAX_DAYS)
+    utc_offset: int = Field(0, ge=-12, le=14)  # hours; the user's declared time zone, UTC by default
+    estimate_utc_offset: bool = False  # guess the offset from activity instead (see features.py)
 
 
 class BurnoutFactors(BaseModel):
-    activity_score: float
-    workload_score: float
-    sentiment_score: float
-    response_time_pressure: float
-    work_life_balance: float
+    activity_score: float  # 0 to 100, share of days with activity
+    workload_score: float  # 0 to 100, higher is heavier
+    sentiment_score: float  # -1 to 1, tone of the user's own texts
+    response_time_pressure: float  # 0 to 100
+    work_life_balance: float  # 0 to 100, higher is healthier
 
 
 class BurnoutRiskResponse(BaseModel):
@@ -42,6 +45,30 @@ class BurnoutRiskResponse(BaseModel):
     indicators: List[BurnoutIndicator]
     recommendations: List[str]
     timestamp: datetime
+    features: Dict[str, float] = {}  # raw activity-pattern signals (see features.py)
+
+
+class BatchFormat(str, Enum):
+    NDJSON = "ndjson"
+    JSON = "json"
+
+
+class BurnoutBatchRequest(BaseModel):
+    usernames: Optional[List[str]] = None  # None: every author active in the repository / organization
+    repository: Optional[str] = None
+    organization: Optional[str] = None  # owner whose repositories are scanned
+    time_period_days: int = Field(30, ge=1, le=settings.BURNOUT_MAX_DAYS)
+    utc_offset: int = Field(0, ge=-12, le=14)  # hours, for every user; UTC by default
+    estimate_utc_offset: bool = False  # guess each user's offset from activity instead
+    min_events: int = Field(1, ge=0)  # skip discovered authors with fewer events
+
+
+class BurnoutBatchResponse(BaseModel):
+    repository: Optional[str] = None
+    organization: Optional[str] = None
+    time_period_days: int
+    total: int
+    results: List[BurnoutRiskResponse]  # highest risk first
 
 
 class BurnoutAlert(BaseModel):
@@ -55,6 +82,16 @@ class BurnoutAlert(BaseModel):
 
 
 class BurnoutHistoryEntry(BaseModel):
-    date: str
-    risk_score: float
+    date: str  # day, or first day of the week / month
+    risk_score: float  # mean over the bucket
     risk_level: RiskLevel
+    max_risk_score: Optional[float] = None
+    samples: int = 1  # days with a stored point
+
+
+class BurnoutHistoryResponse(BaseModel):
+    username: str
+    days: int
+    resolution: str  # "day", "week" or "month"
+    history: List[BurnoutHistoryEntry]  # oldest first
+    next_cursor: Optional[str] = None  # pass as `cursor` for the next page
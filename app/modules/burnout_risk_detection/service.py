@@ -1,4 +1,7 @@
 from .schemas import (
+    BurnoutBatchRequest,
+    BurnoutHistoryEntry,
+    BurnoutHistoryResponse,
     BurnoutRiskRequest,
     BurnoutRiskResponse,
     BurnoutAlert,
@@ -6,54 +9,460 @@ from .schemas import (
     RiskLevel,
     BurnoutIndicator
 )
-from typing import List
-from datetime import datetime
+from .features import FEATURE_NAMES, event_codes, feature_matrix
+from .history import RESOLUTIONS, auto_resolution, bucket_of, downsample, history_store, next_bucket
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from datetime import date, datetime, timedelta
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+from app.core.config import settings
+from app.shared.analysis_cache import cached_analysis
+from app.shared.cache import cache_service
+from app.shared.database import AsyncSessionLocal
+from app.shared.event_store import event_store, EventType
+from app.shared.executor import process_executor
+from app.shared.github_client import GitHubClient
+from app.shared.models import ContributionEvent
+from app.shared.utils import calculate_date_range, generate_cache_key, parse_github_repo
+from app.modules.sentiment_analysis.service import SentimentAnalysisService, event_text
+
+# Users with more events than this are processed in the worker pool
+INLINE_FEATURES_MAX_EVENTS = 20000
+
+# Seconds a user found without events is not re-assessed by get_history
+NO_ACTIVITY_TTL = 3600
+
+# Event types whose text reflects the user's tone
+TEXT_EVENT_TYPES = [EventType.PULL_REQUEST, EventType.ISSUE, EventType.ISSUE_COMMENT, EventType.REVIEW]
+
+# Lowest risk score (0-100) of each level, highest level first
+RISK_LEVELS: List[Tuple[float, RiskLevel]] = [
+    (75, RiskLevel.CRITICAL),
+    (50, RiskLevel.HIGH),
+    (25, RiskLevel.MODERATE),
+]
+
+RECOMMENDATIONS: Dict[BurnoutIndicator, str] = {
+    BurnoutIndicator.EXCESSIVE_HOURS: "Keep contributions within regular working hours and protect weekends",
+    BurnoutIndicator.RAPID_RESPONSE_PRESSURE: "Set response-time expectations (e.g. in CONTRIBUTING.md) instead of replying immediately",
+    BurnoutIndicator.LACK_OF_BREAKS: "Schedule regular days off and hand over triage while away",
+    BurnoutIndicator.NEGATIVE_SENTIMENT: "Step back from heated threads and share the load of difficult discussions",
+    BurnoutIndicator.DECREASED_ACTIVITY: "Check in: activity has dropped sharply compared to earlier in the period",
+    BurnoutIndicator.INCREASED_CONFLICT: "Enforce the code of conduct and involve co-maintainers in conflicts",
+}
+
+DEFAULT_RECOMMENDATIONS = [
+    "Take regular breaks",
+    "Set healthy boundaries",
+    "Delegate responsibilities",
+]
+
+
+def _clip(value: float) -> float:
+    return min(1.0, max(0.0, value))
+
+
+def burnout_factors(features: Dict[str, float]) -> BurnoutFactors:
+    """Summarize activity features into the 0-100 factor scores."""
+    workload = 0.7 * _clip(features["events_per_active_day"] / 30) + 0.3 * _clip(features["workload_trend"])
+    if features["responses"]:
+        pressure = 0.6 * features["fast_response_ratio"] + 0.4 * _clip(1 - features["response_p50_hours"] / 24)
+    else:
+        pressure = 0.0
+    off_hours = (
+        0.5 * _clip(features["late_night_ratio"] / 0.3)
+        + 0.3 * _clip(features["weekend_ratio"] / 0.4)
+        + 0.2 * _clip(1 - features["longest_break_days"] / 7)
+    ) if features["events"] else 0.0
+    return BurnoutFactors(
+        activity_score=round(100 * features["active_day_ratio"], 2),
+        workload_score=round(100 * workload, 2),
+        sentiment_score=round(features["sentiment_mean"], 4),
+        response_time_pressure=round(100 * pressure, 2),
+        work_life_balance=round(100 * (1 - off_hours), 2),
+    )
+
+
+def burnout_indicators(features: Dict[str, float]) -> List[BurnoutIndicator]:
+    """Indicators whose thresholds the features cross (given enough data)."""
+    indicators = []
+    if features["events"] >= 20 and (
+        features["late_night_ratio"] >= 0.2 or features["weekend_ratio"] >= 0.3
+    ):
+        indicators.append(BurnoutIndicator.EXCESSIVE_HOURS)
+    if features["responses"] >= 10 and (
+        features["response_p50_hours"] <= 1 or features["fast_response_ratio"] >= 0.5
+    ):
+        indicators.append(BurnoutIndicator.RAPID_RESPONSE_PRESSURE)
+    if features["window_days"] >= 14 and (
+        features["longest_streak_days"] >= 21 or features["longest_break_days"] < 2
+    ) and features["events"] >= 20:
+        indicators.append(BurnoutIndicator.LACK_OF_BREAKS)
+    if features["texts"] >= 10 and (
+        features["sentiment_mean"] <= -0.05 or features["negative_ratio"] >= 0.3
+    ):
+        indicators.append(BurnoutIndicator.NEGATIVE_SENTIMENT)
+    if features["events"] >= 20 and features["recent_activity_ratio"] <= 0.5:
+        indicators.append(BurnoutIndicator.DECREASED_ACTIVITY)
+    if features["texts"] >= 10 and features["conflict_trend"] >= 0.1:
+        indicators.append(BurnoutIndicator.INCREASED_CONFLICT)
+    return indicators
+
+
+def risk_score(factors: BurnoutFactors, indicators: List[BurnoutIndicator]) -> float:
+    """Weighted 0-100 risk score."""
+    score = (
+        0.30 * factors.workload_score
+        + 0.25 * (100 - factors.work_life_balance)
+        + 0.20 * factors.response_time_pressure
+        + 0.15 * 100 * _clip(-2 * factors.sentiment_score)
+        + 0.10 * 100 * len(indicators) / len(BurnoutIndicator)
+    )
+    return round(score, 2)
+
+
+def risk_level(score: float) -> RiskLevel:
+    for threshold, level in RISK_LEVELS:
+        if score >= threshold:
+            return level
+    return RiskLevel.LOW
+
+
+def _epoch_seconds(values: List[datetime]) -> np.ndarray:
+    return np.array(values, dtype="datetime64[s]").astype(np.int64)
 
 
 class BurnoutRiskDetectionService:
     """
     Service for detecting burnout risk in maintainers.
 
-    TODO: Implement burnout detection based on:
-    - Activity patterns (working hours, frequency)
-    - Workload metrics (issues, PRs, reviews)
-    - Sentiment analysis results
-    - Response time pressure
-    - Break patterns and work-life balance
+    Users' events come from the contribution event store and are turned
+    into NumPy arrays; features.py computes every activity-pattern signal
+    in bulk, for one user or a whole organization at once (in the worker
+    pool for large batches), and the factor scores, indicators and risk
+    level are derived from those features.
     """
 
+    def __init__(self):
+        self.sentiment = SentimentAnalysisService()
+
+    @staticmethod
+    def _scope(
+        usernames: Optional[List[str]],
+        repository: Optional[str],
+        organization: Optional[str],
+        since: datetime,
+        until: datetime,
+    ) -> list:
+        """Event filters for users (all authors when None) in a repository, organization or everywhere."""
+        filters = [
+            ContributionEvent.author.isnot(None),
+            ContributionEvent.occurred_at >= since,
+            ContributionEvent.occurred_at <= until,
+        ]
+        if usernames is not None:
+            filters.append(ContributionEvent.author.in_(usernames))
+        if repository:
+            filters.append(ContributionEvent.repository == repository)
+        elif organization:
+            filters.append(ContributionEvent.repository.startswith(f"{organization}/", autoescape=True))
+        return filters
+
+    async def _organization_synced(self, organization: str) -> bool:
+        """Whether the event store holds any event of the organization's repositories."""
+        statement = (
+            select(ContributionEvent.id)
+            .where(ContributionEvent.repository.startswith(f"{organization}/", autoescape=True))
+            .limit(1)
+        )
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(statement)).first() is not None
+
+    async def _response_latencies(self, scope: list) -> List[tuple]:
+        """
+        Seconds from others opening an issue / PR to each user's first comment or review on it.
+
+        Returns:
+            Rows of (author, opened_at, responded_at)
+        """
+        first = (
+            select(
+                ContributionEvent.author,
+                ContributionEvent.repository,
+                ContributionEvent.number,
+                func.min(ContributionEvent.occurred_at).label("responded_at"),
+            )
+            .where(
+                *scope,
+                ContributionEvent.event_type.in_([EventType.ISSUE_COMMENT.value, EventType.REVIEW.value]),
+                ContributionEvent.number.isnot(None),
+            )
+            .group_by(ContributionEvent.author, ContributionEvent.repository, ContributionEvent.number)
+            .subquery()
+        )
+        item = aliased(ContributionEvent)
+        statement = (
+            select(first.c.author, item.occurred_at, first.c.responded_at)
+            .join(first, (item.repository == first.c.repository) & (item.number == first.c.number))
+            .where(
+                item.event_type.in_([EventType.PULL_REQUEST.value, EventType.ISSUE.value]),
+                item.author != first.c.author,
+            )
+        )
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(statement)).all()
+
+    async def _texts(self, scope: list) -> List[tuple]:
+        """The users' own texts: rows of (author, occurred_at, event_type, data)."""
+        statement = select(
+            ContributionEvent.author,
+            ContributionEvent.occurred_at,
+            ContributionEvent.event_type,
+            ContributionEvent.data,
+        ).where(*scope, ContributionEvent.event_type.in_([event_type.value for event_type in TEXT_EVENT_TYPES]))
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(statement)).all()
+
+    async def compute_feature_matrix(
+        self,
+        usernames: Optional[List[str]] = None,
+        repository: Optional[str] = None,
+        organization: Optional[str] = None,
+        days: int = 30,
+        utc_offset: int = 0,
+        min_events: int = 1,
+        estimate_offsets: bool = False,
+        max_users: Optional[int] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Load the activity of many users in one pass and featurize them together.
+
+        Events, response latencies and texts of every user in scope are
+        read with one query each, all texts are scored as one corpus, and
+        features.feature_matrix() computes every user's features at once.
+
+        Args:
+            usernames: Users to assess; None for every author in scope with
+                at least `min_events` events
+            repository: Only count activity in this repository (owner/name)
+            organization: Only count activity in this owner's repositories
+            days: Window length in days
+            utc_offset: UTC offset in hours of every user
+            min_events: Minimum events of discovered users
+            estimate_offsets: Estimate each user's offset from their activity
+            max_users: Reject scopes with more discovered authors (400)
+
+        Returns:
+            (usernames, matrix with one row per user and a column per FEATURE_NAMES)
+        """
+        since, until = calculate_date_range(days)
+        scope = self._scope(usernames, repository, organization, since, until)
+        statement = select(
+            ContributionEvent.author, ContributionEvent.occurred_at, ContributionEvent.event_type
+        ).where(*scope)
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(statement)).all()
+
+        if usernames is None:
+            counts = Counter(row[0] for row in rows)
+            users = sorted(author for author, count in counts.items() if count >= min_events)
+            if max_users is not None and len(users) > max_users:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{len(users)} authors in scope; at most {max_users} per batch "
+                    "(raise min_events or narrow the scope)",
+                )
+        else:
+            users = list(dict.fromkeys(usernames))
+        if not users:
+            return users, np.zeros((0, len(FEATURE_NAMES)))
+        index = {username: position for position, username in enumerate(users)}
+
+        def user_codes(authors) -> np.ndarray:
+            return np.fromiter((index.get(author, -1) for author in authors), dtype=np.int64)
+
+        # Authors below min_events are dropped here rather than in SQL
+        codes = user_codes(row[0] for row in rows)
+        known = codes >= 0
+        timestamps = _epoch_seconds([row[1] for row in rows])[known]
+        kinds = event_codes([row[2] for row in rows])[known]
+
+        latency_rows = [row for row in await self._response_latencies(scope) if row[0] in index]
+        latencies = (
+            _epoch_seconds([row[2] for row in latency_rows]) - _epoch_seconds([row[1] for row in latency_rows])
+        ).astype(np.float64)
+
+        text_rows = [row for row in await self._texts(scope) if row[0] in index]
+        scores, _ = await self.sentiment.score([event_text(event_type, data) for _, _, event_type, data in text_rows])
+
+        arguments = (
+            codes[known],
+            timestamps,
+            kinds,
+            len(users),
+            int(_epoch_seconds([since])[0]),
+            int(_epoch_seconds([until])[0]),
+            user_codes(row[0] for row in latency_rows),
+            latencies,
+            user_codes(row[0] for row in text_rows),
+            scores,
+            _epoch_seconds([row[1] for row in text_rows]),
+            utc_offset,
+            estimate_offsets,
+        )
+        if len(timestamps) > INLINE_FEATURES_MAX_EVENTS:
+            return users, await process_executor.run(feature_matrix, *arguments)
+        return users, feature_matrix(*arguments)
+
+    async def compute_features(
+        self,
+        username: str,
+        repository: Optional[str] = None,
+        days: int = 30,
+        utc_offset: int = 0,
+        estimate_offsets: bool = False,
+    ) -> Dict[str, float]:
+        """Load a user's activity in the window and extract its features."""
+        _, matrix = await self.compute_feature_matrix(
+            [username], repository, None, days, utc_offset, estimate_offsets=estimate_offsets
+        )
+        return dict(zip(FEATURE_NAMES, matrix[0].tolist()))
+
+    def build_response(self, username: str, features: Dict[str, float]) -> BurnoutRiskResponse:
+        """Turn features into factors, indicators, a risk score and recommendations."""
+        factors = burnout_factors(features)
+        indicators = burnout_indicators(features)
+        score = risk_score(factors, indicators)
+        return BurnoutRiskResponse(
+            username=username,
+            risk_level=risk_level(score),
+            risk_score=score,
+            factors=factors,
+            indicators=indicators,
+            recommendations=[RECOMMENDATIONS[indicator] for indicator in indicators] or DEFAULT_RECOMMENDATIONS,
+            timestamp=datetime.now(),
+            features={name: round(float(value), 4) for name, value in features.items()},
+        )
+
+    def _responses(self, users: List[str], matrix: np.ndarray) -> List[BurnoutRiskResponse]:
+        """Responses for the rows of a feature matrix, highest risk first."""
+        results = [
+            self.build_response(username, dict(zip(FEATURE_NAMES, row)))
+            for username, row in zip(users, matrix.tolist())
+        ]
+        results.sort(key=lambda result: result.risk_score, reverse=True)
+        return results
+
+    async def _record_history(self, results: List[BurnoutRiskResponse]) -> None:
+        """Store results of users with activity in the window as today's history points."""
+        today = datetime.utcnow().date()
+        await history_store.record(
+            [
+                (result.username, today, result.risk_score, result.risk_level.value)
+                for result in results
+                if result.features.get("events", 0) > 0
+            ]
+        )
+
+    async def record_daily_history(self) -> int:
+        """
+        Record today's history point of every author active over BURNOUT_HISTORY_WINDOW_DAYS.
+
+        All authors are featurized in one batch (see compute_feature_matrix).
+
+        Returns:
+            Number of points recorded
+        """
+        users, matrix = await self.compute_feature_matrix(days=settings.BURNOUT_HISTORY_WINDOW_DAYS)
+        results = self._responses(users, matrix)
+        await self._record_history(results)
+        return len(results)
+
+    @cached_analysis("burnout_risk_detection", BurnoutRiskResponse)
     async def assess_risk(self, request: BurnoutRiskRequest) -> BurnoutRiskResponse:
         """
         Assess burnout risk for a maintainer.
 
-        TEAM MEMBER: Implement your risk assessment algorithm here.
-        Consider analyzing:
-        - Commit times (late night/weekend work)
-        - Response times and pressure
-        - Workload trends
-        - Sentiment patterns
-        - Time off patterns
+        Off-hours and weekend work, breaks, workload level and trend,
+        response latency and the tone of the user's own texts over the
+        window are extracted in bulk (see features.py) and combined into
+        factor scores and indicators. Assessments of all of a user's
+        activity over BURNOUT_HISTORY_WINDOW_DAYS, in UTC, are kept as that
+        day's history point.
         """
-        # Placeholder implementation
-        return BurnoutRiskResponse(
-            username=request.username,
-            risk_level=RiskLevel.LOW,
-            risk_score=0.0,
-            factors=BurnoutFactors(
-                activity_score=0.0,
-                workload_score=0.0,
-                sentiment_score=0.0,
-                response_time_pressure=0.0,
-                work_life_balance=0.0
-            ),
-            indicators=[],
-            recommendations=[
-                "Take regular breaks",
-                "Set healthy boundaries",
-                "Delegate responsibilities"
-            ],
-            timestamp=datetime.now()
+        days = request.time_period_days or 30
+        features = await self.compute_features(
+            request.username, request.repository, days, request.utc_offset, request.estimate_utc_offset
+        )
+        result = self.build_response(request.username, features)
+        if (
+            request.repository is None
+            and days == settings.BURNOUT_HISTORY_WINDOW_DAYS
+            and request.utc_offset == 0
+            and not request.estimate_utc_offset
+        ):
+            await self._record_history([result])
+        return result
+
+    async def assess_batch(self, request: BurnoutBatchRequest) -> List[BurnoutRiskResponse]:
+        """
+        Assess burnout risk for many maintainers in one pass.
+
+        Listed users, or every author active in the repository /
+        organization, are featurized together (see compute_feature_matrix),
+        so shared repository activity is read and scored once instead of
+        once per user. A repository not synced yet is ingested from GitHub
+        first; an organization none of whose repositories are synced is
+        rejected, since ingesting all of them would not fit in a request.
+
+        Returns:
+            One response per user, highest risk first
+        """
+        usernames = request.usernames or None
+        if not (usernames or request.repository or request.organization):
+            raise HTTPException(status_code=400, detail="Give usernames, a repository or an organization")
+        if request.repository and request.organization:
+            raise HTTPException(status_code=400, detail="Give either a repository or an organization")
+        if usernames and len(usernames) > settings.BURNOUT_BATCH_MAX_USERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.BURNOUT_BATCH_MAX_USERS} usernames per batch",
+            )
+
+        days = request.time_period_days or 30
+        if request.repository and not await event_store.count_by_type(repository=request.repository):
+            owner, repo = parse_github_repo(request.repository)
+            since, until = calculate_date_range(days)
+            await event_store.ingest_repository(GitHubClient(), owner, repo, since=since, until=until)
+        if request.organization and not await self._organization_synced(request.organization):
+            raise HTTPException(
+                status_code=404,
+                detail=f"No synced repositories of organization {request.organization}; "
+                "track and sync them first",
+            )
+
+        users, matrix = await self.compute_feature_matrix(
+            usernames,
+            request.repository,
+            request.organization,
+            days,
+            request.utc_offset,
+            request.min_events,
+            request.estimate_utc_offset,
+            settings.BURNOUT_BATCH_MAX_USERS,
         )
+        results = self._responses(users, matrix)
+        if (
+            not (request.repository or request.organization)
+            and days == settings.BURNOUT_HISTORY_WINDOW_DAYS
+            and request.utc_offset == 0
+            and not request.estimate_utc_offset
+        ):
+            await self._record_history(results)
+        return results
 
     async def get_alerts(self, username: str) -> List[BurnoutAlert]:
         """
@@ -64,18 +473,99 @@ class BurnoutRiskDetectionService:
         # Placeholder implementation
         return []
 
-    async def get_history(self, username: str, days: int):
+    async def get_history(
+        self,
+        username: str,
+        days: int = 90,
+        resolution: str = "auto",
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> BurnoutHistoryResponse:
         """
         Get historical burnout risk data.
 
-        TEAM MEMBER: Implement historical tracking here.
+        Reads the stored daily points (see history.py) instead of
+        re-assessing past days; points are produced daily by the
+        history snapshot and today's point is assessed when missing. Long windows are downsampled to weekly or monthly means,
+        and results are paged `limit` buckets at a time.
+
+        Args:
+            username: GitHub username
+            days: Days of history, up to BURNOUT_HISTORY_RETENTION_DAYS
+            resolution: "day", "week", "month" or "auto" (by window length)
+            cursor: next_cursor of the previous page
+            limit: Buckets per page
+
+        Returns:
+            Buckets oldest first, with the cursor of the next page
         """
-        # Placeholder implementation
-        return {
-            "username": username,
-            "history": [],
-            "days": days
-        }
+        if not 1 <= days <= settings.BURNOUT_HISTORY_RETENTION_DAYS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"days must be between 1 and {settings.BURNOUT_HISTORY_RETENTION_DAYS}",
+            )
+        if resolution == "auto":
+            resolution = auto_resolution(days)
+        elif resolution not in RESOLUTIONS:
+            raise HTTPException(status_code=400, detail=f"resolution must be auto or one of {list(RESOLUTIONS)}")
+        if limit < 1:
+            raise HTTPException(status_code=400, detail="limit must be positive")
+
+        until = datetime.utcnow().date()
+        since = until - timedelta(days=days - 1)
+        start = bucket_of(since, resolution)
+        if cursor:
+            try:
+                start = date.fromisoformat(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            if start != bucket_of(start, resolution):
+                raise HTTPException(status_code=400, detail="Cursor does not match the resolution")
+        end = start
+        for _ in range(limit):
+            if end > until:
+                break
+            end = next_bucket(end, resolution)
+
+        inactive_key = generate_cache_key("burnout_inactive", username, until.isoformat())
+        if (
+            start <= until < end
+            and not await history_store.read(username, until, until)
+            and not await cache_service.get(inactive_key)
+        ):
+            # Not in today's snapshot yet (see snapshots.py): assess once, uncached
+            features = await self.compute_features(username, days=settings.BURNOUT_HISTORY_WINDOW_DAYS)
+            if features["events"] > 0:
+                await self._record_history([self.build_response(username, features)])
+            else:
+                # No point is stored for inactive users; remember that they were checked
+                await cache_service.set(inactive_key, True, ttl=NO_ACTIVITY_TTL)
+        points = await history_store.read(username, max(since, start), min(until, end - timedelta(days=1)))
+        if resolution == "day":
+            history = [
+                BurnoutHistoryEntry(
+                    date=day.isoformat(), risk_score=score, risk_level=RiskLevel(level), max_risk_score=score
+                )
+                for day, score, level in points
+            ]
+        else:
+            history = [
+                BurnoutHistoryEntry(
+                    date=bucket.isoformat(),
+                    risk_score=round(mean, 2),
+                    risk_level=risk_level(mean),
+                    max_risk_score=maximum,
+                    samples=samples,
+                )
+                for bucket, mean, maximum, samples in downsample(points, resolution)
+            ]
+        return BurnoutHistoryResponse(
+            username=username,
+            days=days,
+            resolution=resolution,
+            history=history,
+            next_cursor=end.isoformat() if end <= until else None,
+        )
 
     async def subscribe_alerts(self, username: str, email: str):
         """
@@ -0,0 +1,84 @@
+from typing import Optional
+from datetime import date, datetime
+import asyncio
+import contextlib
+import logging
+from app.shared.cache import cache_service
+from .service import BurnoutRiskDetectionService
+
+logger = logging.getLogger(__name__)
+
+# Seconds one process holds the right to take a day's snapshot
+LEASE_SECONDS = 3600
+
+
+class BurnoutHistorySnapshotWorker:
+    """
+    Background worker producing the daily burnout history points.
+
+    Once per UTC day, every author active over BURNOUT_HISTORY_WINDOW_DAYS
+    is assessed in one batch and stored as that day's point (see
+    BurnoutRiskDetectionService.record_daily_history), so history series
+    do not depend on someone calling /assess or /history. Authors without
+    events in the window get no point.
+
+    Every app process runs the worker, but a lease in the shared cache
+    lets only one of them take a day's snapshot; a done marker tells the
+    others it was taken. A failed snapshot is retried by any process once
+    its lease expires.
+
+    Usage:
+    await history_snapshots.start()  # from the application lifespan
+    """
+
+    def __init__(self, check_interval: float = 3600, service: Optional[BurnoutRiskDetectionService] = None):
+        self.check_interval = check_interval
+        self.service = service or BurnoutRiskDetectionService()
+        self.taken_on: Optional[date] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start daily snapshots. Call this on application startup."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop daily snapshots. Call this on shutdown."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            today = datetime.utcnow().date()
+            if self.taken_on != today:
+                try:
+                    await self.snapshot(today)
+                except Exception:
+                    logger.exception("Burnout history snapshot failed")
+            await asyncio.sleep(self.check_interval)
+
+    async def snapshot(self, day: date) -> None:
+        """Take the day's snapshot unless another process has taken or is taking it."""
+        done_key = f"burnout:history:snapshot:{day.isoformat()}:done"
+        if await cache_service.get(done_key):
+            self.taken_on = day
+            return
+        # The lease outlives a snapshot; if its holder dies, another process retries after it
+        if not await cache_service.add(f"burnout:history:snapshot:{day.isoformat()}:lease", True, ttl=LEASE_SECONDS):
+            return
+        recorded = await self.service.record_daily_history()
+        await cache_service.set(done_key, True, ttl=2 * 86400)
+        self.taken_on = day
+        logger.info("Recorded %d burnout history points for %s", recorded, day)
+
+
+# Singleton instance
+history_snapshots = BurnoutHistorySnapshotWorker()
@@ -18,6 +18,8 @@ async def calculate_invisible_labor_score(request: InvisibleLaborScoreRequest):
     try:
         result = await service.calculate_score(request)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -30,5 +32,7 @@ async def get_invisible_labor_metrics(username: str):
     try:
         metrics = await service.get_metrics(username)
         return metrics
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,4 +1,5 @@
 from .schemas import InvisibleLaborScoreRequest, InvisibleLaborScoreResponse
+from app.shared.analysis_cache import cached_analysis
 
 
 class InvisibleLaborScoringService:
@@ -13,6 +14,7 @@ class InvisibleLaborScoringService:
     - Mentoring new contributors
     """
 
+    @cached_analysis("invisible_labor_scoring", InvisibleLaborScoreResponse)
     async def calculate_score(self, request: InvisibleLaborScoreRequest) -> InvisibleLaborScoreResponse:
         """
         Calculate invisible labor score for a maintainer.
@@ -0,0 +1,345 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple, Type
+import asyncio
+import logging
+import time
+import numpy as np
+from app.core.config import settings
+from app.shared.executor import process_executor
+from .engine import POLARITY_THRESHOLD, SentimentEngine, get_engine, score_texts
+
+logger = logging.getLogger(__name__)
+
+# Corpora up to this size are scored inline: a few milliseconds, less than
+# the round trip to a worker process
+INLINE_SCORING_MAX_TEXTS = 1000
+
+# Build the lexicon arrays in every worker before the first request
+process_executor.register_initializer(get_engine)
+
+Scores = Tuple[np.ndarray, np.ndarray]
+
+
+async def score_corpus(texts: List[str]) -> Scores:
+    """
+    Score texts with the lexicon engine off the event loop: large corpora
+    are split into chunks scored in parallel by the process pool.
+
+    Returns:
+        (compound score per text, number of sentiment words per text)
+    """
+    if len(texts) <= INLINE_SCORING_MAX_TEXTS:
+        return score_texts(texts)
+    chunks = await process_executor.map_chunks(score_texts, texts, settings.EXECUTOR_CHUNK_SIZE)
+    return np.concatenate([scores for scores, _ in chunks]), np.concatenate([hits for _, hits in chunks])
+
+
+class SentimentBackend(ABC):
+    """
+    A way of scoring texts for sentiment.
+
+    Backends report compound scores in [-1, 1] and a per-text evidence
+    count (used for confidence). `name` and `version` key memoized scores
+    and rollups, so `version` must change whenever scores would.
+    """
+
+    name: str = ""
+    # Scores ignore case and whitespace, so memo keys may normalize texts
+    normalized_keys: bool = False
+
+    def __init__(self):
+        self.ready = False
+        self.error: Optional[str] = None
+
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Version string; includes the backend name."""
+
+    async def load(self) -> None:
+        """Load models; runs in the background after startup."""
+        self.ready = True
+
+    @abstractmethod
+    async def score(self, texts: List[str]) -> Scores:
+        """Score texts: (compound score per text, evidence per text)."""
+
+    def overloaded(self, size: int) -> bool:
+        """True when `size` more texts should go to the fallback backend instead."""
+        return False
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict:
+        return {"ready": self.ready, "version": self.version, "error": self.error}
+
+
+# name -> backend class; see register_backend
+BACKENDS: Dict[str, Type[SentimentBackend]] = {}
+
+
+def register_backend(cls: Type[SentimentBackend]) -> Type[SentimentBackend]:
+    """Class decorator making a backend selectable via SENTIMENT_BACKEND."""
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+@register_backend
+class LexiconBackend(SentimentBackend):
+    """Vectorized lexicon engine (engine.py); always ready, microseconds per text."""
+
+    name = SentimentEngine.NAME
+    normalized_keys = True  # the tokenizer lowercases and splits on whitespace
+
+    def __init__(self):
+        super().__init__()
+        self.ready = True
+
+    @property
+    def version(self) -> str:
+        return SentimentEngine.VERSION
+
+    async def score(self, texts: List[str]) -> Scores:
+        return await score_corpus(texts)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent scoring calls into batches for a model.
+
+    Texts from every caller are queued; a single task takes up to
+    `max_batch_size` texts, waiting at most `max_wait` seconds for a batch
+    to fill, runs `infer` on them in a thread (one batch at a time, so the
+    model is never used concurrently) and hands each caller its slice.
+    """
+
+    def __init__(
+        self,
+        infer: Callable[[List[str]], Scores],
+        max_batch_size: int = 32,
+        max_wait: float = 0.01,
+    ):
+        self.infer = infer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.pending = 0  # texts queued or being scored
+        self.batches = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def submit(self, texts: List[str]) -> Scores:
+        """Score texts as part of shared batches."""
+        self.start()
+        self.pending += len(texts)
+        loop = asyncio.get_running_loop()
+        futures = []
+        try:
+            # One queue entry per text keeps batches exactly max_batch_size
+            for text in texts:
+                future = loop.create_future()
+                futures.append(future)
+                self._queue.put_nowait((text, future))
+            results = await asyncio.gather(*futures)
+        finally:
+            self.pending -= len(texts)
+        return (
+            np.array([score for score, _ in results], dtype=np.float32),
+            np.array([hits for _, hits in results], dtype=np.int32),
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+            try:
+                scores, hits = await asyncio.to_thread(self.infer, [text for text, _ in batch])
+                self.batches += 1
+                for (_, future), score, count in zip(batch, scores.tolist(), hits.tolist()):
+                    if not future.done():
+                        future.set_result((score, count))
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+
+@register_backend
+class TransformerBackend(SentimentBackend):
+    """
+    Hugging Face sentiment model on CPU (SENTIMENT_MODEL).
+
+    transformers and torch are imported only in load(), which runs in a
+    thread in the background, so neither startup nor workers that never
+    select this backend pay for them. Inference is micro-batched; when
+    more than SENTIMENT_MODEL_MAX_QUEUE texts are waiting, new requests are
+    served by the lexicon backend instead.
+    """
+
+    name = "transformer"
+
+    def __init__(
+        self,
+        model: str = settings.SENTIMENT_MODEL,
+        max_batch_size: int = settings.SENTIMENT_MODEL_MAX_BATCH_SIZE,
+        max_wait_ms: int = settings.SENTIMENT_MODEL_MAX_WAIT_MS,
+        max_queue: int = settings.SENTIMENT_MODEL_MAX_QUEUE,
+    ):
+        super().__init__()
+        self.model = model
+        self.max_queue = max_queue
+        self.load_seconds: Optional[float] = None
+        self._pipeline = None
+        self._batcher = MicroBatcher(self._infer, max_batch_size, max_wait_ms / 1000)
+
+    @property
+    def version(self) -> str:
+        return f"transformer:{self.model}"
+
+    def _load_pipeline(self):
+        # Optional dependencies: only required when this backend is selected
+        from transformers import pipeline
+
+        return pipeline("sentiment-analysis", model=self.model, device=-1, top_k=None, truncation=True)
+
+    async def load(self) -> None:
+        started = time.perf_counter()
+        self._pipeline = await asyncio.to_thread(self._load_pipeline)
+        self.load_seconds = round(time.perf_counter() - started, 2)
+        self.ready = True
+
+    def _infer(self, texts: List[str]) -> Scores:
+        """Positive minus negative probability per text (runs in a thread)."""
+        outputs = self._pipeline([text or " " for text in texts], batch_size=len(texts))
+        scores = np.zeros(len(texts), dtype=np.float32)
+        for index, labels in enumerate(outputs):
+            for label in labels:
+                name = label["label"].lower()
+                if name.startswith("pos"):
+                    scores[index] += label["score"]
+                elif name.startswith("neg"):
+                    scores[index] -= label["score"]
+        hits = (np.abs(scores) >= POLARITY_THRESHOLD).astype(np.int32)
+        return scores, hits
+
+    def overloaded(self, size: int) -> bool:
+        return self._batcher.pending + size > self.max_queue
+
+    async def score(self, texts: List[str]) -> Scores:
+        if not texts:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int32)
+        return await self._batcher.submit(texts)
+
+    async def close(self) -> None:
+        await self._batcher.stop()
+
+    def stats(self) -> Dict:
+        return {
+            **super().stats(),
+            "model": self.model,
+            "load_seconds": self.load_seconds,
+            "pending": self._batcher.pending,
+            "batches": self._batcher.batches,
+        }
+
+
+class SentimentBackendManager:
+    """
+    Chooses the backend serving each scoring call.
+
+    The preferred backend (SENTIMENT_BACKEND) is loaded in a background
+    task after startup; until it is ready, when loading failed, or while
+    it is overloaded, the always-ready lexicon backend serves instead.
+
+    Usage:
+    await sentiment_backends.start()  # application startup, returns at once
+    backend = sentiment_backends.select(len(texts))
+    scores, hits = await backend.score(texts)
+    """
+
+    def __init__(self, preferred: str = settings.SENTIMENT_BACKEND):
+        if preferred not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend: {preferred}")
+        self.fallback = LexiconBackend()
+        self.preferred = self.fallback if preferred == LexiconBackend.name else BACKENDS[preferred]()
+        self.fallbacks = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the preferred backend serves requests."""
+        return self.preferred.ready
+
+    async def start(self) -> None:
+        """Start loading the preferred backend in the background."""
+        if self.preferred.ready or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._load())
+
+    async def _load(self) -> None:
+        backend = self.preferred
+        try:
+            await backend.load()
+            logger.info("Sentiment backend %s ready", backend.version)
+        except Exception as exc:
+            backend.error = str(exc) or type(exc).__name__
+            logger.error("Sentiment backend %s failed to load; using lexicon: %s", backend.name, exc)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.preferred.close()
+
+    def active(self) -> SentimentBackend:
+        """Preferred backend once ready, else the lexicon."""
+        return self.preferred if self.preferred.ready else self.fallback
+
+    def select(self, size: int) -> SentimentBackend:
+        """Backend for scoring `size` texts now: like active(), avoiding an overloaded model."""
+        backend = self.active()
+        if backend is not self.fallback and backend.overloaded(size):
+            self.fallbacks += 1
+            return self.fallback
+        return backend
+
+    def stats(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "active": self.active().name,
+            "preferred": self.preferred.name,
+            "fallbacks": self.fallbacks,
+            "backends": {
+                backend.name: backend.stats()
+                for backend in dict.fromkeys((self.preferred, self.fallback))
+            },
+        }
+
+
+# Singleton instance
+sentiment_backends = SentimentBackendManager()
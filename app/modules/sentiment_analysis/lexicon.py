@@ -0,0 +1,88 @@
+"""
+Sentiment lexicon for developer conversations.
+
+Valences follow the VADER scale (-4 most negative .. +4 most positive).
+General-purpose entries are complemented with terms whose tone is specific
+to code review and issue trackers ("lgtm", "regression", "nitpick").
+Technical words that are neutral on GitHub ("bug", "error", "kill") are
+deliberately left out.
+"""
+
+LEXICON = {
+    # Positive
+    "thanks": 1.9, "thank": 1.5, "thx": 1.5, "ty": 1.2, "appreciate": 2.0, "appreciated": 2.0,
+    "grateful": 2.0, "great": 3.1, "good": 1.9, "nice": 1.8, "awesome": 3.1, "amazing": 2.8,
+    "excellent": 2.7, "fantastic": 2.6, "wonderful": 2.7, "brilliant": 2.8, "perfect": 2.7,
+    "love": 3.2, "loved": 2.9, "lovely": 2.8, "like": 1.5, "liked": 1.8, "enjoy": 2.2, "glad": 2.0,
+    "happy": 2.7, "pleased": 1.9, "excited": 1.9, "cool": 1.3, "neat": 1.5, "clean": 1.7,
+    "cleaner": 1.5, "elegant": 2.1, "helpful": 1.8, "useful": 1.9, "valuable": 1.8, "impressive": 2.3,
+    "solid": 1.2, "robust": 1.3, "clear": 1.2, "clearer": 1.2, "readable": 1.3, "simple": 0.8,
+    "simpler": 1.0, "fast": 1.0, "faster": 1.2, "efficient": 1.6, "improved": 1.9, "improvement": 1.9,
+    "improves": 1.6, "better": 1.9, "best": 3.2, "well": 1.1, "works": 1.0, "working": 0.8,
+    "fixed": 1.2, "fixes": 0.9, "resolved": 1.3, "solved": 1.5, "welcome": 2.0, "congrats": 2.4,
+    "congratulations": 2.9, "kudos": 2.4, "bravo": 2.3, "cheers": 2.1, "yay": 2.4, "hooray": 2.4,
+    "wow": 2.8, "lgtm": 2.0, "approve": 1.3, "approved": 1.8, "agree": 1.5, "agreed": 1.5,
+    "sure": 1.3, "yes": 1.7, "ok": 1.2, "okay": 0.9, "fine": 0.8, "correct": 1.3, "right": 1.0,
+    "smart": 1.7, "thoughtful": 1.6, "kind": 2.4, "friendly": 2.2, "patient": 1.5, "support": 1.7,
+    "supportive": 1.9, "help": 1.7, "helped": 1.8, "helping": 1.6, "fun": 2.3, "beautiful": 2.9,
+    "delightful": 2.8, "exciting": 2.2, "promising": 1.6, "success": 2.7, "successful": 2.8,
+    "successfully": 2.2, "stable": 1.2, "polished": 1.6, "sweet": 2.0, "superb": 3.1,
+    "outstanding": 3.0, "recommend": 1.5, "recommended": 1.5, "praise": 2.6, "pleasure": 2.7,
+    "pleasant": 2.3, "hope": 1.9, "hopefully": 1.7, "interesting": 1.7, "worth": 0.9,
+    "nicely": 1.9, "greatly": 2.0, "happily": 2.0, "merged": 0.8, "shipped": 1.0, "celebrate": 2.7,
+    "impressed": 2.1, "inspiring": 2.1, "genius": 1.9, "magic": 1.0, "rocks": 1.6, "win": 2.8,
+    "wins": 2.7, "easy": 1.9, "easier": 1.8, "flawless": 2.3, "seamless": 1.9, "safe": 1.9,
+    "safer": 1.8, "secure": 1.4,
+
+    # Negative
+    "bad": -2.5, "worse": -2.1, "worst": -3.1, "terrible": -2.1, "horrible": -2.5, "awful": -2.0,
+    "poor": -2.1, "poorly": -1.9, "ugly": -2.3, "hate": -2.7, "hated": -3.2, "hates": -1.9,
+    "dislike": -1.6, "annoying": -1.7, "annoyed": -1.6, "annoys": -1.4, "frustrating": -1.9,
+    "frustrated": -2.4, "frustration": -2.1, "angry": -2.3, "anger": -2.7, "mad": -2.2,
+    "upset": -1.6, "disappointed": -1.9, "disappointing": -2.2, "disappointment": -2.3,
+    "sad": -2.1, "unhappy": -1.8, "sorry": -0.3, "unfortunately": -1.4, "unfortunate": -2.0,
+    "broken": -1.8, "breaks": -1.2, "breaking": -1.0, "broke": -1.8, "fail": -2.5, "fails": -1.8,
+    "failed": -2.3, "failing": -2.3, "failure": -2.3, "crash": -1.7, "crashes": -1.9,
+    "crashed": -1.8, "crashing": -1.7, "regression": -1.2, "regressions": -1.2, "wrong": -2.1,
+    "useless": -1.8, "pointless": -1.7, "worthless": -1.9, "garbage": -2.4, "trash": -1.8,
+    "junk": -1.5, "mess": -1.5, "messy": -1.5, "hacky": -1.2, "sloppy": -1.6, "confusing": -1.3,
+    "confused": -1.3, "unclear": -1.0, "complicated": -0.9, "slow": -1.2, "slower": -1.3,
+    "painful": -1.9, "pain": -2.3, "problem": -1.7, "problems": -1.7, "problematic": -1.9,
+    "issue": -0.3, "concern": -1.2, "concerned": -1.1, "worried": -1.2, "worry": -1.9,
+    "stupid": -2.4, "dumb": -2.3, "idiot": -2.3, "idiotic": -2.6, "ridiculous": -2.1,
+    "nonsense": -1.7, "lazy": -1.5, "rude": -2.0, "toxic": -2.5, "hostile": -2.2, "insulting": -2.2,
+    "disrespectful": -2.2, "unacceptable": -2.0, "blocked": -1.2, "blocker": -1.2, "stuck": -1.2,
+    "ignored": -1.6, "ignore": -1.1, "ignoring": -1.6, "abandoned": -1.9, "unmaintained": -1.5,
+    "deprecated": -0.5, "flaky": -1.3, "unstable": -1.5, "unusable": -2.1, "impossible": -1.4,
+    "nightmare": -2.5, "disaster": -3.1, "horrendous": -2.8, "dangerous": -2.1, "risky": -0.8,
+    "insecure": -1.6, "vulnerable": -0.9, "vulnerability": -1.1, "overwhelmed": -1.8,
+    "exhausted": -1.5, "tired": -1.9, "burnout": -2.0, "burned": -1.6, "stress": -1.8,
+    "stressed": -1.4, "stressful": -1.8, "sucks": -1.5, "suck": -1.9, "wtf": -2.8, "damn": -1.7,
+    "hell": -3.6, "shame": -2.1, "spam": -1.5, "spammy": -1.5, "waste": -1.8, "wasted": -2.2,
+    "nitpick": -0.4, "revert": -0.6, "reverted": -0.6, "outdated": -1.0, "obsolete": -1.2,
+    "missing": -1.2, "lacks": -1.4, "lacking": -1.6, "inconsistent": -1.1, "bloated": -1.3,
+    "clunky": -1.2, "awkward": -1.3, "fragile": -1.3, "weird": -0.7, "strange": -0.8,
+    "no": -1.2, "nope": -1.2, "never": -0.5, "demand": -1.0, "urgent": -0.6, "asap": -0.9,
+    "unresponsive": -1.5, "please": 0.3,
+}
+
+# Tokens that flip the valence of sentiment words shortly after them
+NEGATIONS = {
+    "not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "nowhere", "without",
+    "cannot", "cant", "can't", "dont", "don't", "doesnt", "doesn't", "didnt", "didn't", "isnt",
+    "isn't", "arent", "aren't", "wasnt", "wasn't", "werent", "weren't", "wont", "won't",
+    "wouldnt", "wouldn't", "shouldnt", "shouldn't", "couldnt", "couldn't", "hasnt", "hasn't",
+    "havent", "haven't", "hadnt", "hadn't", "aint", "ain't", "rarely", "seldom", "hardly",
+}
+
+# Intensifiers (positive) and dampeners (negative), added in the direction of the valence
+BOOSTERS = {
+    "very": 0.293, "really": 0.293, "so": 0.293, "extremely": 0.293, "super": 0.293,
+    "totally": 0.293, "absolutely": 0.293, "completely": 0.293, "incredibly": 0.293,
+    "highly": 0.293, "hugely": 0.293, "truly": 0.293, "especially": 0.293, "particularly": 0.293,
+    "utterly": 0.293, "seriously": 0.293, "insanely": 0.293, "most": 0.293, "more": 0.293,
+    "too": 0.293, "quite": 0.2, "pretty": 0.2,
+    "slightly": -0.293, "somewhat": -0.293, "barely": -0.293, "kinda": -0.293, "kindof": -0.293,
+    "sorta": -0.293, "little": -0.293, "marginally": -0.293, "partly": -0.293, "less": -0.293,
+    "occasionally": -0.293, "almost": -0.293,
+}
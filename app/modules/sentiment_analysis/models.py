@@ -0,0 +1,77 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, UniqueConstraint
+from datetime import datetime
+from app.shared.database import Base
+
+
+class SentimentScoreRecord(Base):
+    """
+    Memoized sentiment score of one text.
+
+    Keyed by a hash of the scoring engine version and the normalized text
+    (see score_store.py), so a text is scored once however many analyses,
+    trends or user filters include it, and a new engine version never
+    reads the old version's scores.
+    """
+    __tablename__ = "sentiment_scores"
+
+    id = Column(Integer, primary_key=True, index=True)
+    text_hash = Column(String(64), unique=True, nullable=False)  # sha256 hex
+    engine = Column(String, nullable=False)  # e.g. "lexicon"
+    engine_version = Column(String, nullable=False)  # e.g. "lexicon-1"
+    score = Column(Float, nullable=False)  # compound score in [-1, 1]
+    hits = Column(Integer, nullable=False)  # sentiment words found
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_sentiment_scores_engine_version", "engine", "engine_version"),
+    )
+
+
+class SentimentRollup(Base):
+    """
+    Pre-aggregated sentiment of one repository over one day or hour.
+
+    Sums are additive, so buckets are updated incrementally as events are
+    scored and any window or coarser series (mean, standard deviation) is
+    computed from the buckets alone.
+    """
+    __tablename__ = "sentiment_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    repository = Column(String, nullable=False)  # owner/name
+    granularity = Column(String, nullable=False)  # "day" or "hour"
+    bucket = Column(DateTime, nullable=False)  # bucket start (UTC)
+    engine = Column(String, nullable=False)
+    engine_version = Column(String, nullable=False)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    score_sumsq = Column(Float, nullable=False, default=0.0)
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "repository", "granularity", "engine_version", "bucket",
+            name="uq_sentiment_rollups_repository_granularity_version_bucket",
+        ),
+    )
+
+
+class SentimentRollupItem(Base):
+    """
+    Contribution event already added to the rollups of an engine version.
+
+    Keeps rollup updates idempotent: an event is only counted once however
+    often it is re-synced.
+    """
+    __tablename__ = "sentiment_rollup_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(String, nullable=False)  # ContributionEvent.event_id
+    engine = Column(String, nullable=False)
+    engine_version = Column(String, nullable=False)
+    score = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("event_id", "engine_version", name="uq_sentiment_rollup_items_event_version"),
+    )
@@ -0,0 +1,218 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from datetime import datetime, timedelta
+import numpy as np
+from sqlalchemy import delete, exists, insert, select
+from app.shared.database import AsyncSessionLocal, dialect_insert, get_async_engine
+from app.shared.db_writer import db_writer
+from app.shared.models import ContributionEvent
+from .models import SentimentRollup, SentimentRollupItem
+
+# Bucket widths in seconds
+GRANULARITIES: Dict[str, int] = {"day": 86400, "hour": 3600}
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Start of the day / hour bucket containing a (naive UTC) moment."""
+    width = GRANULARITIES[granularity]
+    seconds = int((moment - EPOCH).total_seconds())
+    return EPOCH + timedelta(seconds=seconds - seconds % width)
+
+
+def aggregate(
+    occurred_at: Sequence[datetime], scores: np.ndarray, granularity: str
+) -> List[Tuple[datetime, float, float, int]]:
+    """Sum scores per bucket: [(bucket start, sum, sum of squares, count)]."""
+    width = GRANULARITIES[granularity]
+    seconds = np.array(occurred_at, dtype="datetime64[s]").astype(np.int64)
+    buckets, inverse = np.unique(seconds // width, return_inverse=True)
+    scores = scores.astype(np.float64)
+    sums = np.bincount(inverse, weights=scores)
+    sumsqs = np.bincount(inverse, weights=scores * scores)
+    counts = np.bincount(inverse)
+    return [
+        (EPOCH + timedelta(seconds=int(bucket) * width), float(total), float(squares), int(count))
+        for bucket, total, squares, count in zip(buckets, sums, sumsqs, counts)
+    ]
+
+
+def _increment_statement():
+    """Build a dialect-specific upsert adding to a bucket's sums (run with executemany)."""
+    statement = dialect_insert(SentimentRollup)
+    if get_async_engine().dialect.name == "mysql":
+        return statement.on_duplicate_key_update(
+            score_sum=SentimentRollup.score_sum + statement.inserted.score_sum,
+            score_sumsq=SentimentRollup.score_sumsq + statement.inserted.score_sumsq,
+            count=SentimentRollup.count + statement.inserted.count,
+            updated_at=datetime.utcnow(),
+        )
+    return statement.on_conflict_do_update(
+        index_elements=["repository", "granularity", "engine_version", "bucket"],
+        set_={
+            "score_sum": SentimentRollup.score_sum + statement.excluded.score_sum,
+            "score_sumsq": SentimentRollup.score_sumsq + statement.excluded.score_sumsq,
+            "count": SentimentRollup.count + statement.excluded.count,
+            "updated_at": datetime.utcnow(),
+        },
+    )
+
+
+class SentimentRollupStore:
+    """
+    Daily and hourly sentiment rollups per repository.
+
+    pending() finds contribution events not yet counted for an engine
+    version, add() records their scores as item markers and adds them to
+    the day and hour buckets in one transaction, and series() reads a
+    window of buckets. A trend query therefore reads at most one row per
+    bucket instead of rescoring the window. is_complete() tells whether a
+    version has caught up with a repository's events in this process.
+
+    Usage:
+    rows = await rollup_store.pending("owner/repo", "lexicon", version, event_types)
+    await rollup_store.add("owner/repo", "lexicon", version, rows, scores)
+    buckets = await rollup_store.series("owner/repo", "day", version, since)
+    """
+
+    def __init__(self):
+        self._current: Set[Tuple[str, str]] = set()
+        self._complete: Set[Tuple[str, str]] = set()
+
+    def is_complete(self, repository: str, version: str) -> bool:
+        """Whether pending() has found no uncounted events of the repository for a version."""
+        return (repository, version) in self._complete
+
+    async def purge_stale(self, engine: str, version: str) -> None:
+        """Delete the engine's rollups and item markers from other versions."""
+
+        async def purge(db):
+            await db.execute(
+                delete(SentimentRollup).where(
+                    SentimentRollup.engine == engine, SentimentRollup.engine_version != version
+                )
+            )
+            await db.execute(
+                delete(SentimentRollupItem).where(
+                    SentimentRollupItem.engine == engine, SentimentRollupItem.engine_version != version
+                )
+            )
+
+        await db_writer.submit(purge)
+        self._current.add((engine, version))
+
+    async def pending(
+        self,
+        repository: str,
+        engine: str,
+        version: str,
+        event_types: Sequence[str],
+        limit: int = 5000,
+    ) -> List[tuple]:
+        """
+        Events of a repository not yet in its rollups.
+
+        Returns:
+            Up to `limit` rows of (event_id, event_type, occurred_at, data)
+        """
+        if (engine, version) not in self._current:
+            await self.purge_stale(engine, version)
+
+        counted = exists().where(
+            SentimentRollupItem.event_id == ContributionEvent.event_id,
+            SentimentRollupItem.engine_version == version,
+        )
+        statement = (
+            select(
+                ContributionEvent.event_id,
+                ContributionEvent.event_type,
+                ContributionEvent.occurred_at,
+                ContributionEvent.data,
+            )
+            .where(
+                ContributionEvent.repository == repository,
+                ContributionEvent.event_type.in_(list(event_types)),
+                ~counted,
+            )
+            # Newest first, so a bounded refresh covers recent windows first
+            .order_by(ContributionEvent.occurred_at.desc())
+            .limit(limit)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(statement)
+            rows = [tuple(row) for row in result.all()]
+        if not rows:
+            self._complete.add((repository, version))
+        return rows
+
+    async def add(
+        self, repository: str, engine: str, version: str, events: Sequence[tuple], scores: np.ndarray
+    ) -> None:
+        """
+        Count scored events (rows from pending()) in the rollups.
+
+        Markers are plain inserts: if another worker counted one of the
+        events concurrently, the whole write fails instead of counting twice.
+        """
+        if not events:
+            return
+        markers = [
+            {"event_id": event[0], "engine": engine, "engine_version": version, "score": float(score)}
+            for event, score in zip(events, scores.tolist())
+        ]
+        occurred_at = [event[2] for event in events]
+        rows = [
+            {
+                "repository": repository,
+                "granularity": granularity,
+                "bucket": bucket,
+                "engine": engine,
+                "engine_version": version,
+                "score_sum": total,
+                "score_sumsq": squares,
+                "count": count,
+            }
+            for granularity in GRANULARITIES
+            for bucket, total, squares, count in aggregate(occurred_at, scores, granularity)
+        ]
+
+        async def write(db):
+            await db.execute(insert(SentimentRollupItem), markers)
+            await db.execute(_increment_statement(), rows)
+
+        await db_writer.submit(write)
+
+    async def series(
+        self,
+        repository: str,
+        granularity: str,
+        version: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, float, float, int]]:
+        """Buckets of a window: [(bucket start, sum, sum of squares, count)], oldest first."""
+        filters = [
+            SentimentRollup.repository == repository,
+            SentimentRollup.granularity == granularity,
+            SentimentRollup.engine_version == version,
+            SentimentRollup.bucket >= since,
+        ]
+        if until:
+            filters.append(SentimentRollup.bucket <= until)
+        statement = (
+            select(
+                SentimentRollup.bucket,
+                SentimentRollup.score_sum,
+                SentimentRollup.score_sumsq,
+                SentimentRollup.count,
+            )
+            .where(*filters)
+            .order_by(SentimentRollup.bucket)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(statement)
+            return [tuple(row) for row in result.all()]
+
+
+# Singleton instance
+rollup_store = SentimentRollupStore()
@@ -1,6 +1,15 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from .schemas import SentimentAnalysisRequest, SentimentAnalysisResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
+import json
+from app.core.config import settings
+from .schemas import (
+    BatchFormat,
+    SentimentAnalysisRequest,
+    SentimentAnalysisResponse,
+    SentimentBatchResult,
+    SentimentTrendsResponse,
+)
 from .service import SentimentAnalysisService
 
 router = APIRouter()
@@ -18,29 +27,85 @@ async def analyze_sentiment(request: SentimentAnalysisRequest):
     try:
         result = await service.analyze(request)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/trends/{repository}")
-async def get_sentiment_trends(repository: str, days: int = 30):
+@router.get("/trends/{repository:path}", response_model=SentimentTrendsResponse)
+async def get_sentiment_trends(
+    repository: str,
+    days: int = Query(30, ge=1, le=settings.SENTIMENT_TRENDS_MAX_DAYS),
+    granularity: str = "day",
+    max_points: Optional[int] = Query(None, ge=1),
+):
     """
-    Get sentiment trends over time for a repository.
+    Get sentiment trends over time for a repository (`owner/name`).
+
+    One point per day or hour (`granularity`); `max_points` merges adjacent
+    buckets for long windows.
     """
     try:
-        trends = await service.get_trends(repository, days)
+        trends = await service.get_trends(repository, days, granularity, max_points)
         return trends
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _ndjson(results: AsyncIterator[SentimentBatchResult]) -> AsyncIterator[str]:
+    async for result in results:
+        yield result.model_dump_json() + "\n"
+
+
+async def _sse(results: AsyncIterator[SentimentBatchResult]) -> AsyncIterator[str]:
+    total = errors = 0
+    async for result in results:
+        total += 1
+        errors += result.status == "error"
+        yield f"event: result\ndata: {result.model_dump_json()}\n\n"
+    # Tells EventSource clients the batch is complete (instead of reconnecting)
+    yield f"event: done\ndata: {json.dumps({'total': total, 'errors': errors})}\n\n"
+
+
 @router.post("/batch-analyze")
-async def batch_analyze_sentiment(repositories: List[str]):
+async def batch_analyze_sentiment(
+    repositories: List[str],
+    time_period_days: int = 30,
+    format: BatchFormat = BatchFormat.NDJSON,
+):
     """
     Analyze sentiment for multiple repositories.
+
+    Repositories are analyzed concurrently (SENTIMENT_BATCH_MAX_CONCURRENCY
+    at a time) and each result is streamed as soon as it is ready, in
+    completion order, as NDJSON (default) or server-sent events
+    (`format=sse`). A failing repository is reported inline with
+    `status: "error"`. `format=json` returns everything at once instead.
     """
+    if not repositories:
+        raise HTTPException(status_code=400, detail="No repositories given")
+    if len(repositories) > settings.SENTIMENT_BATCH_MAX_REPOSITORIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.SENTIMENT_BATCH_MAX_REPOSITORIES} repositories per batch",
+        )
+
     try:
-        results = await service.batch_analyze(repositories)
-        return results
+        if format == BatchFormat.JSON:
+            return await service.batch_analyze(repositories, time_period_days)
+
+        results = service.iter_batch(repositories, time_period_days)
+        if format == BatchFormat.SSE:
+            return StreamingResponse(
+                _sse(results),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+        return StreamingResponse(_ndjson(results), media_type="application/x-ndjson")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
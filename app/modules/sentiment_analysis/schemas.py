@@ -33,7 +33,31 @@ class SentimentAnalysisResponse(BaseModel):
     time_period_days: int
 
 
+class BatchFormat(str, Enum):
+    NDJSON = "ndjson"
+    SSE = "sse"
+    JSON = "json"
+
+
+class SentimentBatchResult(BaseModel):
+    index: int  # position of the repository in the request
+    repository: str
+    status: str  # "ok" or "error"
+    result: Optional[SentimentAnalysisResponse] = None
+    error: Optional[str] = None
+
+
 class SentimentTrend(BaseModel):
-    date: str
-    sentiment_score: float
+    date: str  # bucket start (ISO 8601, UTC)
+    sentiment_score: float  # mean compound score
     interaction_count: int
+    stddev: float = 0.0
+
+
+class SentimentTrendsResponse(BaseModel):
+    repository: str
+    days: int
+    granularity: str  # "day" or "hour"
+    bucket_seconds: int  # width of each point after downsampling
+    trends: List[SentimentTrend]
+    complete: bool = True  # False while older events are still being scored in the background
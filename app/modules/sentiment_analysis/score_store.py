@@ -0,0 +1,176 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from collections import OrderedDict
+import hashlib
+import numpy as np
+from sqlalchemy import delete, select
+from app.shared.database import AsyncSessionLocal, dialect_insert, get_async_engine
+from app.shared.db_writer import db_writer
+from .models import SentimentScoreRecord
+
+# Hashes per lookup query (stays under SQLite's variable limit)
+CHUNK_SIZE = 500
+
+# Scores kept in process memory in front of the table (~200 bytes each)
+MEMORY_ENTRIES = 100_000
+
+Scorer = Callable[[List[str]], Awaitable[Tuple[np.ndarray, np.ndarray]]]
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase and collapse whitespace (for engines whose scores ignore both)."""
+    return " ".join((text or "").lower().split())
+
+
+def text_hash(version: str, text: Optional[str], normalize: bool = False) -> str:
+    """Score key of a text: sha256 of the engine version and the text, normalized if `normalize`."""
+    key = normalize_text(text) if normalize else text or ""
+    return hashlib.sha256(f"{version}\x00{key}".encode("utf-8", "replace")).hexdigest()
+
+
+def _insert_ignore_statement():
+    """Build a dialect-specific INSERT that skips hashes already stored (run with executemany)."""
+    statement = dialect_insert(SentimentScoreRecord)
+    if get_async_engine().dialect.name == "mysql":
+        return statement.prefix_with("IGNORE")
+    return statement.on_conflict_do_nothing(index_elements=["text_hash"])
+
+
+class SentimentScoreStore:
+    """
+    Persistent memo of per-text sentiment scores.
+
+    score() looks every text up by content hash, in a process-local LRU
+    and then the `sentiment_scores` table, and only hands texts it has
+    never seen (deduplicated) to the scorer, so re-analysing an active
+    repository costs only its new comments. The engine version is part of
+    the hash: bumping it makes every stored score unreachable, and the
+    first lookup with a new version deletes that engine's old rows.
+
+    Usage:
+    backend = sentiment_backends.select(len(texts))
+    scores, hits = await score_store.score(
+        texts, backend.score, backend.name, backend.version, backend.normalized_keys
+    )
+    """
+
+    def __init__(self, memory_entries: int = MEMORY_ENTRIES):
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._current: Set[Tuple[str, str]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, scored: Dict[str, Tuple[float, int]]) -> None:
+        self._memory.update(scored)
+        for key in scored:
+            self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _lookup(self, hashes: Sequence[str]) -> Dict[str, Tuple[float, int]]:
+        found: Dict[str, Tuple[float, int]] = {}
+        async with AsyncSessionLocal() as db:
+            for start in range(0, len(hashes), CHUNK_SIZE):
+                result = await db.execute(
+                    select(SentimentScoreRecord.text_hash, SentimentScoreRecord.score, SentimentScoreRecord.hits).where(
+                        SentimentScoreRecord.text_hash.in_(hashes[start:start + CHUNK_SIZE])
+                    )
+                )
+                found.update((key, (score, hits)) for key, score, hits in result)
+        return found
+
+    async def _save(self, engine: str, version: str, scored: Dict[str, Tuple[float, int]]) -> None:
+        rows = [
+            {"text_hash": key, "engine": engine, "engine_version": version, "score": score, "hits": hits}
+            for key, (score, hits) in scored.items()
+        ]
+
+        async def write(db):
+            # One statement compiled once, executed over all rows
+            await db.execute(_insert_ignore_statement(), rows)
+
+        if rows:
+            await db_writer.submit(write)
+
+    async def purge_stale(self, engine: str, version: str) -> None:
+        """Delete the engine's scores from versions other than `version`."""
+
+        async def purge(db):
+            await db.execute(
+                delete(SentimentScoreRecord).where(
+                    SentimentScoreRecord.engine == engine,
+                    SentimentScoreRecord.engine_version != version,
+                )
+            )
+
+        await db_writer.submit(purge)
+        self._current.add((engine, version))
+        # Memory keys are version-specific hashes; just let old ones age out
+
+    async def score(
+        self,
+        texts: Sequence[Optional[str]],
+        scorer: Scorer,
+        engine: str,
+        version: str,
+        normalize: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score texts, reusing memoized scores.
+
+        Args:
+            texts: Texts to score
+            scorer: Coroutine scoring a list of texts (compound scores, hits)
+            engine: Engine name
+            version: Engine version; scores of other versions are never used
+            normalize: Key texts by their normalized form (only for engines
+                whose scores ignore case and whitespace)
+
+        Returns:
+            (compound score per text, sentiment words per text), in input order
+        """
+        if not texts:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int32)
+        if (engine, version) not in self._current:
+            await self.purge_stale(engine, version)
+
+        keys = [text_hash(version, text, normalize) for text in texts]
+        found: Dict[str, Tuple[float, int]] = {}
+        unknown = []
+        for key in set(keys):
+            memorized = self._memory.get(key)
+            if memorized is None:
+                unknown.append(key)
+            else:
+                self._memory.move_to_end(key)
+                found[key] = memorized
+        if unknown:
+            stored = await self._lookup(unknown)
+            self._remember(stored)
+            found.update(stored)
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text or ""
+        self.hits += len(found)
+        self.misses += len(missing)
+
+        if missing:
+            scores, hits = await scorer(list(missing.values()))
+            scored = {
+                key: (float(score), int(count))
+                for key, score, count in zip(missing, scores.tolist(), hits.tolist())
+            }
+            await self._save(engine, version, scored)
+            self._remember(scored)
+            found.update(scored)
+
+        return (
+            np.fromiter((found[key][0] for key in keys), dtype=np.float32, count=len(keys)),
+            np.fromiter((found[key][1] for key in keys), dtype=np.int32, count=len(keys)),
+        )
+
+
+# Singleton instance
+score_store = SentimentScoreStore()
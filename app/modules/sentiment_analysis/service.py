@@ -1,82 +1,390 @@
 from .schemas import (
     SentimentAnalysisRequest,
     SentimentAnalysisResponse,
+    SentimentBatchResult,
     SentimentScore,
+    SentimentTrend,
+    SentimentTrendsResponse,
     SentimentType
 )
-from typing import List
+from .engine import SentimentEngine
+from .backends import SentimentBackend, sentiment_backends
+from .score_store import score_store
+from .rollups import GRANULARITIES, bucket_start, rollup_store
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import math
+import numpy as np
+from fastapi import HTTPException
+from app.core.config import settings
+from app.shared.analysis_cache import cached_analysis
+from app.shared.event_store import event_store, activity_events, EventType
+from sqlalchemy.exc import IntegrityError
+from app.shared.github_client import GitHubClient
+from app.shared.models import ContributionEvent
+from app.shared.utils import calculate_date_range, parse_github_repo, repository_name
+
+logger = logging.getLogger(__name__)
+
+# Events scored per step of a background rollup backfill: keeps the
+# model's queue short so requests are not pushed onto the fallback
+BACKFILL_BATCH_SIZE = 256
+
+# Running rollup backfills: (repository, engine version) -> task
+_backfills: Dict[Tuple[str, str], asyncio.Task] = {}
+
+# Event types feeding each breakdown category
+CATEGORIES: Dict[str, Tuple[EventType, ...]] = {
+    "pull_requests": (EventType.PULL_REQUEST,),
+    "issues": (EventType.ISSUE,),
+    "comments": (EventType.ISSUE_COMMENT, EventType.REVIEW),
+}
+
+def event_text(event_type: str, data: Optional[Dict]) -> str:
+    """Text of a contribution event: title and body, or the comment body."""
+    if not data:
+        return ""
+    if event_type in (EventType.PULL_REQUEST.value, EventType.ISSUE.value):
+        return f"{data.get('title') or ''}\n{data.get('body') or ''}"
+    return data.get("body") or ""
+
+
+def sentiment_score(scores: np.ndarray, hits: np.ndarray) -> SentimentScore:
+    """Aggregate per-item engine scores into a SentimentScore."""
+    summary = SentimentEngine.summarize(scores, hits)
+    return SentimentScore(
+        overall=SentimentType(summary["overall"]),
+        score=summary["score"],
+        confidence=summary["confidence"],
+    )
 
 
 class SentimentAnalysisService:
     """
     Service for analyzing sentiment in repository interactions.
 
-    TODO: Implement sentiment analysis using:
-    - Natural Language Processing (NLP) libraries
-    - Pre-trained sentiment models
-    - Custom training on GitHub data
+    Texts come from the contribution event store (falling back to a live
+    GitHub fetch for repositories not synced yet) and are scored in one
+    batch by the active backend (see backends.py): the vectorized lexicon
+    engine, or a transformer model once it is loaded.
     """
 
+    async def _load_texts(self, request: SentimentAnalysisRequest) -> Dict[str, List[str]]:
+        """Texts per breakdown category for the request's repository, user and window."""
+        categories = [
+            category
+            for category, included in (
+                ("pull_requests", request.include_prs),
+                ("issues", request.include_issues),
+                ("comments", request.include_comments),
+            )
+            if included
+        ]
+        event_types = [event_type for category in categories for event_type in CATEGORIES[category]]
+        texts: Dict[str, List[str]] = {category: [] for category in CATEGORIES}
+        if not event_types:
+            return texts
+
+        since, until = calculate_date_range(request.time_period_days or 30)
+        # Events are keyed by owner/name, however the repository was given
+        repository = repository_name(request.repository)
+        rows = await event_store.query_columns(
+            (ContributionEvent.event_type, ContributionEvent.data),
+            repository=repository,
+            author=request.username,
+            since=since,
+            until=until,
+            event_types=event_types,
+        )
+        if not rows and not await event_store.count_by_type(repository=repository):
+            # Never ingested: fetch once. A quiet window or user of a synced repository is just empty.
+            rows = await self._fetch_live(request, since, until, event_types)
+
+        category_of = {
+            event_type.value: category
+            for category, event_types in CATEGORIES.items()
+            for event_type in event_types
+        }
+        for event_type, data in rows:
+            texts[category_of[event_type]].append(event_text(event_type, data))
+        return texts
+
+    async def _fetch_live(self, request: SentimentAnalysisRequest, since, until, event_types) -> List[tuple]:
+        """Fetch the window from GitHub and keep it in the event store for next time."""
+        repository = repository_name(request.repository)
+        owner, repo = parse_github_repo(repository)
+        activity = await GitHubClient().fetch_repo_activity(owner, repo, since=since, until=until)
+        events = activity_events(repository, activity)
+        await event_store.upsert(events)
+        wanted = {EventType(event_type).value for event_type in event_types}
+        return [
+            (event["event_type"], event["data"])
+            for event in events
+            if event["event_type"] in wanted
+            and (request.username is None or event["author"] == request.username)
+        ]
+
+    @cached_analysis("sentiment_analysis", SentimentAnalysisResponse)
     async def analyze(self, request: SentimentAnalysisRequest) -> SentimentAnalysisResponse:
         """
         Analyze sentiment for repository interactions.
 
-        TEAM MEMBER: Implement your sentiment analysis algorithm here.
-        Consider using libraries like:
-        - transformers (Hugging Face)
-        - textblob
-        - vader-sentiment
+        All texts are scored as one corpus by the selected backend, reusing
+        memoized scores of texts seen before; the overall score and each
+        category of the breakdown aggregate the per-item scores.
         """
-        # Placeholder implementation
+        texts = await self._load_texts(request)
+        corpus = [text for category in CATEGORIES for text in texts[category]]
+        scores, hits = await self.score(corpus)
+
+        breakdown = {}
+        offset = 0
+        for category in CATEGORIES:
+            size = len(texts[category])
+            breakdown[category] = sentiment_score(scores[offset:offset + size], hits[offset:offset + size])
+            offset += size
+
         return SentimentAnalysisResponse(
             repository=request.repository,
-            sentiment=SentimentScore(
-                overall=SentimentType.NEUTRAL,
-                score=0.0,
-                confidence=0.0
-            ),
-            breakdown={
-                "pull_requests": SentimentScore(
-                    overall=SentimentType.NEUTRAL,
-                    score=0.0,
-                    confidence=0.0
-                ),
-                "issues": SentimentScore(
-                    overall=SentimentType.NEUTRAL,
-                    score=0.0,
-                    confidence=0.0
-                ),
-                "comments": SentimentScore(
-                    overall=SentimentType.NEUTRAL,
-                    score=0.0,
-                    confidence=0.0
-                )
-            },
-            total_interactions=0,
+            sentiment=sentiment_score(scores, hits),
+            breakdown=breakdown,
+            total_interactions=len(corpus),
             time_period_days=request.time_period_days or 30
         )
 
-    async def get_trends(self, repository: str, days: int):
+    async def score(
+        self, texts: List[str], backend: Optional[SentimentBackend] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score texts with the selected backend, reusing memoized scores."""
+        backend = backend or sentiment_backends.select(len(texts))
+        return await score_store.score(texts, backend.score, backend.name, backend.version, backend.normalized_keys)
+
+    async def refresh_rollups(
+        self,
+        repository: str,
+        backend: Optional[SentimentBackend] = None,
+        batch_size: int = 5000,
+        max_events: Optional[int] = None,
+    ) -> int:
+        """
+        Add the repository's not yet counted events to its trend rollups.
+
+        Args:
+            repository: Repository (owner/name)
+            backend: Backend whose rollups are refreshed (default: the active one)
+            batch_size: Events scored per step
+            max_events: Stop after adding this many events (None: all)
+
+        Returns:
+            Number of events added
+        """
+        # Rollups of one version must not mix backends: no overload fallback here
+        backend = backend or sentiment_backends.active()
+        event_types = [event_type.value for types in CATEGORIES.values() for event_type in types]
+        added = 0
+        while max_events is None or added < max_events:
+            limit = batch_size if max_events is None else min(batch_size, max_events - added)
+            events = await rollup_store.pending(repository, backend.name, backend.version, event_types, limit=limit)
+            if not events:
+                return added
+            texts = [event_text(event_type, data) for _, event_type, _, data in events]
+            scores, _ = await self.score(texts, backend)
+            try:
+                await rollup_store.add(repository, backend.name, backend.version, events, scores)
+            except IntegrityError:
+                # Counted concurrently by another worker; pending() now skips them
+                continue
+            added += len(events)
+        return added
+
+    def _start_backfill(self, repository: str, backend: SentimentBackend) -> None:
+        """Start scoring a repository's remaining events into a backend's rollups, unless running."""
+        key = (repository, backend.version)
+        if key not in _backfills:
+            task = asyncio.create_task(self._backfill(repository, backend))
+            _backfills[key] = task
+            task.add_done_callback(lambda _: _backfills.pop(key, None))
+
+    async def _refresh_bounded(self, repository: str, backend: SentimentBackend) -> bool:
+        """
+        Refresh rollups with at most SENTIMENT_TRENDS_INLINE_EVENTS events; the rest in the background.
+
+        Returns:
+            Whether the rollups are up to date
+        """
+        limit = settings.SENTIMENT_TRENDS_INLINE_EVENTS
+        if (repository, backend.version) in _backfills:
+            return False
+        if await self.refresh_rollups(repository, backend, max_events=limit) < limit:
+            return True
+        self._start_backfill(repository, backend)
+        return False
+
+    def _trends_backend(self, repository: str) -> SentimentBackend:
+        """
+        Backend whose rollups serve a repository's trends.
+
+        A newly active model's rollups are backfilled in a background task;
+        until it has caught up, the fallback's rollups are served instead.
+        """
+        backend = sentiment_backends.active()
+        if backend is sentiment_backends.fallback or rollup_store.is_complete(repository, backend.version):
+            return backend
+        self._start_backfill(repository, backend)
+        return sentiment_backends.fallback
+
+    async def _backfill(self, repository: str, backend: SentimentBackend) -> None:
+        """Score a repository's history into a backend's rollups in small steps."""
+        try:
+            added = await self.refresh_rollups(repository, backend, batch_size=BACKFILL_BATCH_SIZE)
+            logger.info("Backfilled %d %s rollup events of %s", added, backend.version, repository)
+        except Exception as exc:
+            logger.error("Backfilling %s rollups of %s failed: %s", backend.version, repository, exc)
+
+    async def get_trends(
+        self,
+        repository: str,
+        days: int,
+        granularity: str = "day",
+        max_points: Optional[int] = None,
+    ) -> SentimentTrendsResponse:
         """
         Get sentiment trends over time.
 
-        TEAM MEMBER: Implement trend analysis here.
+        Served from the daily / hourly rollups, brought up to date first
+        (only new events are scored, newest first and a bounded number per
+        request; see _refresh_bounded), so the cost does not depend on the
+        window length. Buckets without interactions are included with a
+        zero count; with `max_points` (at most SENTIMENT_TRENDS_MAX_POINTS),
+        adjacent buckets are merged so the series has at most that many
+        points.
         """
-        # Placeholder implementation
-        return {
-            "repository": repository,
-            "trends": [],
-            "days": days
-        }
+        if granularity not in GRANULARITIES:
+            raise HTTPException(status_code=400, detail=f"granularity must be one of {sorted(GRANULARITIES)}")
+        if not 1 <= days <= settings.SENTIMENT_TRENDS_MAX_DAYS:
+            raise HTTPException(
+                status_code=400, detail=f"days must be between 1 and {settings.SENTIMENT_TRENDS_MAX_DAYS}"
+            )
+        max_points = min(max_points or settings.SENTIMENT_TRENDS_MAX_POINTS, settings.SENTIMENT_TRENDS_MAX_POINTS)
+        try:
+            repository = repository_name(repository)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+        # One backend for refresh and read, even if a model finishes loading meanwhile
+        backend = self._trends_backend(repository)
+        complete = await self._refresh_bounded(repository, backend)
+        version = backend.version
+        width = GRANULARITIES[granularity]
+        last = bucket_start(datetime.utcnow(), granularity)
+        since = bucket_start(last - timedelta(days=days) + timedelta(seconds=width), granularity)
+        buckets = await rollup_store.series(repository, granularity, version, since)
+        if not buckets and not await event_store.count_by_type(repository=repository):
+            # Not synced yet: fetch the window once, then serve it from rollups
+            request = SentimentAnalysisRequest(repository=repository, time_period_days=days)
+            await self._fetch_live(request, since, datetime.utcnow(), [])
+            complete = await self._refresh_bounded(repository, backend)
+            buckets = await rollup_store.series(repository, granularity, version, since)
 
-    async def batch_analyze(self, repositories: List[str]):
+        # Dense arrays over the window, one slot per bucket
+        size = int((last - since).total_seconds()) // width + 1
+        sums = np.zeros(size)
+        sumsqs = np.zeros(size)
+        counts = np.zeros(size, dtype=np.int64)
+        for bucket, total, squares, count in buckets:
+            index = int((bucket - since).total_seconds()) // width
+            if 0 <= index < size:
+                sums[index], sumsqs[index], counts[index] = total, squares, count
+
+        # Sums are additive: merge groups of adjacent buckets to downsample
+        group = max(1, math.ceil(size / max_points))
+        if group > 1:
+            padding = (-size) % group
+            sums, sumsqs, counts = (
+                np.pad(values, (0, padding)).reshape(-1, group).sum(axis=1)
+                for values in (sums, sumsqs, counts)
+            )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(counts > 0, sums / counts, 0.0)
+            variances = np.where(counts > 0, sumsqs / counts - means * means, 0.0)
+        stddevs = np.sqrt(np.clip(variances, 0.0, None))
+
+        step = timedelta(seconds=width * group)
+        trends = [
+            SentimentTrend(
+                date=(since + step * index).isoformat() + "Z",
+                sentiment_score=round(float(means[index]), 4),
+                interaction_count=int(counts[index]),
+                stddev=round(float(stddevs[index]), 4),
+            )
+            for index in range(len(counts))
+        ]
+        return SentimentTrendsResponse(
+            repository=repository,
+            days=days,
+            granularity=granularity,
+            bucket_seconds=width * group,
+            trends=trends,
+            complete=complete,
+        )
+
+    async def _analyze_one(self, index: int, repository: str, time_period_days: int) -> SentimentBatchResult:
+        """Analyze one repository of a batch, reporting failure as a result."""
+        try:
+            result = await self.analyze(
+                SentimentAnalysisRequest(repository=repository, time_period_days=time_period_days)
+            )
+            return SentimentBatchResult(index=index, repository=repository, status="ok", result=result)
+        except HTTPException as e:
+            error = str(e.detail)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        return SentimentBatchResult(index=index, repository=repository, status="error", error=error)
+
+    async def iter_batch(
+        self,
+        repositories: List[str],
+        time_period_days: int = 30,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[SentimentBatchResult]:
         """
-        Analyze multiple repositories in batch.
+        Analyze repositories concurrently, yielding each result as soon as
+        it is ready (completion order; `index` gives the request position).
 
-        TEAM MEMBER: Implement batch processing here.
+        At most `max_concurrency` repositories are in flight. A failing
+        repository yields an error result instead of ending the batch.
+        Closing the iterator early (client gone) cancels the remaining work.
+        """
+        limit = max_concurrency or settings.SENTIMENT_BATCH_MAX_CONCURRENCY
+        pending = iter(enumerate(repositories))
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            # Workers share one iterator, so each repository is taken once
+            for index, repository in pending:
+                results.put_nowait(await self._analyze_one(index, repository, time_period_days))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(limit, len(repositories)))]
+        try:
+            for _ in range(len(repositories)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def batch_analyze(self, repositories: List[str], time_period_days: int = 30):
+        """
+        Analyze multiple repositories and return all results at once, in
+        request order (see iter_batch for streaming).
         """
-        # Placeholder implementation
+        results = [result async for result in self.iter_batch(repositories, time_period_days)]
+        results.sort(key=lambda result: result.index)
         return {
             "repositories": repositories,
-            "results": []
+            "results": results,
+            "errors": sum(result.status == "error" for result in results),
         }
@@ -19,6 +19,8 @@ async def generate_profile(request: ProfileRequest):
     try:
         result = await service.generate_profile(request)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -47,6 +49,8 @@ async def update_profile(username: str, request: ProfileUpdateRequest):
     try:
         profile = await service.update_profile(username, request)
         return profile
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -59,6 +63,8 @@ async def get_public_profile(username: str):
     try:
         html = await service.get_public_html(username)
         return html
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -88,5 +94,7 @@ async def delete_profile(username: str):
     try:
         result = await service.delete_profile(username)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
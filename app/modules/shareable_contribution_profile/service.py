@@ -8,6 +8,9 @@ from .schemas import (
 )
 from datetime import datetime
 import uuid
+from app.core.config import settings
+from app.shared.cache import cache_service
+from app.shared.utils import generate_cache_key
 
 
 class ShareableProfileService:
@@ -64,11 +67,29 @@ class ShareableProfileService:
         """
         Retrieve existing profile.
 
+        Served through the two-tier cache with stale-while-revalidate, so
+        hot profiles stay fast under burst traffic.
+        """
+        return await cache_service.get_or_set(
+            generate_cache_key("profile", username),
+            lambda: self._load_profile(username),
+            ttl=settings.PROFILE_CACHE_TTL,
+        )
+
+    async def _load_profile(self, username: str):
+        """
+        Load a profile from storage.
+
         TEAM MEMBER: Implement profile retrieval from database.
+        Return a JSON-compatible dict (it is cached).
         """
         # Placeholder implementation
         return None
 
+    async def _invalidate(self, username: str) -> None:
+        """Drop a profile's cached copy (including a stale one) after it changes."""
+        await cache_service.delete(generate_cache_key("profile", username))
+
     async def update_profile(self, username: str, request: ProfileUpdateRequest):
         """
         Update profile information.
@@ -76,6 +97,8 @@ class ShareableProfileService:
         TEAM MEMBER: Implement profile updates.
         """
         # Placeholder implementation
+        # After a successful write, drop the cached copy so get_profile reloads it
+        await self._invalidate(username)
         return {
             "username": username,
             "updated": True,
@@ -123,6 +146,7 @@ class ShareableProfileService:
         TEAM MEMBER: Implement profile deletion.
         """
         # Placeholder implementation
+        await self._invalidate(username)
         return {
             "username": username,
             "deleted": True
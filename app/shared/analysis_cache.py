@@ -0,0 +1,213 @@
+from typing import Optional, Any, Type
+from datetime import datetime, timedelta
+import functools
+import time
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.shared.cache import cache_service
+from app.shared.database import AsyncSessionLocal
+from app.shared.db_writer import db_writer
+from app.shared.models import AnalysisCache, CacheGeneration
+from app.shared.single_flight import single_flight
+from app.shared.utils import generate_request_cache_key
+
+
+class AnalysisCacheService:
+    """
+    Read-through cache for module analysis results.
+
+    Lookups go memory (L1) -> shared cache -> `analysis_cache` table ->
+    compute, and computed results are written back to every tier, so
+    they survive restarts. Concurrent identical misses are coalesced.
+
+    Invalidation by module or user deletes the table rows and bumps a
+    generation marker that is part of every cache key, so stale cached
+    entries become unreachable (other workers see it within CACHE_L1_TTL).
+    Markers are persisted in `cache_generations`; the cache only holds
+    copies, so an evicted marker is reloaded rather than reset.
+
+    Usage:
+    @cached_analysis("sentiment_analysis", SentimentAnalysisResponse)
+    async def analyze(self, request: SentimentAnalysisRequest): ...
+
+    await analysis_cache.invalidate_user("octocat")
+    """
+
+    def ttl_for(self, module: str) -> int:
+        """Get the configured TTL for a module's results."""
+        return settings.ANALYSIS_CACHE_TTLS.get(module, settings.ANALYSIS_CACHE_DEFAULT_TTL)
+
+    @staticmethod
+    def _generation_keys(module: str, username: Optional[str]) -> list:
+        keys = [f"analysis:generation:module:{module}"]
+        if username:
+            keys.append(f"analysis:generation:user:{username}")
+        return keys
+
+    async def _generation(self, module: str, username: Optional[str]) -> str:
+        keys = self._generation_keys(module, username)
+        found = await cache_service.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(CacheGeneration.key, CacheGeneration.value).where(CacheGeneration.key.in_(missing))
+                )
+                stored = dict(result.all())
+            for key in missing:
+                found[key] = stored.get(key, 0)
+                # Only if absent: never overwrite a concurrent bump with the older value
+                await cache_service.add(key, found[key], ttl=None)
+        return ".".join(str(found[key]) for key in keys)
+
+    async def _bump(self, key: str) -> None:
+        value = time.time_ns()
+
+        async def write(db: AsyncSession) -> None:
+            result = await db.execute(select(CacheGeneration).where(CacheGeneration.key == key))
+            row = result.scalar_one_or_none()
+            if row is None:
+                row = CacheGeneration(key=key, value=value)
+                db.add(row)
+            row.value = value
+            await db.flush()
+
+        await db_writer.submit(write)
+        await cache_service.set(key, value, ttl=None)
+
+    # Database tier
+
+    async def _db_get(self, cache_key: str) -> Optional[AnalysisCache]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(AnalysisCache).where(
+                    AnalysisCache.cache_key == cache_key,
+                    AnalysisCache.expires_at > datetime.utcnow(),
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def _db_set(self, cache_key: str, module: str, username: Optional[str], data: Any, ttl: int) -> None:
+        async def write(db: AsyncSession) -> None:
+            result = await db.execute(
+                select(AnalysisCache).where(AnalysisCache.cache_key == cache_key)
+            )
+            row = result.scalar_one_or_none()
+            if row is None:
+                row = AnalysisCache(cache_key=cache_key)
+                db.add(row)
+            row.module = module
+            row.username = username
+            row.data = data
+            row.expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+            await db.flush()
+
+        await db_writer.submit(write)
+
+    async def _db_delete(self, *conditions) -> int:
+        async def write(db: AsyncSession) -> int:
+            result = await db.execute(delete(AnalysisCache).where(*conditions))
+            return result.rowcount
+
+        return await db_writer.submit(write)
+
+    async def get_or_compute(
+        self,
+        module: str,
+        cache_key: str,
+        username: Optional[str],
+        response_model: Type[BaseModel],
+        compute,
+        ttl: Optional[int] = None,
+    ) -> BaseModel:
+        """
+        Get a cached result or compute and store it.
+
+        Args:
+            module: Module owning the result
+            cache_key: Key of the result (without generation marker)
+            username: Subject user, for invalidation
+            response_model: Pydantic model the result is validated into
+            compute: Zero-argument coroutine factory returning the model
+            ttl: Seconds to keep the result (defaults to the module TTL)
+        """
+        ttl = ttl or self.ttl_for(module)
+        generation = await self._generation(module, username)
+        tiered_key = f"{cache_key}:generation={generation}"
+
+        data = await cache_service.get(tiered_key)
+        if data is not None:
+            return response_model.model_validate(data)
+
+        async def load() -> BaseModel:
+            row = await self._db_get(cache_key)
+            if row is not None:
+                remaining = int((row.expires_at - datetime.utcnow()).total_seconds())
+                await cache_service.set(tiered_key, row.data, ttl=max(remaining, 1))
+                return response_model.model_validate(row.data)
+
+            result = await compute()
+            data = result.model_dump(mode="json")
+            await cache_service.set(tiered_key, data, ttl=ttl)
+            await self._db_set(cache_key, module, username, data, ttl)
+            return result
+
+        return await single_flight.do(tiered_key, load)
+
+    def cached(self, module: str, response_model: Type[BaseModel], ttl: Optional[int] = None):
+        """
+        Decorator caching the result of an async service method.
+
+        The key is derived with generate_request_cache_key from the
+        arguments after `self`; a `username` argument or request field
+        enables invalidation by user.
+        """
+        def decorator(method):
+            @functools.wraps(method)
+            async def wrapper(self_, *args, **kwargs):
+                cache_key = generate_request_cache_key(f"analysis:{module}", *args, **kwargs)
+                username = kwargs.get("username")
+                for arg in args:
+                    if isinstance(arg, BaseModel):
+                        username = getattr(arg, "username", None) or username
+                return await self.get_or_compute(
+                    module,
+                    cache_key,
+                    username,
+                    response_model,
+                    lambda: method(self_, *args, **kwargs),
+                    ttl,
+                )
+            return wrapper
+        return decorator
+
+    async def invalidate_module(self, module: str) -> int:
+        """
+        Invalidate every cached result of a module.
+
+        Returns:
+            Number of persisted rows removed
+        """
+        await self._bump(self._generation_keys(module, None)[0])
+        return await self._db_delete(AnalysisCache.module == module)
+
+    async def invalidate_user(self, username: str) -> int:
+        """
+        Invalidate every cached result about a user, across modules.
+
+        Returns:
+            Number of persisted rows removed
+        """
+        await self._bump(f"analysis:generation:user:{username}")
+        return await self._db_delete(AnalysisCache.username == username)
+
+    async def purge_expired(self) -> int:
+        """Delete expired rows from the analysis_cache table."""
+        return await self._db_delete(AnalysisCache.expires_at <= datetime.utcnow())
+
+
+# Singleton instance
+analysis_cache = AnalysisCacheService()
+cached_analysis = analysis_cache.cached
@@ -1,57 +1,212 @@
-from typing import Optional, Any
-import json
-from datetime import timedelta
+from typing import Optional, Any, Dict, List, Callable, Awaitable, Set
+import asyncio
+import logging
+import math
+import random
+import time
+from app.core.config import settings
+from app.shared.cache_backends import CacheBackend, MemoryCacheBackend, create_cache_backend, create_l1_backend
+from app.shared.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
 
 
 class CacheService:
     """
     Shared caching service for all modules.
 
-    TODO: Implement using Redis or similar caching backend.
-    This is a placeholder implementation using in-memory dict.
+    Delegates storage to a pluggable CacheBackend selected by
+    settings.CACHE_BACKEND: "memory" (per-process LRU with TTLs) or
+    "redis" (shared across uvicorn/gunicorn workers). Cached values
+    should be JSON-compatible so every backend can store them.
+
+    With a shared backend, a small in-process L1 sits in front of it
+    (two tiers): hot keys are served without a network hop for up to
+    CACHE_L1_TTL seconds.
 
     Usage:
     cache = CacheService()
     await cache.set("key", data, ttl=3600)
     data = await cache.get("key")
+
+    # Read-through with stampede protection and stale-while-revalidate
+    data = await cache.get_or_set("key", lambda: compute(), ttl=300)
     """
 
-    def __init__(self):
-        # Placeholder: In production, use Redis
-        self._cache: dict = {}
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        l1: Optional[MemoryCacheBackend] = None,
+        l1_ttl: int = settings.CACHE_L1_TTL,
+    ):
+        self.backend = backend or create_cache_backend()
+        self.l1 = l1
+        self.l1_ttl = l1_ttl
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        return min(ttl, self.l1_ttl) if ttl else self.l1_ttl
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        return self._cache.get(key)
+        if self.l1 is not None:
+            value = await self.l1.get(key)
+            if value is not None:
+                return value
+        value = await self.backend.get(key)
+        if value is not None and self.l1 is not None:
+            await self.l1.set(key, value, self.l1_ttl)
+        return value
 
-    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+    async def set(self, key: str, value: Any, ttl: Optional[int] = 3600) -> bool:
         """
         Set value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
-            ttl: Time to live in seconds
+            ttl: Time to live in seconds (None or 0 never expires)
+        """
+        if self.l1 is not None:
+            await self.l1.set(key, value, self._l1_ttl(ttl))
+        return await self.backend.set(key, value, ttl)
+
+    async def add(self, key: str, value: Any, ttl: Optional[int] = 3600) -> bool:
+        """
+        Set value only if the key is absent in the shared backend.
+
+        Returns:
+            True if the value was set (usable as a cross-worker lock)
+        """
+        return await self.backend.add(key, value, ttl)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """
-        self._cache[key] = value
-        return True
+        Get several values at once.
+
+        Returns:
+            Dict of the keys that were found
+        """
+        found: Dict[str, Any] = {}
+        if self.l1 is not None:
+            found = await self.l1.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            from_backend = await self.backend.get_many(missing)
+            if from_backend and self.l1 is not None:
+                await self.l1.set_many(from_backend, self.l1_ttl)
+            found.update(from_backend)
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = 3600) -> bool:
+        """Set several values with the same TTL."""
+        if self.l1 is not None:
+            await self.l1.set_many(items, self._l1_ttl(ttl))
+        return await self.backend.set_many(items, ttl)
 
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        if self.l1 is not None:
+            await self.l1.delete(key)
+        return await self.backend.delete(key)
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        return key in self._cache
+        if self.l1 is not None and await self.l1.exists(key):
+            return True
+        return await self.backend.exists(key)
 
     async def clear(self) -> bool:
         """Clear all cache."""
-        self._cache.clear()
-        return True
+        if self.l1 is not None:
+            await self.l1.clear()
+        return await self.backend.clear()
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: int = 3600,
+        stale_ttl: int = settings.CACHE_STALE_TTL,
+        beta: float = settings.CACHE_EARLY_REFRESH_BETA,
+    ) -> Any:
+        """
+        Read-through cache with stampede protection.
+
+        - Miss: `factory` runs once per process (concurrent callers share it).
+        - Fresh hit: returned as is, but refreshed early in the background
+          with a probability that grows as expiry approaches (XFetch).
+        - Stale hit (up to `stale_ttl` seconds past `ttl`): the old value is
+          returned while one background task refreshes it. A lock in the
+          shared backend keeps other workers from refreshing it too.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument coroutine factory computing the value
+            ttl: Seconds the value is fresh
+            stale_ttl: Extra seconds a stale value may be served
+            beta: Early refresh eagerness (0 disables it)
+        """
+        envelope = await self.get(key)
+        if envelope is not None:
+            now = time.time()
+            fresh_until = envelope["fresh_until"]
+            # XFetch: -log(U) is exponentially distributed, scaled by recompute time
+            early = envelope["delta"] * beta * -math.log(1.0 - random.random())
+            if now + early >= fresh_until:
+                self._refresh_in_background(key, factory, ttl, stale_ttl)
+            return envelope["value"]
+
+        return await single_flight.do(
+            f"cache:fill:{key}", lambda: self._fill(key, factory, ttl, stale_ttl)
+        )
+
+    async def _fill(self, key: str, factory: Callable[[], Awaitable[Any]], ttl: int, stale_ttl: int) -> Any:
+        started = time.monotonic()
+        value = await factory()
+        envelope = {
+            "value": value,
+            "fresh_until": time.time() + ttl,
+            "delta": time.monotonic() - started,
+        }
+        await self.set(key, envelope, ttl=ttl + stale_ttl)
+        return value
+
+    def _refresh_in_background(
+        self, key: str, factory: Callable[[], Awaitable[Any]], ttl: int, stale_ttl: int
+    ) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, factory, ttl, stale_ttl))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, key: str, factory: Callable[[], Awaitable[Any]], ttl: int, stale_ttl: int) -> None:
+        lock_key = f"lock:{key}"
+        try:
+            if await self.backend.add(lock_key, 1, settings.CACHE_REFRESH_LOCK_TTL):
+                try:
+                    await self._fill(key, factory, ttl, stale_ttl)
+                finally:
+                    await self.backend.delete(lock_key)
+        except Exception:
+            logger.exception("Background refresh failed for cache key %s", key)
+        finally:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters for monitoring."""
+        stats = self.backend.stats()
+        if self.l1 is not None:
+            stats["l1"] = self.l1.stats()
+        return stats
+
+    async def close(self) -> None:
+        """Close backend connections. Call this on application shutdown."""
+        await self.backend.close()
 
 
 # Singleton instance
-cache_service = CacheService()
+cache_service = CacheService(create_cache_backend(), l1=create_l1_backend())
@@ -0,0 +1,344 @@
+from typing import Optional, Any, Dict, List, Tuple
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import json
+import time
+import zlib
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Serialization header bytes for values stored in shared backends
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 1024
+
+
+def serialize(value: Any, compress_min_bytes: int = 1024) -> bytes:
+    """
+    Encode a JSON-compatible value for a shared backend.
+
+    Uses orjson when installed, and zlib-compresses payloads of at least
+    `compress_min_bytes` (0 disables compression).
+    """
+    if orjson is not None:
+        payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(value, default=str, separators=(",", ":")).encode()
+    if compress_min_bytes and len(payload) >= compress_min_bytes:
+        return _ZLIB + zlib.compress(payload, 1)
+    return _RAW + payload
+
+
+def deserialize(data: bytes) -> Any:
+    """Decode a value written by serialize()."""
+    header, payload = data[:1], data[1:]
+    if header == _ZLIB:
+        payload = zlib.decompress(payload)
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface behind CacheService.
+
+    Implementations must be safe to share between coroutines. Values
+    should be JSON-compatible so any backend can store them.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value, or None when missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value; ttl of None or 0 never expires."""
+
+    @abstractmethod
+    async def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value only if the key is absent; True if it was set."""
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get the keys that were found."""
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values with the same TTL."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete key; True if it existed."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check if a live key exists."""
+
+    @abstractmethod
+    async def clear(self) -> bool:
+        """Remove every key owned by this backend."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters for monitoring."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    async def close(self) -> None:
+        """Release connections. Call this on application shutdown."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Per-process LRU cache with per-entry TTL.
+
+    Bounded by entry count and approximate byte size; the least recently
+    used entries are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024):
+        super().__init__()
+        # key -> (value, expires_at or None, size in bytes), oldest first
+        self._cache: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        """Find a live entry, dropping it if expired and refreshing its LRU position."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._cache.pop(key)
+        self._bytes -= size
+
+    def _store(self, key: str, value: Any, ttl: Optional[int]) -> None:
+        if key in self._cache:
+            self._remove(key)
+        size = _estimate_size(value)
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._cache[key] = (value, expires_at, size)
+        self._bytes += size
+        while self._cache and (len(self._cache) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def get(self, key: str) -> Optional[Any]:
+        _, value = self._lookup(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        self._store(key, value, ttl)
+        return True
+
+    async def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        if await self.exists(key):
+            return False
+        self._store(key, value, ttl)
+        return True
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        found = {}
+        for key in keys:
+            hit, value = self._lookup(key)
+            if hit:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        for key, value in items.items():
+            self._store(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        if key in self._cache:
+            self._remove(key)
+            return True
+        return False
+
+    async def exists(self, key: str) -> bool:
+        entry = self._cache.get(key)
+        return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    async def clear(self) -> bool:
+        self._cache.clear()
+        self._bytes = 0
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "entries": len(self._cache),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis cache shared by every worker process.
+
+    Values are serialized with orjson (zlib-compressed above a size
+    threshold), multi-key operations are pipelined, and connections come
+    from a bounded pool. Keys are namespaced with `prefix` so clear()
+    only touches this application's keys.
+
+    Pass `client` to use an existing redis.asyncio client (e.g. fakeredis).
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        prefix: str = "mdash:",
+        max_connections: int = 50,
+        compress_min_bytes: int = 1024,
+        client: Any = None,
+    ):
+        super().__init__()
+        if client is None:
+            # Optional dependency: only required when this backend is selected
+            import redis.asyncio as redis
+
+            pool = redis.ConnectionPool.from_url(url, max_connections=max_connections)
+            client = redis.Redis(connection_pool=pool)
+        self._redis = client
+        self.prefix = prefix
+        self.compress_min_bytes = compress_min_bytes
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _encode(self, value: Any) -> bytes:
+        return serialize(value, self.compress_min_bytes)
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self._redis.get(self._key(key))
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return deserialize(data)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        await self._redis.set(self._key(key), self._encode(value), ex=ttl or None)
+        return True
+
+    async def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        return bool(await self._redis.set(self._key(key), self._encode(value), ex=ttl or None, nx=True))
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        values = await self._redis.mget([self._key(key) for key in keys])
+        found = {}
+        for key, data in zip(keys, values):
+            if data is not None:
+                found[key] = deserialize(data)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        if not items:
+            return True
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(self._key(key), self._encode(value), ex=ttl or None)
+            await pipe.execute()
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self._redis.delete(self._key(key)))
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self._redis.exists(self._key(key)))
+
+    async def clear(self) -> bool:
+        batch = []
+        async for key in self._redis.scan_iter(match=f"{self.prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self._redis.delete(*batch)
+                batch = []
+        if batch:
+            await self._redis.delete(*batch)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def create_l1_backend() -> Optional[MemoryCacheBackend]:
+    """
+    Build the in-process L1 placed in front of a shared backend.
+
+    Returns None when the main backend is already in-process or the L1 is
+    disabled (CACHE_L1_MAX_ENTRIES=0).
+    """
+    if settings.CACHE_BACKEND == "memory" or settings.CACHE_L1_MAX_ENTRIES <= 0:
+        return None
+    return MemoryCacheBackend(
+        max_entries=settings.CACHE_L1_MAX_ENTRIES,
+        max_bytes=settings.CACHE_L1_MAX_BYTES,
+    )
+
+
+def create_cache_backend(name: str = settings.CACHE_BACKEND) -> CacheBackend:
+    """
+    Build the cache backend selected in settings.
+
+    Args:
+        name: "memory" or "redis"
+    """
+    if name == "memory":
+        return MemoryCacheBackend(
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            max_bytes=settings.CACHE_MAX_BYTES,
+        )
+    if name == "redis":
+        return RedisCacheBackend(
+            url=settings.REDIS_URL,
+            prefix=settings.CACHE_KEY_PREFIX,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+        )
+    raise ValueError(f"Unknown cache backend: {name}")
@@ -0,0 +1,100 @@
+from typing import Optional, Dict, Any
+import hashlib
+import httpx
+from app.core.config import settings
+from app.shared.cache import cache_service, CacheService
+from app.shared.utils import generate_cache_key
+
+# Stored response headers that are replayed when GitHub answers 304
+_REPLAYED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+class ConditionalRequestCache:
+    """
+    ETag / Last-Modified store for GitHub GET responses.
+
+    Keeps the validators and body of each response keyed by URL and query,
+    so the next identical request can be sent conditionally. GitHub answers
+    304 Not Modified when nothing changed, and 304s do not count against
+    the rate limit.
+
+    Usage:
+    entry = await conditional_cache.get(key)
+    headers.update(conditional_cache.conditional_headers(entry))
+    ...
+    if response.status_code == 304:
+        response = conditional_cache.replay(entry, response)
+    """
+
+    def __init__(self, cache: CacheService, ttl: int = 86400):
+        self._cache = cache
+        self.ttl = ttl
+
+    def key_for(self, url: str, params: Optional[Dict] = None, token: str = "") -> str:
+        """
+        Build the store key for a request.
+
+        The token is hashed into the key so responses visible to one
+        credential are never replayed to another.
+        """
+        identity = hashlib.sha256(token.encode()).hexdigest()[:12] if token else "anonymous"
+        return generate_cache_key("github:conditional", identity, url, **(params or {}))
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the stored entry for a key."""
+        return await self._cache.get(key)
+
+    async def store(self, key: str, response: httpx.Response) -> bool:
+        """
+        Store a successful response if it carries a validator.
+
+        Returns:
+            True if the response was stored
+        """
+        if "etag" not in response.headers and "last-modified" not in response.headers:
+            return False
+        entry = {
+            "headers": {
+                name: response.headers[name]
+                for name in _REPLAYED_HEADERS
+                if name in response.headers
+            },
+            "body": response.text,
+        }
+        return await self._cache.set(key, entry, ttl=self.ttl)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for a stored entry."""
+        if not entry:
+            return {}
+        headers = {}
+        stored = entry["headers"]
+        if "etag" in stored:
+            headers["If-None-Match"] = stored["etag"]
+        if "last-modified" in stored:
+            headers["If-Modified-Since"] = stored["last-modified"]
+        return headers
+
+    @staticmethod
+    def replay(entry: Dict[str, Any], not_modified: httpx.Response) -> httpx.Response:
+        """
+        Rebuild a 200 response from a stored entry after a 304.
+
+        Fresh headers from the 304 (rate limit counters, new validators)
+        take precedence over the stored ones.
+        """
+        headers = dict(entry["headers"])
+        for name, value in not_modified.headers.items():
+            if name in _REPLAYED_HEADERS or name.startswith("x-ratelimit-"):
+                headers[name] = value
+        return httpx.Response(
+            200,
+            headers=headers,
+            content=entry["body"].encode(),
+            request=not_modified.request,
+        )
+
+
+# Singleton instance
+conditional_cache = ConditionalRequestCache(cache_service, ttl=settings.GITHUB_CONDITIONAL_CACHE_TTL)
@@ -1,6 +1,10 @@
-from sqlalchemy import create_engine
+from typing import Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
 # Create database engine
@@ -15,6 +19,148 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create Base class for models
 Base = declarative_base()
 
+# Async drivers used when DATABASE_URL names a bare dialect
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """
+    Convert a database URL to its async driver equivalent.
+
+    Example:
+        get_async_database_url("sqlite:///./db.sqlite") -> "sqlite+aiosqlite:///./db.sqlite"
+        get_async_database_url("postgresql://u:p@host/db") -> "postgresql+asyncpg://u:p@host/db"
+    """
+    scheme, sep, rest = url.partition("://")
+    if "+" in scheme or scheme not in _ASYNC_DRIVERS:
+        return url
+    return f"{_ASYNC_DRIVERS[scheme]}{sep}{rest}"
+
+
+def _async_engine_options(url: str) -> dict:
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if url.startswith("sqlite") and ":memory:" in url:
+        # In-memory databases live in a single connection; keep the dialect default
+        return {}
+    if url.startswith("sqlite"):
+        # aiosqlite defaults to NullPool; reuse file connections instead
+        options["poolclass"] = AsyncAdaptedQueuePool
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the SQLite performance profile to a new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.close()
+
+
+def enable_sqlite_performance_profile(sync_engine: Engine) -> None:
+    """
+    Apply WAL, synchronous=NORMAL, mmap, cache size, in-memory temp
+    storage and a busy timeout to every connection of a SQLite engine.
+
+    For an AsyncEngine, pass `async_engine.sync_engine`.
+    """
+    event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+
+
+def sqlite_performance_profile_enabled(url: str = settings.DATABASE_URL) -> bool:
+    """Check if the opt-in SQLite performance profile applies to a database URL."""
+    return settings.SQLITE_PERFORMANCE_PROFILE and url.startswith("sqlite") and ":memory:" not in url
+
+
+def create_async_db_engine(url: str, performance_profile: bool = False) -> AsyncEngine:
+    """
+    Create an async engine with the configured pool options.
+
+    Args:
+        url: Database URL (converted to its async driver)
+        performance_profile: Apply the SQLite performance pragmas
+    """
+    url = get_async_database_url(url)
+    async_db_engine = create_async_engine(url, **_async_engine_options(url))
+    if performance_profile:
+        enable_sqlite_performance_profile(async_db_engine.sync_engine)
+    return async_db_engine
+
+
+if sqlite_performance_profile_enabled():
+    enable_sqlite_performance_profile(engine)
+
+# Async engine for use from async routes and services (does not block the event loop);
+# created on first use, so importing this module never needs the async driver
+_async_engine: Optional[AsyncEngine] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the application's async engine, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(
+            settings.DATABASE_URL,
+            performance_profile=sqlite_performance_profile_enabled(),
+        )
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+def dialect_insert(model):
+    """
+    Build an INSERT on a model for the async engine's dialect.
+
+    The statement supports the dialect's conflict clauses:
+    on_conflict_do_update / on_conflict_do_nothing on PostgreSQL and
+    SQLite, on_duplicate_key_update on MySQL.
+
+    Raises:
+        ValueError: The dialect is not PostgreSQL, SQLite or MySQL
+    """
+    dialect = get_async_engine().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+    else:
+        raise ValueError("unsupported dialect")
+    return insert(model)
+
+
+class _AsyncSessionFactory(async_sessionmaker):
+    """Session factory binding itself to the async engine on first use."""
+
+    def __call__(self, **local_kw) -> AsyncSession:
+        get_async_engine()
+        return super().__call__(**local_kw)
+
+
+# Create AsyncSessionLocal class
+AsyncSessionLocal = _AsyncSessionFactory(
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 def get_db():
     """
@@ -32,10 +178,47 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency for getting an async database session.
+
+    Prefer this in `async def` routes: queries are awaited instead of
+    blocking the event loop.
+
+    Usage in routes:
+    @router.get("/endpoint")
+    async def endpoint(db: AsyncSession = Depends(get_async_db)):
+        result = await db.execute(select(User))
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     Initialize database - create all tables.
 
     Call this on application startup.
     """
+    from app.shared import models  # noqa: F401  (registers the tables)
+
     Base.metadata.create_all(bind=engine)
+
+
+async def init_async_db():
+    """
+    Initialize database from the async engine - create all tables.
+
+    Call this from the application lifespan on startup.
+    """
+    from app.shared import models  # noqa: F401  (registers the tables)
+
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def dispose_async_db():
+    """Close pooled connections. Call this from the application lifespan on shutdown."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    engine.dispose()
@@ -0,0 +1,144 @@
+from typing import Optional, Callable, Awaitable, List, Tuple, Any, TypeVar
+import asyncio
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.config import settings
+from app.shared.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+WriteOperation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class DatabaseWriter:
+    """
+    Single-writer queue that batches database writes into shared commits.
+
+    SQLite allows one writer at a time; funnelling every write through one
+    task avoids `database is locked` contention and amortizes the commit
+    (fsync) over up to `max_batch` operations collected within
+    `max_delay` seconds. If a batch fails, its operations are retried one
+    by one so only the failing operation reports an error.
+
+    While the writer is not running (e.g. the SQLite profile is off),
+    submit() runs the operation in its own session and commits directly.
+
+    Usage:
+    async def save(session: AsyncSession):
+        session.add(row)
+
+    await db_writer.submit(save)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        max_batch: int = 200,
+        max_delay: float = 0.005,
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.operations = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the writer task. Call this on application startup."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush queued writes and stop the writer. Call this on shutdown."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """
+        Run a write operation and wait until it is committed.
+
+        Args:
+            operation: Coroutine function receiving the session; it must not commit
+
+        Returns:
+            The operation's return value
+        """
+        if not self.running:
+            async with self.session_factory() as session:
+                result = await operation(session)
+                await session.commit()
+                return result
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    # Drain what is already queued, then wait briefly for more
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._write_batch(batch)
+
+    async def _write_batch(self, batch: List[Tuple[WriteOperation, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.operations += len(batch)
+        try:
+            async with self.session_factory() as session:
+                results = [await operation(session) for operation, _ in batch]
+                await session.commit()
+        except Exception:
+            logger.warning("Batched write of %d operations failed; retrying individually", len(batch))
+            for operation, future in batch:
+                try:
+                    async with self.session_factory() as session:
+                        result = await operation(session)
+                        await session.commit()
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Singleton instance
+db_writer = DatabaseWriter(
+    max_batch=settings.DB_WRITER_MAX_BATCH,
+    max_delay=settings.DB_WRITER_MAX_DELAY_MS / 1000,
+)
@@ -0,0 +1,365 @@
+from typing import Optional, Dict, List, Any, Iterable, AsyncIterator, Sequence
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.shared.database import AsyncSessionLocal, dialect_insert, get_async_engine
+from app.shared.db_writer import db_writer
+from app.shared.github_client import GitHubClient
+from app.shared.models import ContributionEvent
+from app.shared.utils import parse_github_datetime, truncate_text
+
+# Rows per INSERT statement (keeps SQLite under its bound-parameter limit)
+UPSERT_CHUNK_SIZE = 500
+
+# Columns refreshed when an event is ingested again
+_UPSERT_COLUMNS = ("event_type", "repository", "author", "occurred_at", "number", "data")
+
+
+class EventType(str, Enum):
+    COMMIT = "commit"
+    PULL_REQUEST = "pull_request"
+    REVIEW = "review"
+    ISSUE = "issue"
+    ISSUE_COMMENT = "issue_comment"
+    LABEL = "label"
+
+
+def _login(user: Optional[Dict]) -> Optional[str]:
+    return user["login"] if user else None
+
+
+def _labels(item: Dict) -> List[str]:
+    return [label["name"] for label in item.get("labels") or []]
+
+
+def _event(
+    event_id: str,
+    event_type: EventType,
+    repository: str,
+    author: Optional[str],
+    occurred_at: Optional[str],
+    number: Optional[int] = None,
+    data: Optional[Dict] = None,
+) -> Optional[Dict[str, Any]]:
+    timestamp = parse_github_datetime(occurred_at)
+    if timestamp is None:
+        return None
+    return {
+        "event_id": event_id,
+        "event_type": event_type.value,
+        "repository": repository,
+        "author": author,
+        "occurred_at": timestamp,
+        "number": number,
+        "data": data,
+    }
+
+
+def commit_event(repository: str, item: Dict) -> Optional[Dict[str, Any]]:
+    """
+    Normalize a REST commit.
+
+    The author is the linked GitHub login only; a git display name is not
+    a login (it could collide with one), so it is kept in `data` instead.
+    """
+    commit = item["commit"]
+    return _event(
+        f"commit:{repository}:{item['sha']}",
+        EventType.COMMIT,
+        repository,
+        _login(item.get("author")),
+        commit["author"]["date"],
+        data={
+            "sha": item["sha"],
+            "message": truncate_text(commit["message"], 1000),
+            "author_name": commit["author"].get("name"),
+        },
+    )
+
+
+def pull_request_event(repository: str, item: Dict) -> Optional[Dict[str, Any]]:
+    """Normalize a REST pull request (opened)."""
+    return _event(
+        f"pull_request:{repository}#{item['number']}",
+        EventType.PULL_REQUEST,
+        repository,
+        _login(item.get("user")),
+        item["created_at"],
+        number=item["number"],
+        data={
+            "title": item.get("title"),
+            "body": item.get("body"),
+            "state": item.get("state"),
+            "merged_at": item.get("merged_at"),
+            "closed_at": item.get("closed_at"),
+            "labels": _labels(item),
+        },
+    )
+
+
+def issue_event(repository: str, item: Dict) -> Optional[Dict[str, Any]]:
+    """Normalize a REST issue (opened); pull requests listed as issues are skipped."""
+    if "pull_request" in item:
+        return None
+    return _event(
+        f"issue:{repository}#{item['number']}",
+        EventType.ISSUE,
+        repository,
+        _login(item.get("user")),
+        item["created_at"],
+        number=item["number"],
+        data={
+            "title": item.get("title"),
+            "body": item.get("body"),
+            "state": item.get("state"),
+            "closed_at": item.get("closed_at"),
+            "labels": _labels(item),
+        },
+    )
+
+
+def review_event(repository: str, pr_number: int, item: Dict) -> Optional[Dict[str, Any]]:
+    """Normalize a REST pull request review."""
+    return _event(
+        f"review:{item['id']}",
+        EventType.REVIEW,
+        repository,
+        _login(item.get("user")),
+        item.get("submitted_at"),
+        number=pr_number,
+        data={"state": item.get("state"), "body": item.get("body")},
+    )
+
+
+def issue_comment_event(repository: str, item: Dict, number: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Normalize a REST issue or pull request conversation comment."""
+    if number is None and item.get("issue_url"):
+        number = int(item["issue_url"].rstrip("/").rsplit("/", 1)[-1])
+    return _event(
+        f"issue_comment:{item['id']}",
+        EventType.ISSUE_COMMENT,
+        repository,
+        _login(item.get("user")),
+        item["created_at"],
+        number=number,
+        data={"body": item.get("body")},
+    )
+
+
+def label_event(repository: str, item: Dict) -> Optional[Dict[str, Any]]:
+    """Normalize a REST `labeled` issue event; other issue events are skipped."""
+    if item.get("event") != "labeled":
+        return None
+    return _event(
+        f"label:{item['id']}",
+        EventType.LABEL,
+        repository,
+        _login(item.get("actor")),
+        item["created_at"],
+        number=(item.get("issue") or {}).get("number"),
+        data={"label": (item.get("label") or {}).get("name")},
+    )
+
+
+def activity_events(repository: str, activity: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Normalize the result of GitHubClient.fetch_repo_activity."""
+    events = [pull_request_event(repository, item) for item in activity["pull_requests"]]
+    events += [issue_event(repository, item) for item in activity["issues"]]
+    for number, reviews in activity["reviews"].items():
+        events += [review_event(repository, number, item) for item in reviews]
+    for number, comments in activity["issue_comments"].items():
+        events += [issue_comment_event(repository, item, number) for item in comments]
+    return [event for event in events if event is not None]
+
+
+def _upsert_statement(rows: List[Dict[str, Any]]):
+    """Build a dialect-specific INSERT ... ON CONFLICT DO UPDATE on event_id."""
+    statement = dialect_insert(ContributionEvent).values(rows)
+    if get_async_engine().dialect.name == "mysql":
+        return statement.on_duplicate_key_update(
+            updated_at=datetime.utcnow(),
+            **{column: statement.inserted[column] for column in _UPSERT_COLUMNS},
+        )
+    return statement.on_conflict_do_update(
+        index_elements=["event_id"],
+        set_={
+            "updated_at": datetime.utcnow(),
+            **{column: statement.excluded[column] for column in _UPSERT_COLUMNS},
+        },
+    )
+
+
+class EventStore:
+    """
+    Persistent store of normalized contribution events.
+
+    Ingestion is an idempotent bulk upsert keyed by each event's GitHub
+    identity, so re-ingesting overlapping windows never duplicates rows.
+    Queries by user or repository over a time window are served by the
+    (author, occurred_at) and (repository, occurred_at) indexes.
+
+    Usage:
+    await event_store.ingest_repository(GitHubClient(), "owner", "repo", since=start)
+    events = await event_store.query(author="octocat", since=start)
+    """
+
+    async def upsert(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update events.
+
+        Args:
+            events: Normalized event dicts (see the *_event functions)
+
+        Returns:
+            Number of distinct events written
+        """
+        # Later duplicates win, and one statement must not touch a row twice
+        unique = {event["event_id"]: event for event in events if event is not None}
+        rows = list(unique.values())
+
+        async def write(db: AsyncSession) -> None:
+            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                await db.execute(_upsert_statement(rows[start:start + UPSERT_CHUNK_SIZE]))
+
+        if rows:
+            await db_writer.submit(write)
+        return len(rows)
+
+    async def upsert_stream(self, repository: str, items: AsyncIterator[Dict], normalize) -> int:
+        """Normalize and upsert items from an async iterator in chunks."""
+        written = 0
+        batch: List[Dict[str, Any]] = []
+        async for item in items:
+            event = normalize(repository, item)
+            if event is not None:
+                batch.append(event)
+            if len(batch) >= UPSERT_CHUNK_SIZE:
+                written += await self.upsert(batch)
+                batch = []
+        written += await self.upsert(batch)
+        return written
+
+    async def ingest_repository(
+        self,
+        client: GitHubClient,
+        owner: str,
+        repo: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Fetch a repository's activity for a window and upsert it.
+
+        Commits and label events are streamed page by page over REST; pull
+        requests, issues, reviews and comments come from the GraphQL batch
+        fetcher.
+
+        Returns:
+            Number of events written per kind
+        """
+        repository = f"{owner}/{repo}"
+        counts = {
+            EventType.COMMIT.value: await self.upsert_stream(
+                repository, client.iter_commits(owner, repo, since=since, until=until), commit_event
+            ),
+            EventType.LABEL.value: await self.upsert_stream(
+                repository, client.iter_issue_events(owner, repo, since=since, until=until), label_event
+            ),
+        }
+        activity = await client.fetch_repo_activity(owner, repo, since=since, until=until)
+        events = activity_events(repository, activity)
+        await self.upsert(events)
+        for event in events:
+            counts[event["event_type"]] = counts.get(event["event_type"], 0) + 1
+        return counts
+
+    @staticmethod
+    def _filters(
+        author: Optional[str],
+        repository: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        event_types: Optional[List[EventType]],
+    ) -> list:
+        conditions = []
+        if author:
+            conditions.append(ContributionEvent.author == author)
+        if repository:
+            conditions.append(ContributionEvent.repository == repository)
+        if since:
+            conditions.append(ContributionEvent.occurred_at >= since)
+        if until:
+            conditions.append(ContributionEvent.occurred_at <= until)
+        if event_types:
+            conditions.append(ContributionEvent.event_type.in_([EventType(t).value for t in event_types]))
+        return conditions
+
+    async def query(
+        self,
+        author: Optional[str] = None,
+        repository: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        event_types: Optional[List[EventType]] = None,
+        limit: Optional[int] = None,
+    ) -> List[ContributionEvent]:
+        """Get events matching the filters, oldest first."""
+        statement = (
+            select(ContributionEvent)
+            .where(*self._filters(author, repository, since, until, event_types))
+            .order_by(ContributionEvent.occurred_at)
+            .limit(limit)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(statement)
+            return list(result.scalars())
+
+    async def query_columns(
+        self,
+        columns: Sequence,
+        author: Optional[str] = None,
+        repository: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        event_types: Optional[List[EventType]] = None,
+    ) -> List[tuple]:
+        """
+        Like query, but select only some columns as plain rows.
+
+        Much cheaper than loading ORM objects for large windows.
+
+        Example:
+            rows = await event_store.query_columns(
+                (ContributionEvent.event_type, ContributionEvent.data), repository="owner/repo"
+            )
+        """
+        statement = (
+            select(*columns)
+            .where(*self._filters(author, repository, since, until, event_types))
+            .order_by(ContributionEvent.occurred_at)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(statement)
+            return [tuple(row) for row in result.all()]
+
+    async def count_by_type(
+        self,
+        author: Optional[str] = None,
+        repository: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """Count events per event type matching the filters."""
+        statement = (
+            select(ContributionEvent.event_type, func.count())
+            .where(*self._filters(author, repository, since, until, None))
+            .group_by(ContributionEvent.event_type)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(statement)
+            return {event_type: count for event_type, count in result.all()}
+
+
+# Singleton instance
+event_store = EventStore()
@@ -0,0 +1,181 @@
+from typing import Optional, Callable, List, Sequence, TypeVar, Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _initialize_worker(initializers: Sequence[Callable[[], Any]]) -> None:
+    """Run the registered warm-up functions once in each new worker process."""
+    for initializer in initializers:
+        initializer()
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+class ProcessExecutor:
+    """
+    Shared process pool for CPU-bound work (sentiment scoring, feature
+    extraction) that must not run on the event loop.
+
+    Each web worker process (WEB_CONCURRENCY) runs its own pool, so by
+    default a pool gets its share of the cores, not all of them.
+
+    Workers are spawned at startup and warmed by the registered
+    initializers (e.g. building lexicon arrays), so the first request does
+    not pay for it. At most `max_pending` tasks are submitted at once;
+    further callers wait, which keeps a large batch from queueing ahead of
+    every other request.
+
+    Functions and arguments must be picklable: use module-level functions.
+    While the pool is not running (scripts, EXECUTOR_ENABLED=false), work
+    runs in a thread instead.
+
+    Usage:
+    process_executor.register_initializer(get_engine)  # at import time
+
+    result = await process_executor.run(score_texts, texts)
+    chunks = await process_executor.map_chunks(score_texts, texts, chunk_size=5000)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        web_concurrency: int = 1,
+    ):
+        # Every web worker process has its own pool: share the cores between them
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 1) // max(1, web_concurrency))
+        self.max_pending = max_pending or self.max_workers * 2
+        self._initializers: List[Callable[[], Any]] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pool_lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    def register_initializer(self, initializer: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Register a module-level function to run in every worker on start.
+
+        Register before start(); returns the function, so it can be used
+        as a decorator.
+        """
+        if initializer not in self._initializers:
+            self._initializers.append(initializer)
+        return initializer
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # Spawn rather than fork: the parent runs threads (event loop, DB drivers)
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(tuple(self._initializers),),
+        )
+
+    async def start(self) -> None:
+        """Spawn and warm up the workers. Call this on application startup."""
+        if self.running:
+            return
+        self._pool = self._create_pool()
+        self._semaphore = asyncio.Semaphore(self.max_pending)
+        loop = asyncio.get_running_loop()
+        # One task per worker forces every process to start and initialize now
+        try:
+            pids = await asyncio.gather(
+                *(loop.run_in_executor(self._pool, _ready) for _ in range(self.max_workers))
+            )
+        except BrokenProcessPool as e:
+            logger.error("Process executor failed to start; running work in threads: %s", e)
+            pool, self._pool = self._pool, None
+            pool.shutdown(wait=False, cancel_futures=True)
+            return
+        logger.info("Process executor ready with %d workers", len(set(pids)))
+
+    async def stop(self) -> None:
+        """Shut the workers down. Call this on shutdown."""
+        if not self.running:
+            return
+        pool, self._pool = self._pool, None
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> Optional[ProcessPoolExecutor]:
+        """
+        Replace a crashed pool once, however many callers saw it break.
+
+        Returns:
+            The current pool (None once stopped)
+        """
+        with self._pool_lock:
+            if self._pool is broken:
+                logger.warning("Process pool broke; restarting it")
+                self._pool = self._create_pool()
+                broken.shutdown(wait=False, cancel_futures=True)
+            return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run `fn(*args)` in a worker process and await its result.
+
+        Waits while `max_pending` tasks are already submitted. A crashed
+        pool is replaced and the task retried once.
+        """
+        call = functools.partial(fn, *args)
+        if not self.running:
+            return await asyncio.to_thread(call)
+
+        async with self._semaphore:
+            self.submitted += 1
+            loop = asyncio.get_running_loop()
+            pool = self._pool
+            try:
+                result = await loop.run_in_executor(pool, call)
+            except BrokenProcessPool:
+                pool = self._replace_pool(pool)
+                if pool is None:
+                    result = await asyncio.to_thread(call)
+                else:
+                    result = await loop.run_in_executor(pool, call)
+            self.completed += 1
+            return result
+
+    async def map_chunks(self, fn: Callable[[List], T], items: Sequence, chunk_size: int) -> List[T]:
+        """
+        Split `items` into chunks, run `fn(chunk)` on each in parallel, and
+        return the results in chunk order.
+        """
+        chunks = [list(items[start:start + chunk_size]) for start in range(0, len(items), chunk_size)]
+        return list(await asyncio.gather(*(self.run(fn, chunk) for chunk in chunks)))
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+        }
+
+
+# Singleton instance
+process_executor = ProcessExecutor(
+    max_workers=settings.EXECUTOR_WORKERS or None,
+    max_pending=settings.EXECUTOR_MAX_PENDING or None,
+    web_concurrency=settings.WEB_CONCURRENCY,
+)
@@ -1,38 +1,407 @@
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Any, AsyncIterator, Tuple
+from datetime import datetime
+import importlib.util
 import httpx
 from app.core.config import settings
+from app.shared.utils import parse_github_datetime, format_github_datetime
+from app.shared.conditional_cache import conditional_cache
+from app.shared.rate_limiter import request_scheduler, RequestPriority
+from app.shared.exceptions import GitHubAPIException
+from app.shared.single_flight import single_flight
+from app.shared.github_replay import RecordingTransport, ReplayTransport
+
+# Largest page size GitHub accepts on list endpoints
+PER_PAGE = 100
+
+# GraphQL page sizes: top-level nodes per page, nested nodes per parent
+GRAPHQL_PAGE_SIZE = 50
+GRAPHQL_NESTED_PAGE_SIZE = 100
+
+_GRAPHQL_COMMENT_FIELDS = """
+    databaseId
+    author { login }
+    body
+    createdAt
+    updatedAt
+    url
+"""
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $repo: String!, $cursor: String, $pageSize: Int!, $nestedSize: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(first: $pageSize, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        state
+        isDraft
+        author { login }
+        labels(first: 20) { nodes { name } }
+        createdAt
+        updatedAt
+        closedAt
+        mergedAt
+        url
+        reviews(first: $nestedSize) {
+          pageInfo { hasNextPage }
+          nodes {
+            databaseId
+            author { login }
+            body
+            state
+            submittedAt
+            url
+          }
+        }
+        comments(first: $nestedSize) {
+          pageInfo { hasNextPage }
+          nodes { %s }
+        }
+      }
+    }
+  }
+}
+""" % _GRAPHQL_COMMENT_FIELDS
+
+ISSUES_QUERY = """
+query($owner: String!, $repo: String!, $cursor: String, $since: DateTime, $pageSize: Int!, $nestedSize: Int!) {
+  repository(owner: $owner, name: $repo) {
+    issues(first: $pageSize, after: $cursor, filterBy: {since: $since},
+           orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        state
+        author { login }
+        labels(first: 20) { nodes { name } }
+        createdAt
+        updatedAt
+        closedAt
+        url
+        comments(first: $nestedSize) {
+          totalCount
+          pageInfo { hasNextPage }
+          nodes { %s }
+        }
+      }
+    }
+  }
+}
+""" % _GRAPHQL_COMMENT_FIELDS
+
+
+def _in_window(
+    item: Dict,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    since_field: Optional[str],
+    until_field: Optional[str],
+) -> bool:
+    """Check an item's timestamps against a since/until window."""
+    if since and since_field:
+        timestamp = parse_github_datetime(item.get(since_field))
+        if timestamp and timestamp < since:
+            return False
+    if until and until_field:
+        timestamp = parse_github_datetime(item.get(until_field))
+        if timestamp and timestamp > until:
+            return False
+    return True
+
+
+def _graphql_user(author: Optional[Dict]) -> Optional[Dict]:
+    """Map a GraphQL author to the REST `user` shape (None for deleted users)."""
+    return {"login": author["login"]} if author else None
+
+
+def _graphql_labels(labels: Dict) -> List[Dict]:
+    return [{"name": label["name"]} for label in labels["nodes"]]
+
+
+def _graphql_comment(node: Dict) -> Dict:
+    """Map a GraphQL comment node to the REST issue comment shape."""
+    return {
+        "id": node["databaseId"],
+        "user": _graphql_user(node["author"]),
+        "body": node["body"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "html_url": node["url"],
+    }
+
+
+def _graphql_review(node: Dict) -> Dict:
+    """Map a GraphQL review node to the REST pull request review shape."""
+    return {
+        "id": node["databaseId"],
+        "user": _graphql_user(node["author"]),
+        "body": node["body"],
+        "state": node["state"],
+        "submitted_at": node["submittedAt"],
+        "html_url": node["url"],
+    }
+
+
+def _graphql_pull_request(node: Dict) -> Dict:
+    """Map a GraphQL pull request node to the REST pull request shape."""
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "body": node["body"],
+        # REST reports merged pull requests as closed
+        "state": "open" if node["state"] == "OPEN" else "closed",
+        "draft": node["isDraft"],
+        "user": _graphql_user(node["author"]),
+        "labels": _graphql_labels(node["labels"]),
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node["closedAt"],
+        "merged_at": node["mergedAt"],
+        "html_url": node["url"],
+    }
+
+
+def _graphql_issue(node: Dict) -> Dict:
+    """Map a GraphQL issue node to the REST issue shape."""
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "body": node["body"],
+        "state": node["state"].lower(),
+        "user": _graphql_user(node["author"]),
+        "labels": _graphql_labels(node["labels"]),
+        "comments": node["comments"]["totalCount"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node["closedAt"],
+        "html_url": node["url"],
+    }
+
+
+# Shared connection pool, opened and closed by the application lifespan
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    """
+    Build an AsyncClient configured from settings.
+
+    HTTP/2 is only enabled when the optional `h2` package is installed.
+    GITHUB_REPLAY_PATH serves every request from a recorded session and
+    GITHUB_RECORD_PATH records the session (see app.shared.github_replay).
+
+    Args:
+        transport: Send requests through this transport instead, e.g.
+            httpx.ASGITransport(app=fake_github_app)
+    """
+    if transport is None:
+        if settings.GITHUB_REPLAY_PATH:
+            transport = ReplayTransport(settings.GITHUB_REPLAY_PATH)
+        else:
+            transport = httpx.AsyncHTTPTransport(
+                http2=settings.GITHUB_HTTP2 and importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=settings.GITHUB_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.GITHUB_KEEPALIVE_EXPIRY,
+                ),
+            )
+            if settings.GITHUB_RECORD_PATH:
+                transport = RecordingTransport(settings.GITHUB_RECORD_PATH, transport)
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            connect=settings.GITHUB_CONNECT_TIMEOUT,
+            read=settings.GITHUB_READ_TIMEOUT,
+            write=settings.GITHUB_WRITE_TIMEOUT,
+            pool=settings.GITHUB_POOL_TIMEOUT,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient, creating it on first use.
+
+    Outside the application lifespan (scripts, shells) the client is
+    created lazily; call close_http_client() when done.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+    return _http_client
+
+
+async def use_http_client(client: httpx.AsyncClient) -> None:
+    """
+    Replace the shared AsyncClient, closing the previous one.
+
+    Benchmarks use this to route every GitHubClient through a fake
+    GitHub app or a replay transport.
+    """
+    global _http_client
+    if _http_client is not None and _http_client is not client:
+        await _http_client.aclose()
+    _http_client = client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient. Call this on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 class GitHubClient:
     """
     Shared GitHub API client for all modules.
 
+    Requests go through the shared, pooled AsyncClient (see
+    get_http_client), so connections are kept alive across calls.
+    GET requests are sent conditionally when a previous response is
+    stored (see ConditionalRequestCache); a 304 is served from the store.
+    Concurrent identical GETs share one upstream call (see SingleFlight).
+    Every request is paced and retried by the shared RequestScheduler;
+    background jobs should pass priority=RequestPriority.BATCH so
+    interactive endpoints go first.
+
     Usage:
     client = GitHubClient()
     user_data = await client.get_user("username")
     """
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        use_conditional_cache: bool = settings.GITHUB_CONDITIONAL_CACHE,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        base_url: Optional[str] = None,
+    ):
         self.token = token or settings.GITHUB_TOKEN
-        self.base_url = "https://api.github.com"
+        self._http_client = http_client
+        self.use_conditional_cache = use_conditional_cache
+        self.priority = priority
+        self.base_url = (base_url or settings.GITHUB_API_URL).rstrip("/")
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
         }
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
 
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request to an absolute GitHub URL and return the raw response.
+
+        Concurrent identical GET requests are coalesced into one upstream call.
+        """
+        if method != "GET":
+            return await self._send_once(method, url, None, **kwargs)
+        key = conditional_cache.key_for(url, kwargs.get("params"), self.token)
+        return await single_flight.do(key, lambda: self._send_once(method, url, key, **kwargs))
+
+    async def _send_once(self, method: str, url: str, key: Optional[str], **kwargs) -> httpx.Response:
+        """Send one request, using the conditional cache entry at `key` if enabled."""
+        client = self._http_client or get_http_client()
+        headers = dict(self.headers)
+
+        cache_key = key if self.use_conditional_cache else None
+        cached = None
+        if cache_key:
+            cached = await conditional_cache.get(cache_key)
+            headers.update(conditional_cache.conditional_headers(cached))
+
+        response = await request_scheduler.send(
+            lambda: client.request(method, url, headers=headers, **kwargs),
+            priority=self.priority,
+        )
+        if response.status_code == 304 and cached:
+            return conditional_cache.replay(cached, response)
+        response.raise_for_status()
+        if cache_key:
+            await conditional_cache.store(cache_key, response)
+        return response
+
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """Make API request to GitHub."""
-        async with httpx.AsyncClient() as client:
-            url = f"{self.base_url}/{endpoint}"
-            response = await client.request(
-                method,
-                url,
-                headers=self.headers,
-                **kwargs
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._send(method, f"{self.base_url}/{endpoint}", **kwargs)
+        return response.json()
+
+    async def check_modified(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        etag: Optional[str] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Probe an endpoint with If-None-Match.
+
+        A 304 does not count against the rate limit, so this is a cheap
+        way to skip unchanged resources. Pass stable params (e.g. the
+        newest item only) so the ETag changes exactly when data does.
+
+        Returns:
+            (modified, current ETag)
+        """
+        client = self._http_client or get_http_client()
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        response = await request_scheduler.send(
+            lambda: client.get(f"{self.base_url}/{endpoint}", headers=headers, params=params),
+            priority=self.priority,
+        )
+        if response.status_code == 304:
+            return False, etag
+        response.raise_for_status()
+        return True, response.headers.get("etag")
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        since_field: Optional[str] = None,
+        until_field: Optional[str] = None,
+        newest_first: bool = False,
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterate over every item of a paginated list endpoint.
+
+        Follows `Link: rel="next"` headers with per_page=100 and yields
+        items as each page arrives, so only one page is held in memory.
+
+        Args:
+            endpoint: API path relative to the base URL
+            params: Query parameters for the first page
+            since: Skip items whose `since_field` is older than this (naive UTC)
+            until: Skip items whose `until_field` is newer than this (naive UTC)
+            since_field: Item timestamp checked against `since`
+            until_field: Item timestamp checked against `until`
+            newest_first: Items are sorted by `since_field` descending, so
+                iteration stops at the first item older than `since`
+        """
+        url: Optional[str] = f"{self.base_url}/{endpoint}"
+        page_params: Optional[Dict] = {**(params or {}), "per_page": PER_PAGE}
+
+        while url:
+            response = await self._send("GET", url, params=page_params)
+            for item in response.json():
+                if _in_window(item, since, until, since_field, until_field):
+                    yield item
+                elif newest_first and not _in_window(item, since, None, since_field, None):
+                    return
+
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            # The next link already carries the full query string
+            page_params = None
 
     async def get_user(self, username: str) -> Dict:
         """Get user information."""
@@ -68,3 +437,275 @@ class GitHubClient:
     async def get_pr_reviews(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
         """Get reviews for a specific pull request."""
         return await self._request("GET", f"repos/{owner}/{repo}/pulls/{pr_number}/reviews")
+
+    # Streaming variants: follow every page and yield items as they arrive.
+    # `since`/`until` are naive UTC datetimes (see calculate_date_range).
+
+    def iter_user_repos(
+        self,
+        username: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over user repositories pushed to since `since` and created before `until`."""
+        return self._paginate(
+            f"users/{username}/repos",
+            params={"sort": "pushed", "direction": "desc"},
+            since=since,
+            until=until,
+            since_field="pushed_at",
+            until_field="created_at",
+            newest_first=True,
+        )
+
+    def iter_commits(
+        self,
+        owner: str,
+        repo: str,
+        author: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over repository commits; the window is filtered by GitHub."""
+        params = {}
+        if author:
+            params["author"] = author
+        if since:
+            params["since"] = format_github_datetime(since)
+        if until:
+            params["until"] = format_github_datetime(until)
+        return self._paginate(f"repos/{owner}/{repo}/commits", params=params)
+
+    def iter_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "all",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over pull requests updated since `since` and created before `until`."""
+        return self._paginate(
+            f"repos/{owner}/{repo}/pulls",
+            params={"state": state, "sort": "updated", "direction": "desc"},
+            since=since,
+            until=until,
+            since_field="updated_at",
+            until_field="created_at",
+            newest_first=True,
+        )
+
+    def iter_issues(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "all",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over issues updated since `since` and created before `until`."""
+        params = {"state": state, "sort": "updated", "direction": "desc"}
+        if since:
+            params["since"] = format_github_datetime(since)
+        return self._paginate(
+            f"repos/{owner}/{repo}/issues",
+            params=params,
+            until=until,
+            until_field="created_at",
+        )
+
+    def iter_issue_comments(
+        self,
+        owner: str,
+        repo: str,
+        issue_number: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over comments on an issue updated since `since` and created before `until`."""
+        params = {}
+        if since:
+            params["since"] = format_github_datetime(since)
+        return self._paginate(
+            f"repos/{owner}/{repo}/issues/{issue_number}/comments",
+            params=params,
+            until=until,
+            until_field="created_at",
+        )
+
+    def iter_repo_issue_comments(
+        self,
+        owner: str,
+        repo: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over comments on every issue and pull request of a repository."""
+        params = {"sort": "updated", "direction": "desc"}
+        if since:
+            params["since"] = format_github_datetime(since)
+        return self._paginate(
+            f"repos/{owner}/{repo}/issues/comments",
+            params=params,
+            until=until,
+            until_field="created_at",
+        )
+
+    def iter_issue_events(
+        self,
+        owner: str,
+        repo: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over issue events (labeled, closed, ...) of a repository, newest first."""
+        return self._paginate(
+            f"repos/{owner}/{repo}/issues/events",
+            since=since,
+            until=until,
+            since_field="created_at",
+            until_field="created_at",
+            newest_first=True,
+        )
+
+    def iter_pr_reviews(
+        self,
+        owner: str,
+        repo: str,
+        pr_number: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over reviews on a pull request submitted inside the window."""
+        return self._paginate(
+            f"repos/{owner}/{repo}/pulls/{pr_number}/reviews",
+            since=since,
+            until=until,
+            since_field="submitted_at",
+            until_field="submitted_at",
+        )
+
+    # GraphQL: whole-repository activity in a few paginated queries instead
+    # of one REST call per pull request or issue.
+
+    async def graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """
+        Run a GraphQL query.
+
+        Returns:
+            The `data` member of the response
+
+        Raises:
+            GitHubAPIException: If GitHub reports query errors
+        """
+        response = await self._send(
+            "POST",
+            f"{self.base_url}/graphql",
+            json={"query": query, "variables": variables or {}},
+        )
+        payload = response.json()
+        if payload.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in payload["errors"])
+            raise GitHubAPIException(f"GitHub GraphQL error: {messages}")
+        return payload["data"]
+
+    async def fetch_repo_activity(
+        self,
+        owner: str,
+        repo: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch pull requests, issues, reviews and comments for a time window.
+
+        Items use the same dict shapes as the REST methods, and the window
+        follows the iter_* methods. Nested reviews or comments that overflow
+        one GraphQL page are completed with the REST iterators.
+
+        Returns:
+            {
+                "pull_requests": [...],          # like get_pull_requests
+                "issues": [...],                 # like get_issues, without PRs
+                "reviews": {pr_number: [...]},   # like get_pr_reviews
+                "issue_comments": {number: [...]},  # like get_issue_comments
+            }
+        """
+        activity: Dict[str, Any] = {
+            "pull_requests": [],
+            "issues": [],
+            "reviews": {},
+            "issue_comments": {},
+        }
+        variables = {
+            "owner": owner,
+            "repo": repo,
+            "pageSize": GRAPHQL_PAGE_SIZE,
+            "nestedSize": GRAPHQL_NESTED_PAGE_SIZE,
+        }
+
+        async def collect_comments(number: int, connection: Dict) -> None:
+            if connection["pageInfo"]["hasNextPage"]:
+                comments = [
+                    comment async for comment in
+                    self.iter_issue_comments(owner, repo, number, since=since, until=until)
+                ]
+            else:
+                comments = [
+                    comment for comment in map(_graphql_comment, connection["nodes"])
+                    if _in_window(comment, since, until, "updated_at", "created_at")
+                ]
+            activity["issue_comments"][number] = comments
+
+        # Pull requests cannot be filtered by date, so walk them newest first
+        cursor = None
+        done = False
+        while not done:
+            data = await self.graphql(PULL_REQUESTS_QUERY, {**variables, "cursor": cursor})
+            connection = data["repository"]["pullRequests"]
+            for node in connection["nodes"]:
+                pull_request = _graphql_pull_request(node)
+                if not _in_window(pull_request, since, None, "updated_at", None):
+                    done = True
+                    break
+                if not _in_window(pull_request, None, until, None, "created_at"):
+                    continue
+                number = pull_request["number"]
+                activity["pull_requests"].append(pull_request)
+
+                if node["reviews"]["pageInfo"]["hasNextPage"]:
+                    reviews = [
+                        review async for review in
+                        self.iter_pr_reviews(owner, repo, number, since=since, until=until)
+                    ]
+                else:
+                    reviews = [
+                        review for review in map(_graphql_review, node["reviews"]["nodes"])
+                        if _in_window(review, since, until, "submitted_at", "submitted_at")
+                    ]
+                activity["reviews"][number] = reviews
+                await collect_comments(number, node["comments"])
+
+            cursor = connection["pageInfo"]["endCursor"]
+            done = done or not connection["pageInfo"]["hasNextPage"]
+
+        # Issues support a server-side `since` filter
+        cursor = None
+        since_value = format_github_datetime(since) if since else None
+        while True:
+            data = await self.graphql(
+                ISSUES_QUERY, {**variables, "cursor": cursor, "since": since_value}
+            )
+            connection = data["repository"]["issues"]
+            for node in connection["nodes"]:
+                issue = _graphql_issue(node)
+                if not _in_window(issue, None, until, None, "created_at"):
+                    continue
+                activity["issues"].append(issue)
+                await collect_comments(issue["number"], node["comments"])
+
+            if not connection["pageInfo"]["hasNextPage"]:
+                break
+            cursor = connection["pageInfo"]["endCursor"]
+
+        return activity
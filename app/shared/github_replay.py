@@ -0,0 +1,122 @@
+from typing import Optional, Dict, List, Tuple
+from collections import defaultdict
+import hashlib
+import json
+import httpx
+
+# Headers that describe the wire encoding, not the recorded (decoded) body
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection")
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed session has no recording for a request."""
+
+
+def _request_key(request: httpx.Request, etag: Optional[str]) -> Tuple[str, str, str, str]:
+    """Match requests on method, URL (sorted query), body and If-None-Match."""
+    url = request.url.copy_with(query=None)
+    query = "&".join(sorted(f"{name}={value}" for name, value in request.url.params.multi_items()))
+    body = hashlib.sha256(request.content).hexdigest() if request.content else ""
+    return request.method, f"{url}?{query}", body, etag or ""
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that forwards requests and appends every exchange to a
+    JSON Lines cassette for later offline replay.
+
+    The Authorization header is never written, only the method, URL,
+    body hash and If-None-Match of each request, and the status,
+    headers and decoded body of its response.
+
+    Usage:
+    transport = RecordingTransport("github_session.jsonl")
+    client = httpx.AsyncClient(transport=transport)
+    """
+
+    def __init__(self, path: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.path = path
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        try:
+            # Reading through a Response decodes gzip/br, so the cassette holds plain bodies
+            body = await httpx.Response(
+                response.status_code, headers=response.headers, stream=response.stream
+            ).aread()
+        finally:
+            await response.aclose()
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        method, url, body_hash, etag = _request_key(request, request.headers.get("if-none-match"))
+        entry = {
+            "method": method,
+            "url": url,
+            "body_sha256": body_hash,
+            "if_none_match": etag,
+            "status": response.status_code,
+            "headers": headers,
+            "body": body.decode("utf-8", errors="replace"),
+        }
+        with open(self.path, "a", encoding="utf-8") as cassette:
+            cassette.write(json.dumps(entry) + "\n")
+
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that answers requests from a RecordingTransport cassette,
+    without any network access.
+
+    Identical requests are answered in recorded order, repeating the last
+    response once exhausted. A conditional request with no recorded
+    conditional match falls back to the unconditional recording (a full
+    200 is always a valid answer).
+
+    Usage:
+    client = httpx.AsyncClient(transport=ReplayTransport("github_session.jsonl"))
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[Tuple[str, str, str, str], List[Dict]] = defaultdict(list)
+        self._served: Dict[Tuple[str, str, str, str], int] = defaultdict(int)
+        with open(path, encoding="utf-8") as cassette:
+            for line in cassette:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = (entry["method"], entry["url"], entry["body_sha256"], entry["if_none_match"])
+                self._entries[key].append(entry)
+
+    def _next(self, key: Tuple[str, str, str, str]) -> Optional[Dict]:
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        index = min(self._served[key], len(entries) - 1)
+        self._served[key] += 1
+        return entries[index]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        etag = request.headers.get("if-none-match")
+        entry = self._next(_request_key(request, etag))
+        if entry is None and etag:
+            entry = self._next(_request_key(request, None))
+        if entry is None:
+            raise ReplayMissError(f"No recorded response for {request.method} {request.url}")
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=entry["body"].encode("utf-8"),
+            request=request,
+        )
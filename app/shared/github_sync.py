@@ -0,0 +1,245 @@
+from typing import Optional, Dict, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import contextlib
+import logging
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.shared.database import AsyncSessionLocal
+from app.shared.db_writer import db_writer
+from app.shared.event_store import (
+    event_store,
+    activity_events,
+    commit_event,
+    issue_comment_event,
+    label_event,
+)
+from app.shared.exceptions import RateLimitException
+from app.shared.github_client import GitHubClient
+from app.shared.models import Repository, SyncCursor
+from app.shared.rate_limiter import RequestPriority
+
+logger = logging.getLogger(__name__)
+
+# Synced resources, each with its own cursor
+SYNC_RESOURCES = ("commits", "activity", "issue_comments", "issue_events")
+
+# Newest-item probe per resource: the ETag changes exactly when new data arrives
+_PROBES: Dict[str, Tuple[str, Dict]] = {
+    "commits": ("commits", {"per_page": 1}),
+    # Issues include pull requests; reviews and comments bump updated_at
+    "activity": ("issues", {"state": "all", "sort": "updated", "direction": "desc", "per_page": 1}),
+    "issue_comments": ("issues/comments", {"sort": "updated", "direction": "desc", "per_page": 1}),
+    "issue_events": ("issues/events", {"per_page": 1}),
+}
+
+
+class GitHubSyncWorker:
+    """
+    Background worker keeping the event store in sync with GitHub.
+
+    Every tracked Repository has a cursor per resource (SyncCursor). A run
+    first probes the resource's newest item with its stored ETag; a 304
+    (free against the rate limit) skips it. Otherwise only items changed
+    since the cursor are fetched and bulk-upserted, then the cursor moves
+    to the run's start time. Cost therefore scales with change volume,
+    not repository age.
+
+    Repositories are synced least recently synced first with bounded
+    concurrency, at BATCH priority so interactive requests go first. When
+    the rate limit is exhausted the cycle stops and resumes next interval.
+
+    Usage:
+    await github_sync.start()  # periodic, from the application lifespan
+    await github_sync.sync_repository("owner", "repo")  # one-off
+    """
+
+    def __init__(
+        self,
+        interval: float = 900,
+        max_concurrency: int = 4,
+        overlap: timedelta = timedelta(minutes=5),
+        initial_lookback: Optional[timedelta] = timedelta(days=90),
+        client: Optional[GitHubClient] = None,
+    ):
+        self.interval = interval
+        self.max_concurrency = max_concurrency
+        self.overlap = overlap
+        self.initial_lookback = initial_lookback
+        # Windowed URLs never repeat, so the conditional body cache is of no use here
+        self.client = client or GitHubClient(use_conditional_cache=False, priority=RequestPriority.BATCH)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start periodic syncing. Call this on application startup."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic syncing. Call this on shutdown."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync_all()
+            except Exception:
+                logger.exception("GitHub sync cycle failed")
+            await asyncio.sleep(self.interval)
+
+    # Cursors
+
+    async def _load_cursors(self, repository: str) -> Dict[str, SyncCursor]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(SyncCursor).where(SyncCursor.repository == repository))
+            return {cursor.resource: cursor for cursor in result.scalars()}
+
+    async def _save_cursor(self, repository: str, resource: str, **values) -> None:
+        async def write(db: AsyncSession) -> None:
+            result = await db.execute(
+                select(SyncCursor).where(
+                    SyncCursor.repository == repository,
+                    SyncCursor.resource == resource,
+                )
+            )
+            cursor = result.scalar_one_or_none()
+            if cursor is None:
+                cursor = SyncCursor(repository=repository, resource=resource)
+                db.add(cursor)
+            for name, value in values.items():
+                setattr(cursor, name, value)
+            await db.flush()
+
+        await db_writer.submit(write)
+
+    def _window_start(self, cursor: Optional[SyncCursor]) -> Optional[datetime]:
+        """Where to resume: the cursor minus the overlap, or the initial lookback."""
+        if cursor is not None and cursor.since is not None:
+            return cursor.since - self.overlap
+        if self.initial_lookback:
+            return datetime.utcnow() - self.initial_lookback
+        return None
+
+    # Syncing
+
+    async def _fetch(self, owner: str, repo: str, resource: str, since: Optional[datetime]) -> int:
+        """Fetch one resource's changes since `since` and upsert them."""
+        repository = f"{owner}/{repo}"
+        if resource == "commits":
+            items = self.client.iter_commits(owner, repo, since=since)
+            return await event_store.upsert_stream(repository, items, commit_event)
+        if resource == "issue_comments":
+            items = self.client.iter_repo_issue_comments(owner, repo, since=since)
+            return await event_store.upsert_stream(repository, items, issue_comment_event)
+        if resource == "issue_events":
+            items = self.client.iter_issue_events(owner, repo, since=since)
+            return await event_store.upsert_stream(repository, items, label_event)
+        activity = await self.client.fetch_repo_activity(owner, repo, since=since)
+        return await event_store.upsert(activity_events(repository, activity))
+
+    async def sync_repository(self, owner: str, repo: str) -> Dict[str, int]:
+        """
+        Sync every resource of one repository from its cursors.
+
+        A failing resource keeps its cursor (and records the error) so the
+        next run retries the same window; the rest still sync.
+
+        Returns:
+            Number of events written per resource (0 when unchanged)
+
+        Raises:
+            RateLimitException: The rate limit is exhausted
+        """
+        repository = f"{owner}/{repo}"
+        cursors = await self._load_cursors(repository)
+        counts: Dict[str, int] = {}
+
+        for resource in SYNC_RESOURCES:
+            cursor = cursors.get(resource)
+            started_at = datetime.utcnow()
+            since = self._window_start(cursor)
+            endpoint, params = _PROBES[resource]
+            try:
+                # Without a cursor there is nothing to compare the ETag against
+                known_etag = cursor.etag if cursor is not None and cursor.since is not None else None
+                modified, etag = await self.client.check_modified(
+                    f"repos/{owner}/{repo}/{endpoint}", params, known_etag
+                )
+                counts[resource] = await self._fetch(owner, repo, resource, since) if modified else 0
+            except RateLimitException as exc:
+                await self._save_cursor(repository, resource, last_error=exc.detail)
+                raise
+            except Exception as exc:
+                logger.warning("Sync of %s %s failed: %s", repository, resource, exc)
+                await self._save_cursor(repository, resource, last_error=str(exc))
+                continue
+
+            await self._save_cursor(
+                repository,
+                resource,
+                since=started_at,
+                etag=etag,
+                last_synced_at=started_at,
+                last_error=None,
+            )
+        return counts
+
+    async def _repositories(self) -> list:
+        """Tracked repositories, least recently synced (or never synced) first."""
+        async with AsyncSessionLocal() as db:
+            repositories = (await db.execute(select(Repository.owner, Repository.name))).all()
+            result = await db.execute(
+                select(SyncCursor.repository, func.min(SyncCursor.last_synced_at))
+                .group_by(SyncCursor.repository)
+            )
+            last_synced = dict(result.all())
+        return sorted(
+            repositories,
+            key=lambda row: last_synced.get(f"{row.owner}/{row.name}") or datetime.min,
+        )
+
+    async def sync_all(self) -> Dict[str, Dict[str, int]]:
+        """
+        Sync every tracked repository once.
+
+        Returns:
+            Per-repository counts (see sync_repository) for repositories synced
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        rate_limited = False
+        summary: Dict[str, Dict[str, int]] = {}
+
+        async def sync(owner: str, name: str) -> None:
+            nonlocal rate_limited
+            async with semaphore:
+                if rate_limited:
+                    return
+                try:
+                    summary[f"{owner}/{name}"] = await self.sync_repository(owner, name)
+                except RateLimitException:
+                    rate_limited = True
+                    logger.warning("GitHub rate limit exhausted; resuming sync next interval")
+                except Exception:
+                    logger.exception("Sync of %s/%s failed", owner, name)
+
+        await asyncio.gather(*(sync(row.owner, row.name) for row in await self._repositories()))
+        return summary
+
+
+# Singleton instance
+github_sync = GitHubSyncWorker(
+    interval=settings.SYNC_INTERVAL_SECONDS,
+    max_concurrency=settings.SYNC_MAX_CONCURRENCY,
+    overlap=timedelta(seconds=settings.SYNC_OVERLAP_SECONDS),
+    initial_lookback=timedelta(days=settings.SYNC_INITIAL_LOOKBACK_DAYS) or None,
+)
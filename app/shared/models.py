@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON
+from sqlalchemy import BigInteger, Column, Integer, String, Float, DateTime, Boolean, Text, JSON, Index, UniqueConstraint
 from datetime import datetime
 from .database import Base
 
@@ -52,13 +52,84 @@ class AnalysisCache(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     cache_key = Column(String, unique=True, index=True, nullable=False)
-    module = Column(String, nullable=False)  # which module created this
+    module = Column(String, nullable=False, index=True)  # which module created this
+    username = Column(String, nullable=True, index=True)  # subject user, for invalidation
     data = Column(JSON, nullable=False)
     expires_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class CacheGeneration(Base):
+    """
+    Invalidation generation of a module or user's cached analyses.
+
+    The durable copy of the generation markers in analysis cache keys:
+    the cache service may evict a marker, which must not revert it to an
+    older generation.
+    """
+    __tablename__ = "cache_generations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String, unique=True, nullable=False)  # e.g. "analysis:generation:user:octocat"
+    value = Column(BigInteger, nullable=False)  # time.time_ns() of the last invalidation
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ContributionEvent(Base):
+    """
+    Normalized GitHub contribution event.
+
+    One row per commit, pull request, review, issue, issue comment or
+    label applied, so modules can answer "what did user X do in repo Y
+    over the last N days" from local indexed data.
+    """
+    __tablename__ = "contribution_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(String, unique=True, nullable=False)  # stable GitHub identity, e.g. "review:123"
+    event_type = Column(String, nullable=False)  # see app.shared.event_store.EventType
+    repository = Column(String, nullable=False)  # owner/name
+    author = Column(String, nullable=True)  # GitHub login, None for deleted users
+    occurred_at = Column(DateTime, nullable=False)
+    number = Column(Integer, nullable=True)  # issue / pull request the event belongs to
+    data = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_contribution_events_author_occurred_at", "author", "occurred_at"),
+        Index("ix_contribution_events_repository_occurred_at", "repository", "occurred_at"),
+        # Joins comments and reviews to the issue / pull request they belong to
+        Index("ix_contribution_events_repository_number", "repository", "number"),
+    )
+
+
+class SyncCursor(Base):
+    """
+    High-water mark of the incremental GitHub sync.
+
+    One row per tracked repository and resource (commits, activity,
+    issue_comments, issue_events): the next sync only fetches what changed
+    after `since`, and skips the resource entirely while `etag` still matches.
+    """
+    __tablename__ = "sync_cursors"
+
+    id = Column(Integer, primary_key=True, index=True)
+    repository = Column(String, nullable=False)  # owner/name
+    resource = Column(String, nullable=False)
+    since = Column(DateTime, nullable=True)  # None until the first successful sync
+    etag = Column(String, nullable=True)  # ETag of the newest-item probe
+    last_synced_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("repository", "resource", name="uq_sync_cursors_repository_resource"),
+    )
+
+
 # Module-specific models should be defined in their respective modules
 # Example structure:
 # app/modules/invisible_labor_scoring/models.py
@@ -0,0 +1,271 @@
+from typing import Optional, Callable, Awaitable, List, Tuple
+from contextlib import asynccontextmanager
+from enum import IntEnum
+import asyncio
+import heapq
+import itertools
+import random
+import time
+import httpx
+from app.core.config import settings
+from app.shared.exceptions import RateLimitException
+
+# Server errors worth retrying with backoff
+_RETRYABLE_STATUS = {500, 502, 503, 504}
+
+
+class RequestPriority(IntEnum):
+    """Scheduling priority for GitHub requests (lower runs first)."""
+    INTERACTIVE = 0
+    BATCH = 10
+
+
+class TokenBucket:
+    """
+    Token bucket pacing requests to a sustainable rate.
+
+    The rate starts at the configured ceiling and is lowered from the
+    live X-RateLimit-* headers so the remaining budget lasts until reset.
+    Tokens are reserved up front (the balance may go negative), so each
+    caller gets its wait time without polling.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token.
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+    def refund(self) -> None:
+        """Give back a token reserved by a caller that will not send."""
+        self._tokens += 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for `seconds` (e.g. after a secondary limit)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def update(self, remaining: int, reset_in: float) -> None:
+        """
+        Re-pace from the live rate limit headers.
+
+        Args:
+            remaining: X-RateLimit-Remaining
+            reset_in: Seconds until X-RateLimit-Reset
+        """
+        reset_in = max(reset_in, 1.0)
+        if remaining <= 0:
+            # Budget exhausted: hold everything until reset, then resume at full rate
+            self.pause(reset_in)
+            self.rate = self.max_rate
+            self._tokens = min(self._tokens, 0.0)
+            return
+        self.rate = max(min(self.max_rate, remaining / reset_in), 0.01)
+        self._tokens = min(self._tokens, float(remaining))
+
+
+class PrioritySemaphore:
+    """
+    Concurrency limiter that hands free slots to the highest priority waiter.
+
+    Waiters with equal priority are served in arrival order.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: int = RequestPriority.INTERACTIVE) -> None:
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Hand the slot straight to the waiter; _active is unchanged
+                future.set_result(None)
+                return
+        self._active -= 1
+
+
+class RequestScheduler:
+    """
+    Rate-limit-aware scheduler for GitHub requests.
+
+    Caps concurrency, paces sends with a token bucket fed by the
+    X-RateLimit-* headers, serves interactive work before batch work,
+    and retries rate-limited or failed requests with jittered backoff.
+    RateLimitException is raised only when the required wait would run
+    past the deadline.
+
+    Usage:
+    response = await request_scheduler.send(
+        lambda: client.request("GET", url),
+        priority=RequestPriority.BATCH,
+    )
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        rate: float = 10.0,
+        burst: int = 20,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        deadline: float = 30.0,
+    ):
+        self._slots = PrioritySemaphore(max_concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+
+    @asynccontextmanager
+    async def slot(self, priority: int = RequestPriority.INTERACTIVE, deadline_at: Optional[float] = None):
+        """
+        Hold a concurrency slot and wait for a token before sending.
+
+        Raises:
+            RateLimitException: If the token wait would run past `deadline_at`
+        """
+        await self._slots.acquire(priority)
+        try:
+            wait = self.bucket.reserve()
+            if deadline_at is not None and time.monotonic() + wait > deadline_at:
+                self.bucket.refund()
+                raise RateLimitException(
+                    f"GitHub rate limit exceeded; retry in {int(wait) + 1} seconds"
+                )
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            self._slots.release()
+
+    def observe(self, response: httpx.Response) -> None:
+        """Feed the rate limit headers of a response into the token bucket."""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is not None and reset is not None:
+            self.bucket.update(int(remaining), float(reset) - time.time())
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given attempt number."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def rate_limit_wait(response: httpx.Response) -> Optional[float]:
+        """
+        Get the wait imposed by a rate limited response.
+
+        Returns:
+            Seconds to wait, or None if the response is not rate limited
+        """
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            # Secondary rate limit
+            return float(retry_after)
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            reset = float(response.headers.get("x-ratelimit-reset", time.time() + 60))
+            return max(reset - time.time(), 0.0) + 1.0
+        return None
+
+    async def send(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        priority: int = RequestPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        Run a request through the scheduler with retries.
+
+        Args:
+            send: Zero-argument coroutine factory performing one attempt
+            priority: RequestPriority of the caller
+            deadline: Seconds the caller is willing to wait in total
+
+        Returns:
+            The final response (non-retryable errors are left to the caller)
+
+        Raises:
+            RateLimitException: If waiting out a rate limit would exceed the deadline
+        """
+        deadline_at = time.monotonic() + (self.deadline if deadline is None else deadline)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            async with self.slot(priority, deadline_at):
+                try:
+                    response = await send()
+                except httpx.TransportError:
+                    if last_attempt:
+                        raise
+                    response = None
+                else:
+                    self.observe(response)
+
+            limited_wait = self.rate_limit_wait(response) if response is not None else None
+            if limited_wait is not None:
+                if last_attempt or time.monotonic() + limited_wait > deadline_at:
+                    raise RateLimitException(
+                        f"GitHub rate limit exceeded; retry in {int(limited_wait) + 1} seconds"
+                    )
+                self.bucket.pause(limited_wait)
+                delay = limited_wait + random.uniform(0, self.backoff_base)
+            elif response is None or response.status_code in _RETRYABLE_STATUS:
+                delay = self.backoff(attempt)
+                if response is not None and (last_attempt or time.monotonic() + delay > deadline_at):
+                    return response
+            else:
+                return response
+
+            await asyncio.sleep(delay)
+
+        return response
+
+
+# Singleton instance shared by every GitHubClient
+request_scheduler = RequestScheduler(
+    max_concurrency=settings.GITHUB_MAX_CONCURRENCY,
+    rate=settings.GITHUB_REQUESTS_PER_SECOND,
+    burst=settings.GITHUB_BURST,
+    max_retries=settings.GITHUB_MAX_RETRIES,
+    backoff_base=settings.GITHUB_BACKOFF_BASE,
+    backoff_max=settings.GITHUB_BACKOFF_MAX,
+    deadline=settings.GITHUB_RATE_LIMIT_DEADLINE,
+)
@@ -0,0 +1,68 @@
+from typing import Dict, Callable, Awaitable, TypeVar
+import asyncio
+import functools
+from app.shared.utils import generate_request_cache_key
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    In-flight request coalescing.
+
+    Concurrent calls with the same key share one awaitable instead of
+    running N times. Once the call finishes the key is released, so later
+    calls run again (combine with a cache to reuse finished results).
+
+    Usage:
+    result = await single_flight.do(key, lambda: fetch(...))
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn` once per key among concurrent callers.
+
+        A caller being cancelled does not cancel the shared call for the
+        others.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(future)
+
+    def _release(self, key: str, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def in_flight(self) -> int:
+        """Number of calls currently being shared."""
+        return len(self._inflight)
+
+
+# Singleton instance
+single_flight = SingleFlight()
+
+
+def coalesce(prefix: str):
+    """
+    Decorator coalescing concurrent identical calls of an async service method.
+
+    The key is built with generate_request_cache_key from the arguments
+    after `self`, so pydantic request models are keyed by their fields.
+
+    Usage:
+    @coalesce("sentiment_analysis:analyze")
+    async def analyze(self, request: SentimentAnalysisRequest): ...
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            key = generate_request_cache_key(prefix, *args, **kwargs)
+            return await single_flight.do(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
@@ -1,5 +1,6 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+from pydantic import BaseModel
 
 
 def parse_github_repo(repo_url: str) -> tuple[str, str]:
@@ -21,6 +22,17 @@ def parse_github_repo(repo_url: str) -> tuple[str, str]:
     raise ValueError(f"Invalid GitHub repository URL: {repo_url}")
 
 
+def repository_name(repo_url: str) -> str:
+    """
+    Canonical "owner/repo" of a repository name or URL, as stored in the event store.
+
+    Example:
+        repository_name("https://github.com/owner/repo.git") -> "owner/repo"
+    """
+    owner, repo = parse_github_repo(repo_url)
+    return f"{owner}/{repo.removesuffix('.git')}"
+
+
 def calculate_date_range(days: int) -> tuple[datetime, datetime]:
     """
     Calculate date range from today going back N days.
@@ -36,6 +48,42 @@ def calculate_date_range(days: int) -> tuple[datetime, datetime]:
     return start_date, end_date
 
 
+def parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a GitHub ISO 8601 timestamp into a naive UTC datetime.
+
+    Args:
+        value: Timestamp string such as "2024-01-31T12:00:00Z"
+
+    Returns:
+        Naive UTC datetime (comparable with calculate_date_range), or None
+
+    Example:
+        parse_github_datetime("2024-01-31T12:00:00Z") -> datetime(2024, 1, 31, 12, 0)
+    """
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def format_github_datetime(value: datetime) -> str:
+    """
+    Format a datetime as a GitHub ISO 8601 timestamp.
+
+    Args:
+        value: Naive UTC or timezone-aware datetime
+
+    Returns:
+        Timestamp string such as "2024-01-31T12:00:00Z"
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def format_percentage(value: float, decimals: int = 2) -> str:
     """
     Format float as percentage string.
@@ -93,3 +141,31 @@ def generate_cache_key(prefix: str, *args, **kwargs) -> str:
         parts.append(kwargs_str)
 
     return ":".join(parts)
+
+
+def generate_request_cache_key(prefix: str, *args, **kwargs) -> str:
+    """
+    Generate cache key for a service call, expanding pydantic models.
+
+    Fields of BaseModel arguments are merged into the keyword arguments,
+    so the key does not depend on the model's repr.
+
+    Args:
+        prefix: Cache key prefix
+        *args: Positional arguments (pydantic models or plain values)
+        **kwargs: Keyword arguments
+
+    Returns:
+        Cache key string
+
+    Example:
+        generate_request_cache_key("burnout", BurnoutRiskRequest(username="bob"))
+        -> "burnout:repository=None:time_period_days=30:username=bob"
+    """
+    plain_args = []
+    for arg in args:
+        if isinstance(arg, BaseModel):
+            kwargs = {**arg.model_dump(), **kwargs}
+        else:
+            plain_args.append(arg)
+    return generate_cache_key(prefix, *plain_args, **kwargs)
@@ -0,0 +1,706 @@
+"""
+Local stand-in for the GitHub API.
+
+Serves deterministic synthetic data for the endpoints GitHubClient uses
+(users, repositories, commits, pull requests, issues, comments, reviews,
+issue events and the GraphQL activity queries) with GitHub-style Link
+pagination, rate-limit headers, ETags / 304s and injectable latency.
+
+Every item is computed from its index, so a page costs the same whether a
+repository holds a thousand events or a million, and the same
+configuration always yields the same data.
+
+Each of `--users` users owns `--repos-per-user` repositories named
+user{i}/repo{j}; activity inside each repository is spread over the last
+`--days` days and attributed round-robin to all users.
+
+Usage:
+    python -m benchmarks.fake_github --port 9000 --commits 10000 --latency-ms 20
+    GITHUB_API_URL=http://localhost:9000 python main.py
+
+In process:
+    fake = create_app(FakeGitHubConfig(commits=1000))
+    await use_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)))
+"""
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from app.shared.utils import format_github_datetime, parse_github_datetime
+
+LABELS = ["bug", "enhancement", "documentation", "question", "good first issue"]
+
+# Mixed-tone sample text so sentiment analysis has something to score
+SAMPLE_TEXTS = [
+    "Thanks for the quick review, this looks great!",
+    "I can reproduce this on the latest release.",
+    "This is still broken and it is really frustrating.",
+    "Could you add a test for the edge case?",
+    "Awesome work, really appreciate the help.",
+    "Not sure this is the right approach, it seems overly complicated.",
+    "LGTM, merging once CI passes.",
+    "Please stop pinging maintainers about this, we are overwhelmed.",
+    "Great catch! I did not know about that behaviour.",
+    "The docs are confusing and the example does not work.",
+]
+
+# Offsets that keep ids unique across item kinds within an issue number
+_REVIEW_ID_OFFSET = 500
+_EVENT_ID_OFFSET = 999
+
+
+@dataclass
+class FakeGitHubConfig:
+    """Size and behaviour of the fake GitHub API."""
+
+    users: int = 10
+    repos_per_user: int = 2
+    commits: int = 1000  # per repository
+    pulls: int = 200  # per repository
+    issues: int = 200  # per repository
+    comments_per_issue: int = 3  # also on pull requests
+    reviews_per_pull: int = 2
+    days: int = 365
+    end: Optional[datetime] = None  # newest activity (naive UTC); defaults to today
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    rate_limit: int = 5000  # requests per window and token; 0 disables limiting
+    rate_limit_window: int = 3600
+    seed: int = 0
+
+    def events_per_repository(self) -> int:
+        numbers = self.pulls + self.issues
+        return (
+            self.commits
+            + numbers * (1 + self.comments_per_issue + 1)  # item, comments, label event
+            + self.pulls * self.reviews_per_pull
+        )
+
+    def total_events(self) -> int:
+        return self.users * self.repos_per_user * self.events_per_repository()
+
+
+class FakeRepository:
+    """Index-addressed synthetic activity of one repository."""
+
+    def __init__(self, config: FakeGitHubConfig, owner_index: int, repo_index: int):
+        self.config = config
+        self.owner = f"user{owner_index}"
+        self.name = f"repo{repo_index}"
+        self.full_name = f"{self.owner}/{self.name}"
+        self.index = owner_index * config.repos_per_user + repo_index
+        self.id = 1000 + self.index
+
+        end = config.end or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.end = end
+        self.start = end - timedelta(days=config.days)
+        self.span = (end - self.start).total_seconds()
+        self.numbers = config.pulls + config.issues
+        self.number_step = self.span / max(self.numbers, 1)
+        self.open_after = int(self.numbers * 0.9)  # the newest 10% are still open
+
+    # Identity and time
+
+    def _author(self, index: int) -> Dict:
+        login = f"user{(index + self.index) % self.config.users}"
+        return {"login": login, "id": 1 + (index + self.index) % self.config.users, "type": "User"}
+
+    def _text(self, index: int) -> str:
+        return SAMPLE_TEXTS[(index * 7 + self.index) % len(SAMPLE_TEXTS)]
+
+    def _id(self, number: int, offset: int) -> int:
+        return (self.index + 1) * 10 ** 10 + number * 1000 + offset
+
+    def _at(self, seconds: float) -> datetime:
+        return self.start + timedelta(seconds=seconds)
+
+    def commit_date(self, index: int) -> datetime:
+        """Commit `index` in chronological order."""
+        return self._at((index + 0.5) * self.span / max(self.config.commits, 1))
+
+    def created(self, number: int) -> datetime:
+        return self._at((number - 0.5) * self.number_step)
+
+    def updated(self, number: int) -> datetime:
+        return self.created(number) + timedelta(seconds=self.number_step / 2)
+
+    def comment_date(self, number: int, index: int) -> datetime:
+        step = self.number_step / (2 * (self.config.comments_per_issue + 1))
+        return self.created(number) + timedelta(seconds=(index + 1) * step)
+
+    def review_date(self, number: int, index: int) -> datetime:
+        step = self.number_step / (2 * (self.config.reviews_per_pull + 1))
+        return self.created(number) + timedelta(seconds=(index + 1) * step)
+
+    # Pull requests are spread evenly over the issue numbers
+
+    def is_pull(self, number: int) -> bool:
+        return self.pulls_up_to(number) > self.pulls_up_to(number - 1)
+
+    def pulls_up_to(self, number: int) -> int:
+        """Number of pull requests among issue numbers 1..number."""
+        return (number * self.config.pulls) // max(self.numbers, 1)
+
+    def pull_number(self, index: int) -> int:
+        """Number of the `index`-th (0-based) pull request."""
+        pulls = self.config.pulls
+        return ((index + 1) * self.numbers + pulls - 1) // pulls
+
+    # REST shapes
+
+    def repository(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "full_name": self.full_name,
+            "owner": {"login": self.owner},
+            "description": f"Synthetic repository {self.full_name}",
+            "html_url": f"https://github.com/{self.full_name}",
+            "stargazers_count": (self.index * 37) % 5000,
+            "forks_count": (self.index * 11) % 800,
+            "created_at": format_github_datetime(self.start),
+            "updated_at": format_github_datetime(self.end),
+            "pushed_at": format_github_datetime(self.end - timedelta(days=self.index % 30)),
+        }
+
+    def commit(self, index: int) -> Dict:
+        sha = hashlib.sha1(f"{self.full_name}:{index}".encode()).hexdigest()
+        author = self._author(index)
+        date = format_github_datetime(self.commit_date(index))
+        return {
+            "sha": sha,
+            "author": author,
+            "committer": author,
+            "commit": {
+                "message": f"Change {index}: {self._text(index)}",
+                "author": {"name": author["login"], "date": date},
+                "committer": {"name": author["login"], "date": date},
+            },
+            "html_url": f"https://github.com/{self.full_name}/commit/{sha}",
+        }
+
+    def _state(self, number: int) -> str:
+        return "open" if number > self.open_after else "closed"
+
+    def issue(self, number: int) -> Dict:
+        """Issue endpoint item (pull requests included, as on GitHub)."""
+        closed = self._state(number) == "closed"
+        item = {
+            "id": self._id(number, 0),
+            "number": number,
+            "title": f"Item {number}: {self._text(number)[:40]}",
+            "body": self._text(number + 1),
+            "state": self._state(number),
+            "user": self._author(number),
+            "labels": [{"name": LABELS[number % len(LABELS)]}],
+            "comments": self.config.comments_per_issue,
+            "created_at": format_github_datetime(self.created(number)),
+            "updated_at": format_github_datetime(self.updated(number)),
+            "closed_at": format_github_datetime(self.updated(number)) if closed else None,
+            "html_url": f"https://github.com/{self.full_name}/issues/{number}",
+        }
+        if self.is_pull(number):
+            item["pull_request"] = {"merged_at": self._merged_at(number)}
+        return item
+
+    def _merged_at(self, number: int) -> Optional[str]:
+        if self._state(number) == "closed" and number % 3:
+            return format_github_datetime(self.updated(number))
+        return None
+
+    def pull(self, number: int) -> Dict:
+        item = self.issue(number)
+        item.pop("pull_request")
+        item.pop("comments")
+        item["merged_at"] = self._merged_at(number)
+        item["draft"] = False
+        item["html_url"] = f"https://github.com/{self.full_name}/pull/{number}"
+        return item
+
+    def comment(self, number: int, index: int) -> Dict:
+        date = format_github_datetime(self.comment_date(number, index))
+        return {
+            "id": self._id(number, index + 1),
+            "user": self._author(number + index + 1),
+            "body": self._text(number * 3 + index),
+            "created_at": date,
+            "updated_at": date,
+            "issue_url": f"https://api.github.com/repos/{self.full_name}/issues/{number}",
+            "html_url": f"https://github.com/{self.full_name}/issues/{number}#comment-{index}",
+        }
+
+    def review(self, number: int, index: int) -> Dict:
+        return {
+            "id": self._id(number, _REVIEW_ID_OFFSET + index),
+            "user": self._author(number + index + 2),
+            "body": self._text(number * 5 + index),
+            "state": "APPROVED" if (number + index) % 3 else "CHANGES_REQUESTED",
+            "submitted_at": format_github_datetime(self.review_date(number, index)),
+            "html_url": f"https://github.com/{self.full_name}/pull/{number}#review-{index}",
+        }
+
+    def label_event(self, number: int) -> Dict:
+        return {
+            "id": self._id(number, _EVENT_ID_OFFSET),
+            "event": "labeled",
+            "actor": self._author(number + 3),
+            "label": {"name": LABELS[number % len(LABELS)]},
+            "issue": {"number": number},
+            "created_at": format_github_datetime(self.created(number) + timedelta(seconds=self.number_step / 4)),
+        }
+
+    # GraphQL shapes
+
+    @staticmethod
+    def _node(item: Dict, **extra) -> Dict:
+        return {
+            "number": item["number"],
+            "title": item["title"],
+            "body": item["body"],
+            "author": {"login": item["user"]["login"]},
+            "labels": {"nodes": item["labels"]},
+            "createdAt": item["created_at"],
+            "updatedAt": item["updated_at"],
+            "closedAt": item["closed_at"],
+            "url": item["html_url"],
+            **extra,
+        }
+
+    def _comment_connection(self, number: int, size: int, total: bool = False) -> Dict:
+        count = self.config.comments_per_issue
+        nodes = []
+        for index in range(min(count, size)):
+            comment = self.comment(number, index)
+            nodes.append({
+                "databaseId": comment["id"],
+                "author": {"login": comment["user"]["login"]},
+                "body": comment["body"],
+                "createdAt": comment["created_at"],
+                "updatedAt": comment["updated_at"],
+                "url": comment["html_url"],
+            })
+        connection = {"pageInfo": {"hasNextPage": count > size}, "nodes": nodes}
+        if total:
+            connection["totalCount"] = count
+        return connection
+
+    def pull_node(self, number: int, nested: int) -> Dict:
+        pull = self.pull(number)
+        reviews = []
+        for index in range(min(self.config.reviews_per_pull, nested)):
+            review = self.review(number, index)
+            reviews.append({
+                "databaseId": review["id"],
+                "author": {"login": review["user"]["login"]},
+                "body": review["body"],
+                "state": review["state"],
+                "submittedAt": review["submitted_at"],
+                "url": review["html_url"],
+            })
+        state = "OPEN" if pull["state"] == "open" else ("MERGED" if pull["merged_at"] else "CLOSED")
+        return self._node(
+            pull,
+            state=state,
+            isDraft=False,
+            mergedAt=pull["merged_at"],
+            reviews={"pageInfo": {"hasNextPage": self.config.reviews_per_pull > nested}, "nodes": reviews},
+            comments=self._comment_connection(number, nested),
+        )
+
+    def issue_node(self, number: int, nested: int) -> Dict:
+        issue = self.issue(number)
+        return self._node(
+            issue,
+            state=issue["state"].upper(),
+            comments=self._comment_connection(number, nested, total=True),
+        )
+
+
+class FakeGitHub:
+    """Request handling shared by the REST and GraphQL routes."""
+
+    def __init__(self, config: FakeGitHubConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self._repositories: Dict[Tuple[str, str], FakeRepository] = {}
+        # Caller -> [remaining, reset epoch]
+        self._rate_limits: Dict[str, List[int]] = {}
+        self.requests = 0
+
+    def repository(self, owner: str, name: str) -> Optional[FakeRepository]:
+        key = (owner, name)
+        if key not in self._repositories:
+            owner_index = self._user_index(owner)
+            if owner_index is None or not name.startswith("repo") or not name[4:].isdigit():
+                return None
+            repo_index = int(name[4:])
+            if repo_index >= self.config.repos_per_user:
+                return None
+            self._repositories[key] = FakeRepository(self.config, owner_index, repo_index)
+        return self._repositories[key]
+
+    def _user_index(self, login: str) -> Optional[int]:
+        if not login.startswith("user") or not login[4:].isdigit():
+            return None
+        index = int(login[4:])
+        return index if index < self.config.users else None
+
+    # Transport behaviour
+
+    async def delay(self) -> None:
+        latency = self.config.latency_ms + self.random.uniform(0, self.config.latency_jitter_ms)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+    def _rate_limit(self, request: Request, consume: bool) -> Tuple[Dict[str, str], bool]:
+        """Rate-limit headers for the caller, and whether it is over the limit."""
+        if not self.config.rate_limit:
+            return {}, False
+        token = request.headers.get("authorization", request.client.host if request.client else "")
+        now = int(time.time())
+        state = self._rate_limits.get(token)
+        if state is None or state[1] <= now:
+            state = [self.config.rate_limit, now + self.config.rate_limit_window]
+            self._rate_limits[token] = state
+        exceeded = state[0] <= 0
+        if consume and not exceeded:
+            state[0] -= 1
+        headers = {
+            "x-ratelimit-limit": str(self.config.rate_limit),
+            "x-ratelimit-remaining": str(state[0]),
+            "x-ratelimit-used": str(self.config.rate_limit - state[0]),
+            "x-ratelimit-reset": str(state[1]),
+            "x-ratelimit-resource": "core",
+        }
+        return headers, exceeded
+
+    async def respond(self, request: Request, payload, links: Optional[Dict[str, str]] = None) -> Response:
+        """Serve a JSON payload with latency, rate limiting and ETag handling."""
+        self.requests += 1
+        await self.delay()
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+
+        # Conditional hits are free, as on GitHub
+        not_modified = request.headers.get("if-none-match") == etag
+        headers, exceeded = self._rate_limit(request, consume=not not_modified)
+        if exceeded:
+            return JSONResponse(
+                {"message": "API rate limit exceeded"}, status_code=403, headers=headers
+            )
+        headers["etag"] = etag
+        if links:
+            headers["link"] = ", ".join(f'<{url}>; rel="{rel}"' for rel, url in links.items())
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    async def not_found(self, request: Request) -> Response:
+        self.requests += 1
+        await self.delay()
+        headers, _ = self._rate_limit(request, consume=True)
+        return JSONResponse({"message": "Not Found"}, status_code=404, headers=headers)
+
+    async def page(self, request: Request, indices: range, render: Callable[[int], Dict]) -> Response:
+        """Serve one page of `indices` with GitHub-style Link headers."""
+        params = request.query_params
+        per_page = max(1, min(int(params.get("per_page", 30)), 100))
+        page = max(1, int(params.get("page", 1)))
+        selected = indices[(page - 1) * per_page:page * per_page]
+
+        links = {}
+        last = max(1, -(-len(indices) // per_page))
+        if page < last:
+            links["next"] = str(request.url.include_query_params(page=page + 1))
+            links["last"] = str(request.url.include_query_params(page=last))
+        if page > 1:
+            links["prev"] = str(request.url.include_query_params(page=page - 1))
+            links["first"] = str(request.url.include_query_params(page=1))
+        return await self.respond(request, [render(index) for index in selected], links)
+
+
+def _window(count: int, timestamp: Callable[[int], datetime], since: Optional[str], until: Optional[str],
+            first: int = 0) -> Tuple[int, int]:
+    """Index bounds [lo, hi) of items (sorted by `timestamp`) inside a since/until window."""
+    lo, hi = first, first + count
+    since_at = parse_github_datetime(since)
+    until_at = parse_github_datetime(until)
+    if since_at:
+        lo = bisect.bisect_left(range(first, first + count), since_at, key=timestamp) + first
+    if until_at:
+        hi = bisect.bisect_right(range(first, first + count), until_at, key=timestamp) + first
+    return lo, max(lo, hi)
+
+
+def _ordered(lo: int, hi: int, descending: bool, step: int = 1) -> range:
+    if descending:
+        return range(hi - 1, lo - 1, -step)
+    return range(lo, hi, step)
+
+
+def _graphql_cursor(number: int) -> str:
+    return str(number)
+
+
+def create_app(config: Optional[FakeGitHubConfig] = None) -> FastAPI:
+    """Build the fake GitHub API app."""
+    config = config or FakeGitHubConfig()
+    fake = FakeGitHub(config)
+    app = FastAPI(title="Fake GitHub API", docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.fake = fake
+
+    @app.get("/users/{login}")
+    async def get_user(request: Request, login: str):
+        index = fake._user_index(login)
+        if index is None:
+            return await fake.not_found(request)
+        return await fake.respond(request, {
+            "login": login,
+            "id": index + 1,
+            "name": f"User {index}",
+            "type": "User",
+            "public_repos": config.repos_per_user,
+            "followers": (index * 13) % 500,
+            "created_at": "2015-01-01T00:00:00Z",
+        })
+
+    @app.get("/users/{login}/repos")
+    async def get_user_repos(request: Request, login: str):
+        if fake._user_index(login) is None:
+            return await fake.not_found(request)
+        return await fake.page(
+            request,
+            range(config.repos_per_user),
+            lambda index: fake.repository(login, f"repo{index}").repository(),
+        )
+
+    @app.get("/repos/{owner}/{name}")
+    async def get_repo(request: Request, owner: str, name: str):
+        repo = fake.repository(owner, name)
+        if repo is None:
+            return await fake.not_found(request)
+        return await fake.respond(request, repo.repository())
+
+    @app.get("/repos/{owner}/{name}/commits")
+    async def get_commits(request: Request, owner: str, name: str):
+        repo = fake.repository(owner, name)
+        if repo is None:
+            return await fake.not_found(request)
+        params = request.query_params
+        lo, hi = _window(config.commits, repo.commit_date, params.get("since"), params.get("until"))
+        step = 1
+        author = params.get("author")
+        if author:
+            # Commit i is authored by user (i + repo index) % users
+            author_index = fake._user_index(author)
+            if author_index is None:
+                return await fake.page(request, range(0), repo.commit)
+            step = config.users
+            last = hi - 1 - ((hi - 1 + repo.index - author_index) % config.users)
+            return await fake.page(request, range(last, lo - 1, -step), repo.commit)
+        return await fake.page(request, _ordered(lo, hi, descending=True), repo.commit)
+
+    def _state_bounds(repo: FakeRepository, state: str, lo: int, hi: int) -> Tuple[int, int]:
+        if state == "open":
+            return max(lo, repo.open_after + 1), hi
+        if state == "closed":
+            return lo, min(hi, repo.open_after + 1)
+        return lo, hi
+
+    @app.get("/repos/{owner}/{name}/issues")
+    async def get_issues(request: Request, owner: str, name: str):
+        repo = fake.repository(owner, name)
+        if repo is None:
+            return await fake.not_found(request)
+        params = request.query_params
+        lo, hi = _window(repo.numbers, repo.updated, params.get("since"), None, first=1)
+        lo, hi = _state_bounds(repo, params.get("state", "open"), lo, hi)
+        descending = params.get("direction", "desc") == "desc"
+        return await fake.page(request, _ordered(lo, hi, descending), repo.issue)
+
+    @app.get("/repos/{owner}/{name}/pulls")
+    async def get_pulls(request: Request, owner: str, name: str):
+        repo = fake.repository(owner, name)
+        if repo is None:
+            return await fake.not_found(request)
+        params = request.query_params
+        # Pull request indices, bounded by the state cut-off on their numbers
+        lo, hi = 0, config.pulls
+        state = params.get("state", "open")
+        cutoff = bisect.bisect_right(range(config.pulls), repo.open_after, key=repo.pull_number)
+        if state == "open":
+            lo = cutoff
+        elif state == "closed":
+            hi = cutoff
+        descending = params.get("direction", "desc") == "desc"
+        return await fake.page(
+            request,
+            _ordered(lo, hi, descending),
+            lambda index: repo.pull(repo.pull_number(index)),
+        )
+
+    @app.get("/repos/{owner}/{name}/issues/comments")
+    async def get_repo_comments(request: Request, owner: str, name: str):
+        repo = fake.repository(owner, name)
+        if repo is None:
+            return await fake.not_found(request)
+        per_issue = config.comments_per_issue
+        if not per_issue:
+            return await fake.page(request, range(0), repo.issue)
+
+        def at(index: int) -> datetime:
+            return repo.comment_date(index // per_issue + 1, index % per_issue)
+
+        def render(index: int) -> Dict:
+            return repo.comment(index // per_issue + 1, index % per_issue)
+
+        params = request.query_params
+        lo, hi = _window(repo.numbers * per_issue, at, params.get("since"), None)
+        descending = params.get("direction", "asc") == "desc"
+        return await fake.page(request, _ordered(lo, hi, descending), render)
+
+    @app.get("/repos/{owner}/{name}/issues/events")
+    async def get_issue_events(request: Request, owner: str, name: str):
+        repo = fake.repository(owner, name)
+        if repo is None:
+            return await fake.not_found(request)
+        return await fake.page(request, _ordered(1, repo.numbers + 1, descending=True), repo.label_event)
+
+    @app.get("/repos/{owner}/{name}/issues/{number}/comments")
+    async def get_issue_comments(request: Request, owner: str, name: str, number: int):
+        repo = fake.repository(owner, name)
+        if repo is None or not 1 <= number <= repo.numbers:
+            return await fake.not_found(request)
+        lo, hi = _window(
+            config.comments_per_issue,
+            lambda index: repo.comment_date(number, index),
+            request.query_params.get("since"),
+            None,
+        )
+        return await fake.page(request, range(lo, hi), lambda index: repo.comment(number, index))
+
+    @app.get("/repos/{owner}/{name}/pulls/{number}/reviews")
+    async def get_reviews(request: Request, owner: str, name: str, number: int):
+        repo = fake.repository(owner, name)
+        if repo is None or not 1 <= number <= repo.numbers or not repo.is_pull(number):
+            return await fake.not_found(request)
+        return await fake.page(
+            request, range(config.reviews_per_pull), lambda index: repo.review(number, index)
+        )
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        payload = await request.json()
+        query = payload.get("query", "")
+        variables = payload.get("variables") or {}
+        repo = fake.repository(variables.get("owner", ""), variables.get("repo", ""))
+        if repo is None:
+            return await fake.respond(request, {
+                "data": {"repository": None},
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}],
+            })
+
+        size = min(int(variables.get("pageSize", 50)), 100)
+        nested = min(int(variables.get("nestedSize", 100)), 100)
+        cursor = variables.get("cursor")
+
+        if "pullRequests(" in query:
+            # Newest updated first, i.e. highest pull request index first
+            start = int(cursor) - 1 if cursor else config.pulls - 1
+            indices = range(start, max(start - size, -1), -1)
+            nodes = [repo.pull_node(repo.pull_number(index), nested) for index in indices]
+            end = indices[-1] if len(indices) else 0
+            connection = {
+                "pageInfo": {"hasNextPage": end > 0, "endCursor": _graphql_cursor(end) if nodes else None},
+                "nodes": nodes,
+            }
+            return await fake.respond(request, {"data": {"repository": {"pullRequests": connection}}})
+
+        if "issues(" in query:
+            since_lo, _ = _window(repo.numbers, repo.updated, variables.get("since"), None, first=1)
+            number = int(cursor) - 1 if cursor else repo.numbers
+            nodes = []
+            while number >= since_lo and len(nodes) < size:
+                if not repo.is_pull(number):
+                    nodes.append(repo.issue_node(number, nested))
+                number -= 1
+            # Issues (not pull requests) left among numbers since_lo..number
+            remaining = (number - since_lo + 1) - (repo.pulls_up_to(number) - repo.pulls_up_to(since_lo - 1))
+            has_next = number >= since_lo and remaining > 0
+            connection = {
+                "pageInfo": {
+                    "hasNextPage": has_next,
+                    "endCursor": _graphql_cursor(number + 1) if nodes else None,
+                },
+                "nodes": nodes,
+            }
+            return await fake.respond(request, {"data": {"repository": {"issues": connection}}})
+
+        return await fake.respond(request, {"errors": [{"message": "Unsupported query for the fake GitHub API"}]})
+
+    @app.get("/rate_limit")
+    async def rate_limit(request: Request):
+        headers, _ = fake._rate_limit(request, consume=False)
+        core = {
+            "limit": config.rate_limit,
+            "remaining": int(headers.get("x-ratelimit-remaining", config.rate_limit)),
+            "reset": int(headers.get("x-ratelimit-reset", 0)),
+        }
+        return JSONResponse({"resources": {"core": core}, "rate": core}, headers=headers)
+
+    return app
+
+
+def config_from_args(args: argparse.Namespace) -> FakeGitHubConfig:
+    return FakeGitHubConfig(
+        users=args.users,
+        repos_per_user=args.repos_per_user,
+        commits=args.commits,
+        pulls=args.pulls,
+        issues=args.issues,
+        comments_per_issue=args.comments_per_issue,
+        reviews_per_pull=args.reviews_per_pull,
+        days=args.days,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    """Dataset and behaviour options shared with the benchmark runner."""
+    defaults = FakeGitHubConfig()
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--repos-per-user", type=int, default=defaults.repos_per_user)
+    parser.add_argument("--commits", type=int, default=defaults.commits, help="Commits per repository")
+    parser.add_argument("--pulls", type=int, default=defaults.pulls, help="Pull requests per repository")
+    parser.add_argument("--issues", type=int, default=defaults.issues, help="Issues per repository")
+    parser.add_argument("--comments-per-issue", type=int, default=defaults.comments_per_issue)
+    parser.add_argument("--reviews-per-pull", type=int, default=defaults.reviews_per_pull)
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-jitter-ms", type=float, default=defaults.latency_jitter_ms)
+    parser.add_argument("--rate-limit", type=int, default=defaults.rate_limit, help="0 disables limiting")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    add_dataset_arguments(parser)
+    arguments = parser.parse_args()
+    dataset = config_from_args(arguments)
+    print(f"Serving {dataset.total_events():,} synthetic events on http://{arguments.host}:{arguments.port}")
+    uvicorn.run(create_app(dataset), host=arguments.host, port=arguments.port, log_level="warning")
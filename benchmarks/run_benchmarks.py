@@ -0,0 +1,368 @@
+"""
+Benchmark and load test of the four module endpoints.
+
+Drives
+
+    POST /invisible-labor-scoring/calculate
+    POST /sentiment-analysis/analyze
+    POST /burnout-risk-detection/assess
+    POST /shareable-contribution-profile/generate
+
+with concurrent requests and reports throughput and p50/p95/p99 latency.
+
+In process (default), the app runs through httpx.ASGITransport against a
+temporary SQLite database. For each dataset size the event store is
+seeded with that many synthetic events, and GitHub is served by the
+in-process fake (benchmarks/fake_github.py). Each endpoint is measured
+twice:
+
+- cold: every request has distinct parameters, so nothing is cached
+- warm: the same request repeated, served from the analysis cache
+
+With --url the same load is sent to a running server instead. Point its
+GITHUB_API_URL at `python -m benchmarks.fake_github` sized to match.
+
+Results can be saved as JSON and compared with a stored baseline; any
+regression beyond the tolerance exits with status 1, and a missing
+baseline exits with status 2 unless --allow-missing-baseline is given.
+
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 10k,100k,1M --output results.json
+    python -m benchmarks.run_benchmarks --sizes 10k --save-baseline
+    python -m benchmarks.run_benchmarks --sizes 10k --baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --url http://localhost:8000 --requests 2000 --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List
+import httpx
+from benchmarks.fake_github import FakeGitHubConfig, FakeRepository, create_app
+
+API_PREFIX = "/api/v1"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Synthetic users and repositories (see FakeGitHubConfig)
+USERS = 10
+REPOS_PER_USER = 2
+
+
+def _invisible_labor(index: int, users: int) -> Dict:
+    return {"username": f"user{index % users}", "time_period_days": 1 + (index // users) % 365}
+
+
+def _sentiment(index: int, users: int) -> Dict:
+    repository = f"user{index % users}/repo{(index // users) % REPOS_PER_USER}"
+    return {"repository": repository, "time_period_days": 1 + (index // users) % 365}
+
+
+def _burnout(index: int, users: int) -> Dict:
+    return {"username": f"user{index % users}", "time_period_days": 1 + (index // users) % 365}
+
+
+def _profile(index: int, users: int) -> Dict:
+    return {"username": f"user{index % users}", "bio": f"Benchmark profile {index}"}
+
+
+# name -> (path, payload factory taking a request index)
+ENDPOINTS: Dict[str, tuple] = {
+    "invisible_labor_scoring": ("/invisible-labor-scoring/calculate", _invisible_labor),
+    "sentiment_analysis": ("/sentiment-analysis/analyze", _sentiment),
+    "burnout_risk_detection": ("/burnout-risk-detection/assess", _burnout),
+    "shareable_contribution_profile": ("/shareable-contribution-profile/generate", _profile),
+}
+
+
+def parse_size(value: str) -> int:
+    """Parse `10000`, `10k` or `1M`."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    return int(float(value.rstrip("km")) * multiplier)
+
+
+def dataset_config(events: int) -> FakeGitHubConfig:
+    """Scale the fake GitHub dataset to roughly `events` events in total."""
+    defaults = FakeGitHubConfig(users=USERS, repos_per_user=REPOS_PER_USER)
+    scale = events / defaults.total_events()
+    return FakeGitHubConfig(
+        users=USERS,
+        repos_per_user=REPOS_PER_USER,
+        commits=max(1, round(defaults.commits * scale)),
+        pulls=max(1, round(defaults.pulls * scale)),
+        issues=max(1, round(defaults.issues * scale)),
+        rate_limit=0,
+    )
+
+
+def fake_events(config: FakeGitHubConfig) -> Iterator[Dict]:
+    """Normalized contribution events for every repository of a dataset."""
+    from app.shared import event_store as events
+
+    for owner in range(config.users):
+        for repo_index in range(config.repos_per_user):
+            repo = FakeRepository(config, owner, repo_index)
+            name = repo.full_name
+            for index in range(config.commits):
+                yield events.commit_event(name, repo.commit(index))
+            for number in range(1, repo.numbers + 1):
+                if repo.is_pull(number):
+                    yield events.pull_request_event(name, repo.pull(number))
+                    for index in range(config.reviews_per_pull):
+                        yield events.review_event(name, number, repo.review(number, index))
+                else:
+                    yield events.issue_event(name, repo.issue(number))
+                for index in range(config.comments_per_issue):
+                    yield events.issue_comment_event(name, repo.comment(number, index), number)
+                yield events.label_event(name, repo.label_event(number))
+
+
+async def seed_event_store(config: FakeGitHubConfig, chunk: int = 5000) -> int:
+    """Replace the event store contents with a synthetic dataset."""
+    from sqlalchemy import delete
+    from app.shared.db_writer import db_writer
+    from app.shared.event_store import event_store
+    from app.shared.models import ContributionEvent
+
+    async def clear(db) -> None:
+        await db.execute(delete(ContributionEvent))
+
+    await db_writer.submit(clear)
+    written = 0
+    batch: List[Dict] = []
+    for event in fake_events(config):
+        batch.append(event)
+        if len(batch) >= chunk:
+            written += await event_store.upsert(batch)
+            batch = []
+    written += await event_store.upsert(batch)
+    return written
+
+
+async def reset_caches() -> None:
+    """Drop cached analysis results so the cold scenario really is cold."""
+    from app.shared.analysis_cache import analysis_cache
+    from app.shared.cache import cache_service
+
+    for module in ENDPOINTS:
+        await analysis_cache.invalidate_module(module)
+    await cache_service.clear()
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    path: str,
+    payloads: Callable[[int], Dict],
+    requests: int,
+    concurrency: int,
+) -> Dict:
+    """Send `requests` POSTs with `concurrency` workers and summarize latencies."""
+    latencies: List[float] = []
+    errors = 0
+    indices = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in indices:
+            started = time.perf_counter()
+            try:
+                response = await client.post(path, json=payloads(index))
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "errors": errors,
+    }
+
+
+async def run_endpoints(client: httpx.AsyncClient, size: str, args: argparse.Namespace) -> List[Dict]:
+    results = []
+    for name in args.endpoints:
+        path, factory = ENDPOINTS[name]
+        scenarios = {
+            "cold": lambda index, factory=factory: factory(index, USERS),
+            "warm": lambda index, factory=factory: factory(0, USERS),
+        }
+        for scenario, payloads in scenarios.items():
+            # Warm-up requests use indices past the measured ones, so they never pre-fill cold keys
+            for index in range(args.warmup):
+                await client.post(API_PREFIX + path, json=payloads(args.requests + index))
+            result = await measure(client, API_PREFIX + path, payloads, args.requests, args.concurrency)
+            result.update(endpoint=name, size=size, scenario=scenario)
+            results.append(result)
+            print(format_result(result), flush=True)
+    return results
+
+
+async def run_in_process(args: argparse.Namespace) -> List[Dict]:
+    from app.shared.github_client import use_http_client
+    from main import app, lifespan
+
+    results = []
+    async with lifespan(app):
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark")
+        async with client:
+            for size in args.sizes:
+                config = dataset_config(size)
+                await use_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app(config))))
+                started = time.perf_counter()
+                seeded = await seed_event_store(config)
+                print(f"Seeded {seeded:,} events in {time.perf_counter() - started:.1f}s", flush=True)
+                await reset_caches()
+                results += await run_endpoints(client, label_size(size), args)
+    return results
+
+
+async def run_remote(args: argparse.Namespace) -> List[Dict]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        return await run_endpoints(client, "remote", args)
+
+
+def label_size(size: int) -> str:
+    if size >= 1_000_000 and size % 1_000_000 == 0:
+        return f"{size // 1_000_000}M"
+    if size >= 1_000 and size % 1_000 == 0:
+        return f"{size // 1_000}k"
+    return str(size)
+
+
+def format_result(result: Dict) -> str:
+    return (
+        f"{result['endpoint']:<32} {result['size']:>6} {result['scenario']:<5} "
+        f"{result['throughput_rps']:>9.1f} req/s  p50 {result['p50_ms']:>8.2f}ms  "
+        f"p95 {result['p95_ms']:>8.2f}ms  p99 {result['p99_ms']:>8.2f}ms  errors {result['errors']}"
+    )
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float, min_delta_ms: float) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    A result regresses when its p95 latency grows by more than `tolerance`
+    (and by at least `min_delta_ms`, to ignore sub-millisecond noise), its
+    throughput drops by more than `tolerance`, or it has new errors.
+    """
+    stored = {(r["endpoint"], r["size"], r["scenario"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = stored.get((result["endpoint"], result["size"], result["scenario"]))
+        if before is None:
+            continue
+        label = f"{result['endpoint']} {result['size']} {result['scenario']}"
+        p95_limit = max(before["p95_ms"] * (1 + tolerance), before["p95_ms"] + min_delta_ms)
+        if result["p95_ms"] > p95_limit:
+            regressions.append(f"{label}: p95 {before['p95_ms']}ms -> {result['p95_ms']}ms")
+        if result["throughput_rps"] < before["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{label}: throughput {before['throughput_rps']} -> {result['throughput_rps']} req/s"
+            )
+        if result["errors"] > before["errors"]:
+            regressions.append(f"{label}: errors {before['errors']} -> {result['errors']}")
+    return regressions
+
+
+def prepare_environment(args: argparse.Namespace, directory: str) -> None:
+    """Settings for the in-process app; must run before `app` is imported."""
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+    os.environ["GITHUB_API_URL"] = "http://fake-github"
+    os.environ["SYNC_ENABLED"] = "false"
+    os.environ.setdefault("SQLITE_PERFORMANCE_PROFILE", "true")
+
+
+async def main(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        if args.url:
+            results = await run_remote(args)
+        else:
+            prepare_environment(args, directory)
+            results = await run_in_process(args)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mode": "remote" if args.url else "in-process",
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as output:
+            json.dump(report, output, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        # Without a baseline nothing was checked; only pass when that is intended
+        return 0 if args.allow_missing_baseline else 2
+    with open(args.baseline) as stored:
+        regressions = compare(results, json.load(stored), args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"\nREGRESSIONS against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--sizes", default="10k,100k,1M", help="Comma-separated event counts (in process)")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="Comma-separated endpoint names")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per endpoint and scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--database-url", help="In-process database (default: temporary SQLite file)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument(
+        "--allow-missing-baseline", action="store_true", help="Exit 0 instead of 2 when there is no baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Ignore p95 increases below this")
+    arguments = parser.parse_args()
+    arguments.sizes = [parse_size(size) for size in arguments.sizes.split(",")]
+    arguments.endpoints = [name.strip() for name in arguments.endpoints.split(",")]
+    unknown = set(arguments.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+    sys.exit(asyncio.run(main(arguments)))
@@ -0,0 +1,122 @@
+"""
+SQLite performance profile benchmark.
+
+Runs the same concurrent read/write workload against two fresh SQLite
+databases:
+
+- default:  rollback journal, default pragmas, one commit per write
+- profile:  WAL + tuned pragmas, writes batched by the single-writer queue
+
+Usage:
+    python -m benchmarks.sqlite_profile --writes 2000 --reads 4000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.shared.database import Base, create_async_db_engine
+from app.shared.db_writer import DatabaseWriter
+from app.shared.models import AnalysisCache
+
+
+async def run_workload(path: str, profile: bool, writes: int, reads: int, concurrency: int) -> dict:
+    engine = create_async_db_engine(f"sqlite:///{path}", performance_profile=profile)
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    writer = DatabaseWriter(sessions)
+    if profile:
+        await writer.start()
+
+    errors = 0
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+
+    async def write(i: int) -> None:
+        nonlocal errors
+
+        async def operation(db: AsyncSession) -> None:
+            db.add(AnalysisCache(
+                cache_key=f"bench:{i}",
+                module="benchmark",
+                username=f"user{i % 100}",
+                data={"score": i, "payload": "x" * 256},
+                expires_at=expires_at,
+            ))
+
+        try:
+            await writer.submit(operation)
+        except OperationalError:
+            errors += 1
+
+    async def read(i: int) -> None:
+        nonlocal errors
+        try:
+            async with sessions() as db:
+                await db.execute(
+                    select(AnalysisCache).where(AnalysisCache.cache_key == f"bench:{random.randrange(max(i, 1))}")
+                )
+        except OperationalError:
+            errors += 1
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(job) -> None:
+        async with semaphore:
+            await job
+
+    jobs = [write(i) for i in range(writes)] + [read(i) for i in range(reads)]
+    random.Random(0).shuffle(jobs)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bounded(job) for job in jobs))
+    elapsed = time.perf_counter() - started
+
+    await writer.stop()
+    await engine.dispose()
+    return {
+        "mode": "profile" if profile else "default",
+        "seconds": round(elapsed, 3),
+        "writes_per_second": round(writes / elapsed, 1),
+        "reads_per_second": round(reads / elapsed, 1),
+        "ops_per_second": round((writes + reads) / elapsed, 1),
+        "errors": errors,
+        "write_batches": writer.batches,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in (False, True):
+            path = os.path.join(directory, f"bench_{int(profile)}.db")
+            results.append(await run_workload(path, profile, args.writes, args.reads, args.concurrency))
+
+    for result in results:
+        print(
+            f"{result['mode']:>8}: {result['ops_per_second']:>9.1f} ops/s  "
+            f"writes {result['writes_per_second']:>8.1f}/s  reads {result['reads_per_second']:>8.1f}/s  "
+            f"errors {result['errors']}  ({result['seconds']}s)"
+        )
+    speedup = results[1]["ops_per_second"] / results[0]["ops_per_second"]
+    print(f" speedup: {speedup:.2f}x")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump({"results": results, "speedup": speedup}, output, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--output", help="Write JSON results to this file")
+    asyncio.run(main(parser.parse_args()))
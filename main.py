@@ -1,13 +1,52 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.shared.github_client import get_http_client, close_http_client
+from app.shared.cache import cache_service
+from app.shared.database import init_async_db, dispose_async_db, sqlite_performance_profile_enabled
+from app.shared.db_writer import db_writer
+from app.shared.github_sync import github_sync
+from app.shared.executor import process_executor
+from app.modules.sentiment_analysis.backends import sentiment_backends
+from app.modules.burnout_risk_detection.snapshots import history_snapshots
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_async_db()
+    if sqlite_performance_profile_enabled():
+        # SQLite has a single writer: batch all writes through one task
+        await db_writer.start()
+    # Open the pooled GitHub HTTP client once for the whole process
+    get_http_client()
+    if settings.EXECUTOR_ENABLED:
+        # Spawn and warm the CPU workers before serving requests
+        await process_executor.start()
+    if settings.SYNC_ENABLED:
+        await github_sync.start()
+    # Heavy sentiment models load in the background; the lexicon serves meanwhile
+    await sentiment_backends.start()
+    if settings.BURNOUT_HISTORY_SNAPSHOT_ENABLED:
+        await history_snapshots.start()
+    yield
+    await history_snapshots.stop()
+    await sentiment_backends.stop()
+    await github_sync.stop()
+    await close_http_client()
+    await cache_service.close()
+    await db_writer.stop()
+    await process_executor.stop()
+    await dispose_async_db()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Open Source Maintainer's Dashboard API",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -34,7 +73,12 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "cache": cache_service.stats(),
+        "executor": process_executor.stats(),
+        "sentiment": sentiment_backends.stats(),
+    }
 
 
 if __name__ == "__main__":